@@ -0,0 +1,138 @@
+from datetime import datetime
+
+from pydantic.fields import Field
+
+from app.schemas import BaseSchema
+
+
+class ReloadSettingsSchema(BaseSchema):
+    title: str
+    version: str
+    pid: int = Field(..., description="Process of the worker whose settings were reloaded")
+    restart_required: list[str] = Field(
+        ..., description="Changed settings that are applied only when workers restart"
+    )
+
+
+class HistogramSchema(BaseSchema):
+    buckets: dict[str, int] = Field(..., description="Cumulative counters by upper bound")
+    count: int
+    sum: float
+
+
+class HashingMetricsSchema(BaseSchema):
+    queue_depth: int = Field(..., description="Hashes waiting for a free pool slot")
+    in_flight: int = Field(..., description="Hashes running in the pool")
+    rejected: int = Field(..., description="Hashes rejected by queue timeout")
+    latency: HistogramSchema = Field(..., description="Hash latency in seconds")
+
+
+class CacheMetricsSchema(BaseSchema):
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+
+
+class RouteCacheMetricsSchema(BaseSchema):
+    memory: CacheMetricsSchema = Field(..., description="In-memory level")
+    db_hits: int = Field(..., description="Routes found in Postgres level")
+    db_misses: int = Field(..., description="Routes calculated by OSRM")
+    db_purged: int = Field(..., description="Stale routes deleted from Postgres level")
+    hit_rate: float = Field(..., description="Share of routes served by any level")
+
+
+class CachesMetricsSchema(BaseSchema):
+    principal: CacheMetricsSchema = Field(..., description="Authenticated users cache")
+    token: CacheMetricsSchema = Field(..., description="Verified JWT payloads cache")
+    route: RouteCacheMetricsSchema = Field(..., description="OSRM routes cache")
+
+
+class RoutingMetricsSchema(BaseSchema):
+    lookups: int = Field(..., description="Route lookups missed by the route cache")
+    coalesced: int = Field(..., description="Lookups joined an identical in-flight lookup")
+    osrm_calls: int
+    osrm_calls_saved: int
+    time_saved_seconds: float = Field(..., description="Estimated by the mean batch duration")
+    batch_size: HistogramSchema = Field(..., description="Distinct routes per batch")
+    latency: HistogramSchema = Field(..., description="Batch duration in seconds")
+
+
+class PositionsMetricsSchema(BaseSchema):
+    couriers: int = Field(..., description="Couriers with a known position")
+    dirty: int = Field(..., description="Positions waiting for the next flush")
+    shared: int = Field(..., description="Recent positions of all workers read after the flush")
+    pings: int
+    stale: int = Field(..., description="Pings older than the known position")
+    flushed: int = Field(..., description="Positions written to Postgres")
+    failures: int = Field(..., description="Failed flushes")
+    latency: HistogramSchema = Field(..., description="Flush duration in seconds")
+
+
+class FeedMetricsSchema(BaseSchema):
+    subscribers: int = Field(..., description="Clients of the order feed")
+    events: int = Field(..., description="Events received from Postgres")
+    dropped: int = Field(..., description="Clients disconnected for reading too slowly")
+    reconnects: int = Field(..., description="Reconnects of the LISTEN connection")
+    connected: bool
+
+
+class PoolMetricsSchema(BaseSchema):
+    size: int = Field(..., description="Connections kept by the pool (DB_POOL_SIZE)")
+    checked_out: int = Field(..., description="Connections in use")
+    idle: int = Field(..., description="Open connections waiting in the pool")
+    overflow: int = Field(..., description="Connections in use beyond the pool size")
+    max_overflow: int
+    timeouts: int = Field(..., description="Checkouts failed after DB_POOL_TIMEOUT_SECONDS")
+    wait: HistogramSchema = Field(..., description="Checkout duration in seconds")
+
+
+class StatementCacheMetricsSchema(BaseSchema):
+    compiled_hits: int = Field(..., description="Statements found in SQLAlchemy compiled cache")
+    compiled_misses: int
+    compiled_hit_rate: float
+    prepared_hits: int = Field(..., description="Statements already prepared on the connection")
+    prepared_misses: int
+    prepared_hit_rate: float
+
+
+class DatabaseMetricsSchema(PoolMetricsSchema):
+    replicas: list[PoolMetricsSchema] = Field(..., description="Pools of read replicas")
+    statement_cache: StatementCacheMetricsSchema = Field(
+        ..., description="Statement caches of all engines"
+    )
+
+
+class ProfilingSamplingSchema(BaseSchema):
+    sample_rate: float = Field(..., gt=0, le=1, description="Share of requests to profile")
+    duration_seconds: float = Field(..., gt=0, le=60 * 60, description="Sampling stops after")
+
+
+class ProfilingStateSchema(BaseSchema):
+    sample_rate: float = Field(..., description="0 if sampling is disabled")
+    until: datetime | None = Field(..., description="Sampling stops at")
+    profiled: int = Field(..., description="Requests profiled by this worker")
+    rate_limited: int = Field(..., description="Selected requests over PROFILING_MAX_PER_MINUTE")
+    invalid_tokens: int = Field(..., description="Requests with invalid or expired tokens")
+
+
+class ProfilingTokenRequestSchema(BaseSchema):
+    ttl_seconds: int = Field(300, gt=0, description="Up to PROFILING_MAX_TOKEN_TTL_SECONDS")
+
+
+class ProfilingTokenSchema(BaseSchema):
+    header: str = Field(..., description="Send the token in this header to profile a request")
+    token: str
+    expires_at: datetime
+
+
+class ProfileSchema(BaseSchema):
+    id: str
+    method: str
+    path: str
+    route: str = Field(..., description="Route template")
+    status: int
+    reason: str = Field(..., description="Profiled by `token` or `sampling`")
+    started_at: datetime
+    duration_seconds: float
+    samples: int
@@ -0,0 +1,251 @@
+import asyncio
+import os
+from logging import getLogger
+
+from fastapi import APIRouter, Depends, Path, Query
+from pydantic import ValidationError
+from starlette import status
+from starlette.responses import Response
+
+from app.api.admin.schemas import (
+    CachesMetricsSchema,
+    DatabaseMetricsSchema,
+    FeedMetricsSchema,
+    HashingMetricsSchema,
+    PositionsMetricsSchema,
+    ProfileSchema,
+    ProfilingSamplingSchema,
+    ProfilingStateSchema,
+    ProfilingTokenRequestSchema,
+    ProfilingTokenSchema,
+    ReloadSettingsSchema,
+    RoutingMetricsSchema,
+)
+from app.api.authentication.utils import get_admin_user
+from app.api.exceptions import APIValidationError, NotFoundError
+from app.config import Settings
+from app.db.database import DatabaseSessionManager
+from app.dependencies.caches import get_principal_cache, get_route_cache, get_token_cache
+from app.dependencies.db import get_database
+from app.dependencies.feed import get_order_feed
+from app.dependencies.hashing import get_password_hasher
+from app.dependencies.profiling import get_request_profiler
+from app.dependencies.routing import get_route_batcher
+from app.dependencies.settings import get_settings, reload_settings, restart_required
+from app.dependencies.tracking import get_position_flusher, get_position_store
+from app.domain.enums import ProfileFormat
+from app.monitoring.profiling import PROFILE_HEADER, PROFILE_ID_PATTERN, RequestProfiler
+from app.routing.batching import RouteBatcher
+
+logger = getLogger(__name__)
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(get_admin_user)])
+
+
+@router.post(
+    "/settings/reload",
+    response_model=ReloadSettingsSchema,
+    status_code=status.HTTP_200_OK,
+    summary="Reload settings of the worker that handles the request.",
+)
+async def reload_app_settings() -> dict:
+    """
+    Re-read settings from the environment and swap the snapshot of this worker only.
+
+    Other workers keep their settings, send SIGHUP to every worker to reload all of them.
+    Changed settings read only on startup (`STARTUP_SETTINGS`) are listed in
+    `restart_required`, they take effect after a restart.
+    """
+    previous = get_settings()
+    try:
+        settings = reload_settings()
+    except ValidationError:
+        logger.exception("Unable to reload settings.")
+        error = "Unable to reload settings, the previous settings are kept."
+        raise APIValidationError(error)
+    logger.info("Settings were reloaded via admin endpoint.")
+    not_applied = restart_required(previous, settings)
+    if not_applied:
+        logger.warning(f"Changed settings are applied after restart only: {not_applied}.")
+    return {
+        "title": settings.TITLE,
+        "version": settings.VERSION,
+        "pid": os.getpid(),
+        "restart_required": not_applied,
+    }
+
+
+@router.get(
+    "/metrics/hashing",
+    response_model=HashingMetricsSchema,
+    status_code=status.HTTP_200_OK,
+    summary="Password hashing pool metrics.",
+)
+async def hashing_metrics() -> dict:
+    """Queue depth and latency of the password hashing pool of this worker."""
+    return get_password_hasher().metrics()
+
+
+@router.get(
+    "/metrics/caches",
+    response_model=CachesMetricsSchema,
+    status_code=status.HTTP_200_OK,
+    summary="In-process cache metrics.",
+)
+async def caches_metrics() -> dict:
+    """Size and hit/miss counters of the in-process caches of this worker."""
+    return {
+        "principal": get_principal_cache().metrics(),
+        "token": get_token_cache().metrics(),
+        "route": get_route_cache().metrics(),
+    }
+
+
+@router.get(
+    "/metrics/routing",
+    response_model=RoutingMetricsSchema,
+    status_code=status.HTTP_200_OK,
+    summary="Route lookups coalescing metrics.",
+)
+async def routing_metrics(
+    route_batcher: RouteBatcher | None = Depends(get_route_batcher),
+) -> dict:
+    """Batch sizes and OSRM calls saved by coalescing route lookups of this worker."""
+    if route_batcher is None:
+        error = "OSRM is not configured or route lookups are not batched."
+        raise NotFoundError(error)
+    return route_batcher.metrics()
+
+
+@router.get(
+    "/metrics/positions",
+    response_model=PositionsMetricsSchema,
+    status_code=status.HTTP_200_OK,
+    summary="Courier positions ingestion metrics.",
+)
+async def positions_metrics() -> dict:
+    """Pings received by this worker and bulk writes of positions to Postgres."""
+    return get_position_store().metrics() | get_position_flusher().metrics()
+
+
+@router.get(
+    "/metrics/feed",
+    response_model=FeedMetricsSchema,
+    status_code=status.HTTP_200_OK,
+    summary="Order feed metrics.",
+)
+async def feed_metrics() -> dict:
+    """Subscribers and events of the order feed of this worker."""
+    return get_order_feed().metrics()
+
+
+@router.get(
+    "/metrics/database",
+    response_model=DatabaseMetricsSchema,
+    status_code=status.HTTP_200_OK,
+    summary="Database connection pool metrics.",
+)
+async def database_metrics(database: DatabaseSessionManager = Depends(get_database)) -> dict:
+    """Connections in use and checkout wait time of the connection pool of this worker."""
+    return database.pool_metrics()
+
+
+@router.get(
+    "/profiling",
+    response_model=ProfilingStateSchema,
+    status_code=status.HTTP_200_OK,
+    summary="Request profiling state.",
+)
+async def profiling_state(profiler: RequestProfiler = Depends(get_request_profiler)) -> dict:
+    """Sampling of requests and number of profiled requests of this worker."""
+    return profiler.sampling() | profiler.metrics()
+
+
+@router.put(
+    "/profiling/sampling",
+    response_model=ProfilingStateSchema,
+    status_code=status.HTTP_200_OK,
+    summary="Enable sampling of requests for profiling.",
+)
+async def enable_profiling_sampling(
+    body: ProfilingSamplingSchema,
+    profiler: RequestProfiler = Depends(get_request_profiler),
+) -> dict:
+    """
+    Profile a share of requests of this worker for a while.
+
+    Profiled requests are limited by PROFILING_MAX_PER_MINUTE. Sampling is per worker (like
+    metrics), to profile a request on any worker use a token instead.
+    """
+    profiler.enable_sampling(rate=body.sample_rate, duration=body.duration_seconds)
+    return profiler.sampling() | profiler.metrics()
+
+
+@router.delete(
+    "/profiling/sampling",
+    response_model=ProfilingStateSchema,
+    status_code=status.HTTP_200_OK,
+    summary="Disable sampling of requests for profiling.",
+)
+async def disable_profiling_sampling(
+    profiler: RequestProfiler = Depends(get_request_profiler),
+) -> dict:
+    profiler.disable_sampling()
+    return profiler.sampling() | profiler.metrics()
+
+
+@router.post(
+    "/profiling/tokens",
+    response_model=ProfilingTokenSchema,
+    status_code=status.HTTP_201_CREATED,
+    summary="Issue a token to profile requests.",
+)
+async def issue_profiling_token(
+    body: ProfilingTokenRequestSchema,
+    profiler: RequestProfiler = Depends(get_request_profiler),
+    settings: Settings = Depends(get_settings),
+) -> dict:
+    """Requests with the token in the header are profiled by any worker until it expires."""
+    if body.ttl_seconds > settings.PROFILING_MAX_TOKEN_TTL_SECONDS:
+        error = f"Token TTL must be up to {settings.PROFILING_MAX_TOKEN_TTL_SECONDS} seconds."
+        raise APIValidationError(error)
+    token, expires = profiler.issue_token(ttl=body.ttl_seconds)
+    return {"header": PROFILE_HEADER, "token": token, "expires_at": expires}
+
+
+@router.get(
+    "/profiles",
+    response_model=list[ProfileSchema],
+    status_code=status.HTTP_200_OK,
+    summary="List request profiles.",
+)
+async def list_profiles(profiler: RequestProfiler = Depends(get_request_profiler)) -> list[dict]:
+    """Profiles of all workers, the newest first."""
+    return await asyncio.to_thread(profiler.list_profiles)
+
+
+@router.get(
+    "/profiles/{profile_id}",
+    response_class=Response,
+    status_code=status.HTTP_200_OK,
+    summary="Download a request profile.",
+)
+async def get_profile(
+    profile_id: str = Path(..., pattern=PROFILE_ID_PATTERN),
+    output_format: ProfileFormat = Query(ProfileFormat.SPEEDSCOPE, alias="format"),
+    profiler: RequestProfiler = Depends(get_request_profiler),
+) -> Response:
+    """Profile as speedscope JSON (open at speedscope.app) or pstats file (snakeviz, pstats)."""
+    content = await asyncio.to_thread(profiler.render, profile_id, output_format)
+    if content is None:
+        error = "Profile was not found."
+        raise NotFoundError(error)
+    if output_format == ProfileFormat.PSTATS:
+        media_type, filename = "application/octet-stream", f"{profile_id}.pstats"
+    else:
+        media_type, filename = "application/json", f"{profile_id}.speedscope.json"
+    return Response(
+        content,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,100 @@
+import asyncio
+import multiprocessing
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from logging import getLogger
+from typing import TYPE_CHECKING, Any
+
+from passlib.context import CryptContext
+
+from app.api.exceptions import ServiceUnavailableError
+from app.metrics import Histogram
+
+if TYPE_CHECKING:
+    # Not imported at runtime: pool workers would create metric files of their own
+    import prometheus_client
+
+logger = getLogger(__name__)
+
+# NOTE: keep imports of this module light, it is imported by every pool worker process
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def get_password_hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+class PasswordHasher:
+    """Run bcrypt in a process pool, so hashing never blocks the event loop."""
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_concurrency: int,
+        queue_timeout: float,
+        exported_latency: "prometheus_client.Histogram | None" = None,
+    ) -> None:
+        self._max_workers = max_workers
+        self._queue_timeout = queue_timeout
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._executor: ProcessPoolExecutor | None = None
+
+        # Metrics
+        self.queue_depth = 0  # calls waiting for a free slot
+        self.in_flight = 0  # calls being hashed right now
+        self.rejected = 0  # calls rejected by queue timeout
+        self.latency = Histogram(exported=exported_latency)  # time spent in the pool (seconds)
+
+    async def hash(self, password: str) -> str:
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def metrics(self) -> dict:
+        return {
+            "queue_depth": self.queue_depth,
+            "in_flight": self.in_flight,
+            "rejected": self.rejected,
+            "latency": self.latency.snapshot(),
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # Workers are spawned lazily, so importing the app never forks processes
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:  # noqa: ANN401
+        self.queue_depth += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self._queue_timeout)
+        except TimeoutError:
+            self.rejected += 1
+            logger.warning("Password hashing queue is full, request was rejected.")
+            raise ServiceUnavailableError
+        finally:
+            self.queue_depth -= 1
+
+        self.in_flight += 1
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self.latency.observe(time.perf_counter() - started)
+            self.in_flight -= 1
+            self._semaphore.release()
@@ -0,0 +1,41 @@
+import time
+
+from sqlalchemy import Connection, event
+from sqlalchemy.orm import Mapper
+
+from app.dependencies.caches import get_principal_cache
+from app.domain import User, UserRoles
+
+# Fields needed to represent request user (password hash is never cached)
+PRINCIPAL_FIELDS = ("id", "email", "first_name", "last_name", "role")
+
+
+def user_to_principal(user: User) -> dict:
+    return {field: getattr(user, field) for field in PRINCIPAL_FIELDS}
+
+
+def principal_to_user(principal: dict) -> User:
+    """Build a transient User, it is not attached to any session."""
+    return User(**principal)
+
+
+def user_from_claims(payload: dict, freshness_seconds: int) -> User | None:
+    """Build request user from JWT claims if the token was issued recently enough."""
+    issued_at = payload.get("iat")
+    if not issued_at or not payload.get("role") or time.time() - issued_at > freshness_seconds:
+        return None
+    return User(
+        id=payload["user_id"],
+        email=payload.get("email"),
+        first_name=payload.get("first_name"),
+        last_name=payload.get("last_name"),
+        role=UserRoles(payload["role"]),
+    )
+
+
+@event.listens_for(User, "after_insert")
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_principal(_: Mapper, __: Connection, target: User) -> None:
+    """Drop a cached principal as soon as the user row is changed by this worker."""
+    get_principal_cache().pop(target.id)
@@ -1,67 +1,130 @@
+import hmac
+import time
 from datetime import UTC, datetime, timedelta
 from logging import getLogger
 
 import jwt
 from fastapi import Depends
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from passlib.context import CryptContext
 
-from app.api.exceptions import UnauthorizedError
+# Sync helpers are re-exported for scripts and tests
+from app.api.authentication.hashing import get_password_hash, verify_password  # noqa: F401
+from app.api.authentication.principal import (
+    principal_to_user,
+    user_from_claims,
+    user_to_principal,
+)
+from app.api.exceptions import ForbiddenError, UnauthorizedError
 from app.config import Settings
+from app.dependencies.caches import get_principal_cache, get_token_cache
 from app.dependencies.db import get_unit_of_work
 from app.dependencies.settings import get_settings
-from app.domain import User
+from app.domain import User, UserRoles
 from app.uow.unit_of_work import UnitOfWork
 
 auth_schema = HTTPBearer(auto_error=False)
 
 logger = getLogger(__name__)
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
-
-
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
-
 
 def generate_access_token(user: User, exp_minutes: int, secret_key: str, algorithm: str) -> str:
     """Generate JWT token for user."""
+    now = datetime.now(UTC)
     payload = {
         "user_id": user.id,
-        "exp": datetime.now(UTC) + timedelta(minutes=exp_minutes),
+        "iat": now,
+        "exp": now + timedelta(minutes=exp_minutes),
         "email": user.email,
         "first_name": user.first_name,
         "last_name": user.last_name,
+        "role": user.role.value,
     }
     return jwt.encode(payload=payload, key=secret_key, algorithm=algorithm)
 
 
-def get_token_payload(
+async def get_token_payload(
     token: HTTPAuthorizationCredentials = Depends(auth_schema),
     settings: Settings = Depends(get_settings),
 ) -> dict:
-    """Verify user's access_token."""
+    """
+    Verify user's access_token.
+
+    It is async to run on the event loop: the token cache is not thread safe and verification
+    of a token is cheap enough.
+    """
     if not token or not token.credentials:
         raise UnauthorizedError
+
+    # Keyed by the secret (not stored in the cache) and algorithm, so a settings reload
+    # invalidates old entries
+    digest = hmac.new(settings.SECRET_KEY.encode(), token.credentials.encode(), "sha256").digest()
+    cache_key = (digest, settings.ALGORITHM)
+    token_cache = get_token_cache()
+    payload = token_cache.get(cache_key)
+    if payload is not None:
+        return payload
+
     try:
-        return jwt.decode(token.credentials, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = jwt.decode(
+            token.credentials, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+        )
     except jwt.InvalidTokenError:
         return {}
+    # Tokens without expiration are never cached
+    if exp := payload.get("exp"):
+        token_cache.set(cache_key, payload, ttl=exp - time.time())
+    return payload
 
 
 async def get_request_user(
     payload: dict = Depends(get_token_payload),
+    settings: Settings = Depends(get_settings),
     uow: UnitOfWork = Depends(get_unit_of_work),
-):
+) -> User:
+    """Resolve request user from token claims, principal cache or database (in this order)."""
     user_id = payload.get("user_id")
     if not user_id:
         raise UnauthorizedError
 
+    if settings.AUTH_STATELESS:
+        user = user_from_claims(
+            payload, freshness_seconds=settings.AUTH_STATELESS_FRESHNESS_SECONDS
+        )
+        if user:
+            return user
+
+    # Not a dependency: sync dependencies are run in the threadpool, a singleton isn't worth it
+    principal_cache = get_principal_cache()
+    principal = principal_cache.get(user_id)
+    if principal:
+        return principal_to_user(principal)
+
     user = await uow.user.get_by_id(user_id=user_id)
+    # Don't hold the connection for the rest of the request, e.g. while the view calls OSRM
+    # or streams a response, the view takes a connection again if it needs the database
+    await uow.release()
     if not user:
         raise UnauthorizedError
+    principal_cache.set(user_id, user_to_principal(user))
     return user
+
+
+async def get_admin_user(request_user: User = Depends(get_request_user)) -> User:
+    """Allow access only for users with the ADMIN role."""
+    if request_user.role != UserRoles.ADMIN:
+        raise ForbiddenError(reason="user role")
+    return request_user
+
+
+async def get_courier_user(request_user: User = Depends(get_request_user)) -> User:
+    """Allow access only for users with the COURIER role."""
+    if request_user.role != UserRoles.COURIER:
+        raise ForbiddenError(reason="user role")
+    return request_user
+
+
+async def get_dispatcher_user(request_user: User = Depends(get_request_user)) -> User:
+    """Allow access only for users with the DISPATCHER or ADMIN role."""
+    if request_user.role not in (UserRoles.DISPATCHER, UserRoles.ADMIN):
+        raise ForbiddenError(reason="user role")
+    return request_user
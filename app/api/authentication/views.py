@@ -8,14 +8,11 @@ from app.api.authentication.schemas import (
     LoginSuccessSchema,
     ViewProfileSchema,
 )
-from app.api.authentication.utils import (
-    generate_access_token,
-    get_request_user,
-    verify_password,
-)
+from app.api.authentication.utils import generate_access_token, get_request_user
 from app.api.exceptions import APIValidationError
 from app.config import Settings
 from app.dependencies.db import get_unit_of_work
+from app.dependencies.hashing import get_password_hasher
 from app.dependencies.settings import get_settings
 from app.domain.users import User
 from app.uow.unit_of_work import UnitOfWork
@@ -43,7 +40,7 @@ async def login(
     db_user = await uow.user.get_by_email(email=body.email)
     if not db_user:
         raise login_exc
-    if db_user and verify_password(
+    if db_user and await get_password_hasher().verify(
         plain_password=body.password,
         hashed_password=db_user.hashed_password,
     ):
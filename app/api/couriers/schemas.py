@@ -0,0 +1,32 @@
+from datetime import datetime
+
+from pydantic.fields import Field
+
+from app.schemas import BaseSchema
+
+
+class PingSchema(BaseSchema):
+    lat: float = Field(..., description="Latitude coordinate", ge=-90, le=90)
+    lng: float = Field(..., description="Longitude coordinate", ge=-180, le=180)
+    recorded_at: datetime | None = Field(
+        None, description="Time of the GPS fix (UTC if no timezone), time of receiving if empty"
+    )
+
+
+class PingsSchema(BaseSchema):
+    pings: list[PingSchema] = Field(..., min_length=1, max_length=1_000)
+
+
+class PingsResultSchema(BaseSchema):
+    accepted: int = Field(..., description="Pings newer than the known position")
+
+
+class CourierPositionSchema(BaseSchema):
+    courier_id: int
+    lat: float
+    lng: float
+    recorded_at: datetime
+
+
+class CourierPositionsSchema(BaseSchema):
+    items: list[CourierPositionSchema]
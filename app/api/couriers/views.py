@@ -0,0 +1,84 @@
+import time
+from datetime import UTC, datetime
+
+from fastapi import APIRouter, Depends, Query
+from starlette import status
+
+from app.api.authentication.utils import get_courier_user, get_dispatcher_user
+from app.api.couriers.schemas import CourierPositionsSchema, PingsResultSchema, PingsSchema
+from app.config import Settings
+from app.dependencies.settings import get_settings
+from app.dependencies.tracking import get_position_store
+from app.domain import User
+from app.tracking.positions import Ping
+
+router = APIRouter(prefix="/couriers", tags=["couriers"])
+
+
+@router.post(
+    "/me/positions",
+    response_model=PingsResultSchema,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Report GPS pings of the current courier.",
+)
+async def report_positions(
+    body: PingsSchema,
+    courier: User = Depends(get_courier_user),
+) -> dict:
+    """
+    Accept a batch of pings, only the latest position is kept.
+
+    Positions are written to the database in bulk in the background, so they are available
+    to other workers with a delay of up to `COURIER_POSITIONS_FLUSH_SECONDS`.
+    """
+    now = time.time()
+    pings = []
+    for ping in body.pings:
+        recorded_at = now
+        if ping.recorded_at is not None:
+            timestamp = ping.recorded_at
+            if timestamp.tzinfo is None:
+                timestamp = timestamp.replace(tzinfo=UTC)
+            # A clock running ahead must not block the next pings
+            recorded_at = min(timestamp.timestamp(), now)
+        pings.append(Ping(courier.id, ping.lat, ping.lng, recorded_at))
+    # Not a dependency: sync dependencies are run in the threadpool, a singleton isn't worth it
+    store = get_position_store()
+    return {"accepted": store.update(sorted(pings, key=lambda ping: ping.recorded_at))}
+
+
+@router.get(
+    "/positions",
+    response_model=CourierPositionsSchema,
+    status_code=status.HTTP_200_OK,
+    summary="Get current positions of couriers.",
+    dependencies=[Depends(get_dispatcher_user)],
+)
+async def get_positions(
+    settings: Settings = Depends(get_settings),
+    max_age_seconds: float | None = Query(
+        None, gt=0, description="At most and by default COURIER_POSITIONS_MAX_AGE_SECONDS"
+    ),
+) -> dict:
+    """
+    Positions of all couriers, the database is not queried.
+
+    Couriers' pings are received by different workers. Every worker reads positions flushed
+    by all of them every `COURIER_POSITIONS_FLUSH_SECONDS`, so positions received by other
+    workers are up to two flush intervals old.
+    """
+    max_age = min(
+        max_age_seconds or settings.COURIER_POSITIONS_MAX_AGE_SECONDS,
+        settings.COURIER_POSITIONS_MAX_AGE_SECONDS,
+    )
+    return {
+        "items": [
+            {
+                "courier_id": ping.courier_id,
+                "lat": ping.lat,
+                "lng": ping.lng,
+                "recorded_at": datetime.fromtimestamp(ping.recorded_at, UTC),
+            }
+            for ping in get_position_store().all_positions(max_age=max_age)
+        ]
+    }
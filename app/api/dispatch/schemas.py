@@ -0,0 +1,43 @@
+from enum import StrEnum
+
+from pydantic.fields import Field
+
+from app.api.orders.schemas import LatLngPoint
+from app.dispatch.assignment import Solver
+from app.schemas import BaseSchema
+
+
+class CostMetric(StrEnum):
+    DISTANCE = "distance"  # straight line distance to the pickup, no routing server needed
+    DURATION = "duration"  # road duration to the pickup, calculated by OSRM
+
+
+class CourierPositionSchema(BaseSchema):
+    id: int = Field(..., description="Courier (user) ID")
+    position: LatLngPoint | None = Field(
+        None, description="Current courier position, the latest reported one if empty"
+    )
+
+
+class AssignOrdersSchema(BaseSchema):
+    couriers: list[CourierPositionSchema] = Field(..., description="Available couriers")
+    solver: Solver = Field(Solver.OPTIMAL, description="Assignment algorithm")
+    cost: CostMetric = Field(CostMetric.DISTANCE, description="What is minimized in total")
+    apply: bool = Field(default=False, description="Save the assignments, not just propose them")
+
+
+class AssignmentSchema(BaseSchema):
+    courier_id: int
+    order_id: int
+    distance_km: float = Field(..., description="Straight line distance to the pickup")
+    duration_minutes: float | None = Field(
+        None, description="Road duration to the pickup, set for `duration` cost"
+    )
+
+
+class AssignmentsSchema(BaseSchema):
+    assignments: list[AssignmentSchema]
+    unassigned_courier_ids: list[int]
+    unassigned_order_ids: list[int] = Field(..., description="Open orders left without a courier")
+    total_cost: float = Field(..., description="Sum of kilometers or minutes by `cost`")
+    applied: bool = Field(..., description="Assignments were saved")
@@ -0,0 +1,147 @@
+import asyncio
+import time
+from datetime import UTC, datetime
+from logging import getLogger
+
+import numpy as np
+from fastapi import APIRouter, Depends
+from starlette import status
+
+from app.api.authentication.utils import get_dispatcher_user
+from app.api.dispatch.schemas import AssignmentsSchema, AssignOrdersSchema, CostMetric
+from app.api.exceptions import APIValidationError, ServiceUnavailableError
+from app.config import Settings
+from app.dependencies.db import get_unit_of_work
+from app.dependencies.routing import get_osrm_client
+from app.dependencies.settings import get_settings
+from app.dependencies.tracking import get_position_store
+from app.dispatch.assignment import assign, haversine_matrix
+from app.routing.osrm import OsrmClient
+from app.routing.types import Point, RoutingError
+from app.tracking.positions import PositionStore
+from app.uow.unit_of_work import UnitOfWork
+
+logger = getLogger(__name__)
+
+router = APIRouter(
+    prefix="/dispatch", tags=["dispatch"], dependencies=[Depends(get_dispatcher_user)]
+)
+
+
+@router.post(
+    "/assignments",
+    response_model=AssignmentsSchema,
+    status_code=status.HTTP_200_OK,
+    summary="Assign open orders to couriers.",
+)
+async def assign_orders(
+    body: AssignOrdersSchema,
+    settings: Settings = Depends(get_settings),
+    uow: UnitOfWork = Depends(get_unit_of_work),
+    osrm_client: OsrmClient | None = Depends(get_osrm_client),
+) -> dict:
+    """
+    Match available couriers with the oldest open orders, one order per courier.
+
+    Couriers without `position` are placed at the latest position they reported.
+
+    The total cost (distance or road duration from couriers to pickups) is minimized by
+    `optimal` solver, `greedy` is faster on large inputs and is a few percent worse. Couriers
+    are assigned only if `apply` is set, orders taken by someone else meanwhile are skipped.
+    """
+    courier_ids = [courier.id for courier in body.couriers]
+    if len(courier_ids) > settings.DISPATCH_MAX_SIZE:
+        error = f"Too many couriers, at most {settings.DISPATCH_MAX_SIZE} are allowed."
+        raise APIValidationError(error)
+    if len(set(courier_ids)) != len(courier_ids):
+        error = "Couriers must be unique."
+        raise APIValidationError(error)
+    couriers = await uow.user.get_couriers(courier_ids)
+    if unknown := set(courier_ids) - {courier.id for courier in couriers}:
+        error = f"Users are not couriers: {sorted(unknown)}."
+        raise APIValidationError(error)
+    positions = await get_positions(
+        body, get_position_store(), uow=uow, max_age=settings.COURIER_POSITIONS_MAX_AGE_SECONDS
+    )
+
+    orders = await uow.order.get_open_pickups(limit=settings.DISPATCH_MAX_SIZE)
+    # Nothing is locked, so the connection is not held while OSRM and the solver are busy
+    await uow.release()
+    pickups = [Point(lat=order.lat, lng=order.lng) for order in orders]
+    distances = haversine_matrix(
+        np.array(positions, dtype=float).reshape(-1, 2),
+        np.array(pickups, dtype=float).reshape(-1, 2),
+    )
+    durations = None
+    if body.cost == CostMetric.DURATION:
+        if osrm_client is None:
+            error = "Road durations are not available, routing server is not configured."
+            raise APIValidationError(error)
+        if positions and pickups:
+            durations = await get_durations(osrm_client, positions, pickups)
+    cost = durations if durations is not None else distances
+    # Solving 1k x 1k takes ~0.1 s, keep the event loop responsive meanwhile
+    assignments = await asyncio.to_thread(assign, cost, body.solver)
+
+    pairs = {orders[item.order].id: courier_ids[item.courier] for item in assignments}
+    if body.apply:
+        assigned = await uow.order.assign_couriers(pairs)
+        await uow.commit()
+        assignments = [item for item in assignments if orders[item.order].id in assigned]
+
+    assigned_couriers = {courier_ids[item.courier] for item in assignments}
+    assigned_orders = {orders[item.order].id for item in assignments}
+    return {
+        "assignments": [
+            {
+                "courier_id": courier_ids[item.courier],
+                "order_id": orders[item.order].id,
+                "distance_km": distances[item.courier, item.order],
+                "duration_minutes": item.cost if durations is not None else None,
+            }
+            for item in assignments
+        ],
+        "unassigned_courier_ids": [id_ for id_ in courier_ids if id_ not in assigned_couriers],
+        "unassigned_order_ids": [order.id for order in orders if order.id not in assigned_orders],
+        "total_cost": sum(item.cost for item in assignments),
+        "applied": body.apply,
+    }
+
+
+async def get_positions(
+    body: AssignOrdersSchema, store: PositionStore, uow: UnitOfWork, max_age: float
+) -> list[Point]:
+    """
+    Positions of couriers from the request or the latest reported ones.
+
+    Reported positions are looked up in memory of this worker first, then in Postgres, where
+    positions received by other workers are flushed.
+    """
+    recorded_after = time.time() - max_age
+    positions: dict[int, Point] = {}
+    for courier in body.couriers:
+        if courier.position is not None:
+            positions[courier.id] = courier.position.to_point()
+        elif (ping := store.get(courier.id)) and ping.recorded_at > recorded_after:
+            positions[courier.id] = Point(lat=ping.lat, lng=ping.lng)
+    if missing := [courier.id for courier in body.couriers if courier.id not in positions]:
+        positions |= await uow.courier_position.get_latest(
+            missing, recorded_after=datetime.fromtimestamp(recorded_after, UTC).replace(tzinfo=None)
+        )
+    if unknown := [courier.id for courier in body.couriers if courier.id not in positions]:
+        error = f"Current positions of couriers are unknown: {unknown}."
+        raise APIValidationError(error)
+    return [positions[courier.id] for courier in body.couriers]
+
+
+async def get_durations(
+    osrm_client: OsrmClient, positions: list[Point], pickups: list[Point]
+) -> np.ndarray:
+    """Road durations (minutes) from every courier to every pickup, NaN if unreachable."""
+    try:
+        matrix = await osrm_client.table(positions, pickups)
+    except RoutingError as exc:
+        logger.warning(f"Unable to calculate durations to pickups: {exc}")
+        error = "Routing server is unavailable, try `distance` cost."
+        raise ServiceUnavailableError(error)
+    return matrix.duration_minutes
@@ -35,3 +35,12 @@ class ConflictError(FastAPIHttpError):
 
 class NotFoundError(FastAPIHttpError):
     status_code = status.HTTP_404_NOT_FOUND
+
+
+class PayloadTooLargeError(FastAPIHttpError):
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+
+class ServiceUnavailableError(FastAPIHttpError):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    detail = "Service is overloaded. Please, try again later."
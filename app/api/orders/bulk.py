@@ -0,0 +1,150 @@
+import json
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from logging import getLogger
+from typing import Any
+
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from starlette.requests import Request
+
+from app.api.exceptions import APIValidationError, PayloadTooLargeError
+from app.api.orders.schemas import AddOrderSchema
+from app.uow.unit_of_work import UnitOfWork
+
+logger = getLogger(__name__)
+
+NDJSON_MEDIA_TYPES = {"application/x-ndjson", "application/jsonl"}
+
+
+class RowError(Exception):
+    """Row can't be parsed as JSON, it is reported like a validation error."""
+
+
+async def read_body(request: Request, max_bytes: int) -> AsyncIterator[bytes]:
+    """Stream the request body, PayloadTooLargeError once it exceeds `max_bytes`."""
+    error = f"Request body must be up to {max_bytes} bytes."
+    # Checked before reading anything, chunked uploads are checked as they arrive
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > max_bytes:
+        raise PayloadTooLargeError(error)
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > max_bytes:
+            raise PayloadTooLargeError(error)
+        yield chunk
+
+
+async def iter_ndjson(stream: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+    """Yield one JSON document per line as the body arrives, bad lines are yielded as RowError."""
+    buffer = b""
+    async for chunk in stream:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield parse_line(line)
+    if buffer.strip():
+        yield parse_line(buffer)
+
+
+def parse_line(line: bytes) -> Any:  # noqa: ANN401
+    try:
+        return json.loads(line)
+    except ValueError:
+        return RowError("Invalid JSON.")
+
+
+async def iter_json_array(stream: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+    """Yield items of a JSON array body."""
+    body = b"".join([chunk async for chunk in stream])
+    try:
+        rows = json.loads(body)
+    except ValueError:
+        error = "Request body is not a valid JSON."
+        raise APIValidationError(error)
+    if not isinstance(rows, list):
+        error = "Request body must be a JSON array or NDJSON."
+        raise APIValidationError(error)
+    for row in rows:
+        yield row
+
+
+async def iter_chunks(rows: AsyncIterator[Any], size: int) -> AsyncIterator[list[Any]]:
+    chunk: list[Any] = []
+    async for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def validate_chunk(rows: Iterable[tuple[int, Any]]) -> tuple[dict[int, dict], list[dict]]:
+    """Split (index, raw row) pairs into values for INSERT by index and errors."""
+    values: dict[int, dict] = {}
+    errors: list[dict] = []
+    for index, row in rows:
+        if isinstance(row, RowError):
+            errors.append({"index": index, "errors": [{"type": "json_invalid", "msg": str(row)}]})
+            continue
+        try:
+            order = AddOrderSchema.model_validate(row)
+        except ValidationError as exc:
+            details = exc.errors(include_url=False, include_context=False, include_input=False)
+            errors.append({"index": index, "errors": details})
+            continue
+        values[index] = {
+            "name": order.name,
+            "description": order.description,
+            "start_point": order.start_point.to_wkt(),
+            "end_point": order.end_point.to_wkt(),
+            "distance_km": order.distance_km,
+            "duration_minutes": order.duration_minutes,
+        }
+    return values, errors
+
+
+async def import_orders(
+    rows: AsyncIterator[Any],
+    uow: UnitOfWork,
+    chunk_size: int,
+    max_rows: int,
+    max_errors: int,
+) -> dict:
+    """
+    Validate and insert orders chunk by chunk, every chunk is committed separately.
+
+    Invalid rows are skipped and reported by their index in the upload (the first `max_errors`
+    of them). If a chunk can't be written, all its valid rows are reported as failed and the
+    next chunks are still imported. An upload of more than `max_rows` rows is stopped with
+    PayloadTooLargeError, chunks committed before stay imported.
+    """
+    received = created = failed = 0
+    errors: list[dict] = []
+    async for chunk in iter_chunks(rows, chunk_size):
+        if received + len(chunk) > max_rows:
+            error = (
+                f"Upload must have up to {max_rows} rows, {created} orders of the first "
+                f"{received} rows were created."
+            )
+            raise PayloadTooLargeError(error)
+        values, chunk_errors = validate_chunk(enumerate(chunk, start=received))
+        if values:
+            try:
+                await uow.order.bulk_create(list(values.values()))
+                await uow.commit()
+            except SQLAlchemyError:
+                logger.exception(f"Unable to import orders #{received}-{received + len(chunk)}.")
+                await uow.rollback()
+                database_error = {"type": "database_error", "msg": "Unable to save the order."}
+                chunk_errors += [{"index": index, "errors": [database_error]} for index in values]
+            else:
+                created += len(values)
+        failed += len(chunk_errors)
+        if len(errors) < max_errors:
+            chunk_errors.sort(key=lambda error: error["index"])
+            errors += chunk_errors[: max_errors - len(errors)]
+        received += len(chunk)
+    return {"received": received, "created": created, "failed": failed, "errors": errors}
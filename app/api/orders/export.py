@@ -0,0 +1,94 @@
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from enum import StrEnum
+from typing import IO
+
+import pyarrow as pa  # type: ignore[import-untyped]
+from sqlalchemy import Row
+
+from app.uow.order.repository import EXPORT_FIELDS
+
+Batches = AsyncIterator[Sequence[Row]]
+
+
+class ExportFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+    ARROW = "arrow"
+
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.ARROW: "application/vnd.apache.arrow.stream",
+}
+
+ARROW_SCHEMA = pa.schema(
+    [
+        ("id", pa.int64()),
+        ("name", pa.string()),
+        ("description", pa.string()),
+        ("start_lat", pa.float64()),
+        ("start_lng", pa.float64()),
+        ("end_lat", pa.float64()),
+        ("end_lng", pa.float64()),
+        ("distance_km", pa.float64()),
+        ("duration_minutes", pa.float64()),
+        ("created_at", pa.timestamp("us")),
+    ]
+)
+
+
+def json_default(value: datetime) -> str:
+    return value.isoformat()
+
+
+async def encode_ndjson(batches: Batches) -> AsyncIterator[bytes]:
+    async for rows in batches:
+        lines = (json.dumps(row._asdict(), default=json_default) for row in rows)
+        yield "".join(f"{line}\n" for line in lines).encode()
+
+
+async def encode_csv(batches: Batches) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_FIELDS)
+    async for rows in batches:
+        writer.writerows(rows)
+        yield drain(buffer).encode()
+    yield drain(buffer).encode()
+
+
+async def encode_arrow(batches: Batches) -> AsyncIterator[bytes]:
+    """Arrow IPC stream, one record batch per batch of rows."""
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, ARROW_SCHEMA) as writer:
+        async for rows in batches:
+            columns = zip(*rows, strict=True)
+            arrays = [
+                pa.array(column, type=field.type)
+                for column, field in zip(columns, ARROW_SCHEMA, strict=True)
+            ]
+            writer.write_batch(pa.record_batch(arrays, schema=ARROW_SCHEMA))
+            yield drain(sink)
+    # End of stream marker
+    yield drain(sink)
+
+
+def drain[T: (str, bytes)](buffer: IO[T]) -> T:
+    """Take everything written to the buffer so far and empty it."""
+    buffer.seek(0)
+    value = buffer.read()
+    buffer.seek(0)
+    buffer.truncate()
+    return value
+
+
+ENCODERS = {
+    ExportFormat.NDJSON: encode_ndjson,
+    ExportFormat.CSV: encode_csv,
+    ExportFormat.ARROW: encode_arrow,
+}
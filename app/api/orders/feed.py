@@ -0,0 +1,32 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator
+
+from app.feed.hub import OrderFeedHub
+
+# Delay (ms) before EventSource reconnects after the stream is closed
+RECONNECT_DELAY_MS = 3_000
+
+
+def format_event(event: dict) -> str:
+    return f"event: {event['type']}\ndata: {json.dumps(event.get('order'))}\n\n"
+
+
+async def stream_events(hub: OrderFeedHub, heartbeat: float) -> AsyncIterator[str]:
+    """
+    Server-sent events of orders until the client disconnects or falls behind.
+
+    A comment is sent if there were no events for `heartbeat` seconds, so proxies keep the
+    connection open. A dropped client gets the `dropped` event and reconnects by itself.
+    """
+    async with hub.subscribe() as subscription:
+        yield f"retry: {RECONNECT_DELAY_MS}\n\n"
+        while not subscription.dropped.is_set():
+            try:
+                async with asyncio.timeout(heartbeat):
+                    event = await subscription.get()
+            except TimeoutError:
+                yield ": heartbeat\n\n"
+            else:
+                yield format_event(event)
+        yield format_event({"type": "dropped"})
@@ -0,0 +1,53 @@
+from datetime import datetime
+
+from fastapi import Query
+
+from app.api.exceptions import APIValidationError
+from app.routing.types import Point
+from app.uow.order.filters import OrderFilters
+
+
+def get_order_filters(  # noqa: PLR0913
+    min_distance_km: float | None = Query(None, ge=0),
+    max_distance_km: float | None = Query(None, ge=0),
+    min_duration_minutes: float | None = Query(None, ge=0),
+    max_duration_minutes: float | None = Query(None, ge=0),
+    created_from: datetime | None = Query(None, description="Created at or after"),
+    created_to: datetime | None = Query(None, description="Created before"),
+) -> OrderFilters:
+    """Query parameters filtering order listings."""
+    for minimum, maximum in (
+        (min_distance_km, max_distance_km),
+        (min_duration_minutes, max_duration_minutes),
+    ):
+        if minimum is not None and maximum is not None and minimum > maximum:
+            error = "Lower bound of a filter must not exceed its upper bound."
+            raise APIValidationError(error)
+    return OrderFilters(
+        min_distance_km=min_distance_km,
+        max_distance_km=max_distance_km,
+        min_duration_minutes=min_duration_minutes,
+        max_duration_minutes=max_duration_minutes,
+        created_from=created_from,
+        created_to=created_to,
+    )
+
+
+def get_center(
+    lat: float = Query(..., ge=-90, le=90, description="Latitude of the center"),
+    lng: float = Query(..., ge=-180, le=180, description="Longitude of the center"),
+) -> Point:
+    return Point(lat=lat, lng=lng)
+
+
+def get_bounding_box(
+    min_lat: float = Query(..., ge=-90, le=90),
+    min_lng: float = Query(..., ge=-180, le=180),
+    max_lat: float = Query(..., ge=-90, le=90),
+    max_lng: float = Query(..., ge=-180, le=180),
+) -> tuple[Point, Point]:
+    """South-west and north-east corners of the box."""
+    if min_lat > max_lat or min_lng > max_lng:
+        error = "Minimal coordinates of the box must not exceed maximal ones."
+        raise APIValidationError(error)
+    return Point(lat=min_lat, lng=min_lng), Point(lat=max_lat, lng=max_lng)
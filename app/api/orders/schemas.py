@@ -1,6 +1,11 @@
+from typing import TypedDict
+
 from geoalchemy2 import WKTElement
+from pydantic import TypeAdapter
 from pydantic.fields import Field
 
+from app.domain.enums import CountMode
+from app.routing.types import Point
 from app.schemas import BasePaginationSchema, BaseSchema
 
 
@@ -13,6 +18,9 @@ class LatLngPoint(BaseSchema):
     def to_wkt(self) -> WKTElement:
         return WKTElement(f"POINT({self.lng} {self.lat})", srid=4326)
 
+    def to_point(self) -> Point:
+        return Point(lat=self.lat, lng=self.lng)
+
 
 class ViewOrderSchema(BaseSchema):
     """Schema for view order."""
@@ -22,6 +30,7 @@ class ViewOrderSchema(BaseSchema):
     description: str | None
     distance_km: float | None
     duration_minutes: float | None
+    courier_id: int | None
 
 
 class AddOrderSchema(BaseSchema):
@@ -31,11 +40,58 @@ class AddOrderSchema(BaseSchema):
     description: str | None = Field(None, description="Order description")
     start_point: LatLngPoint = Field(..., description="Start point coordinates")
     end_point: LatLngPoint = Field(..., description="End point coordinates")
-    distance_km: float | None = Field(None, description="Order distance in kilometers")
-    duration_minutes: float | None = Field(None, description="Order duration in minutes")
+    distance_km: float | None = Field(
+        None, description="Order distance in kilometers, calculated by OSRM if it is available"
+    )
+    duration_minutes: float | None = Field(
+        None, description="Order duration in minutes, calculated by OSRM if it is available"
+    )
 
 
 class OrdersSchema(BasePaginationSchema):
     """Base schema for order paginated responses."""
 
     items: list[ViewOrderSchema] = Field(..., description="List of orders in the current page")
+
+
+class OrderItem(TypedDict):
+    """`ViewOrderSchema` for the fast serialization path."""
+
+    id: int
+    name: str | None
+    description: str | None
+    distance_km: float | None
+    duration_minutes: float | None
+    courier_id: int | None
+
+
+class OrdersPage(TypedDict):
+    """`OrdersSchema` for the fast serialization path."""
+
+    total: int | None
+    count: CountMode
+    items: list[OrderItem]
+    page: int | None
+    page_size: int
+    next_cursor: str | None
+
+
+orders_page_adapter = TypeAdapter(OrdersPage)
+
+
+class BulkOrderErrorSchema(BaseSchema):
+    """Errors of one row of a bulk upload."""
+
+    index: int = Field(..., description="Zero-based index of the row in the upload")
+    errors: list[dict] = Field(..., description="Validation errors, like in 422 responses")
+
+
+class BulkOrdersResultSchema(BaseSchema):
+    """Result of a bulk upload."""
+
+    received: int = Field(..., description="Number of rows in the upload")
+    created: int = Field(..., description="Number of created orders")
+    failed: int = Field(..., description="Number of rows that were not imported")
+    errors: list[BulkOrderErrorSchema] = Field(
+        ..., description="Errors of failed rows, up to ORDERS_BULK_MAX_ERRORS first ones"
+    )
@@ -1,17 +1,50 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
 from logging import getLogger
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from starlette import status
 
-from app.api.orders.schemas import AddOrderSchema, OrdersSchema, ViewOrderSchema
+from app.api.authentication.utils import get_dispatcher_user
+from app.api.exceptions import APIValidationError
+from app.api.orders.bulk import (
+    NDJSON_MEDIA_TYPES,
+    import_orders,
+    iter_json_array,
+    iter_ndjson,
+    read_body,
+)
+from app.api.orders.export import ENCODERS, MEDIA_TYPES, ExportFormat
+from app.api.orders.feed import stream_events
+from app.api.orders.filters import get_bounding_box, get_center, get_order_filters
+from app.api.orders.schemas import (
+    AddOrderSchema,
+    BulkOrdersResultSchema,
+    OrdersSchema,
+    ViewOrderSchema,
+    orders_page_adapter,
+)
+from app.api.pagination import decode_cursor, encode_cursor
+from app.api.serialization import json_response
+from app.config import Settings
 from app.dependencies.db import get_unit_of_work
-from app.domain import Order
+from app.dependencies.feed import get_order_feed
+from app.dependencies.routing import get_route_provider
+from app.dependencies.settings import get_settings
+from app.domain import CountMode, Order
+from app.feed.hub import OrderFeedHub
+from app.routing.types import Point, RouteProvider, RoutingError
+from app.uow.order.filters import OrderFilters
 from app.uow.unit_of_work import UnitOfWork
 
 logger = getLogger(__name__)
 
 router = APIRouter(prefix="/orders", tags=["orders"])
 
+# Bulk body is read as a stream, so it is described in OpenAPI by hand
+ADD_ORDER_SCHEMA_REF = {"$ref": "#/components/schemas/AddOrderSchema"}
+
 
 @router.post(
     "",
@@ -22,8 +55,20 @@ router = APIRouter(prefix="/orders", tags=["orders"])
 async def create_order(
     body: AddOrderSchema,
     uow: UnitOfWork = Depends(get_unit_of_work),
+    route_provider: RouteProvider | None = Depends(get_route_provider),
 ) -> Order:
     """Create a new order."""
+    distance_km, duration_minutes = body.distance_km, body.duration_minutes
+    if route_provider:
+        try:
+            route = await route_provider.route(
+                body.start_point.to_point(), body.end_point.to_point()
+            )
+        except RoutingError as exc:
+            logger.warning(f"Unable to calculate route, values from request are used: {exc}")
+        else:
+            distance_km, duration_minutes = route
+
     # Create order data
     order_data = {
         "name": body.name,
@@ -32,8 +77,8 @@ async def create_order(
         "start_point": body.start_point.to_wkt(),
         # Convert lat/lng points to WKT format for PostGIS
         "end_point": body.end_point.to_wkt(),
-        "distance_km": body.distance_km,
-        "duration_minutes": body.duration_minutes,
+        "distance_km": distance_km,
+        "duration_minutes": duration_minutes,
     }
 
     db_order = await uow.order.create(**order_data, flush=True)
@@ -43,17 +88,223 @@ async def create_order(
     return db_order
 
 
+@router.post(
+    "/bulk",
+    response_model=BulkOrdersResultSchema,
+    status_code=status.HTTP_200_OK,
+    summary="Create many orders at once.",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": {"type": "array", "items": ADD_ORDER_SCHEMA_REF}},
+                "application/x-ndjson": {"schema": ADD_ORDER_SCHEMA_REF},
+            },
+        }
+    },
+)
+async def create_orders_bulk(
+    request: Request,
+    uow: UnitOfWork = Depends(get_unit_of_work),
+    settings: Settings = Depends(get_settings),
+) -> dict:
+    """
+    Create orders from a JSON array or NDJSON (one order per line) body.
+
+    NDJSON is processed while it is being uploaded. Rows are validated like `POST /orders` and
+    stored by chunks, each chunk in its own transaction. Invalid rows don't stop the upload,
+    they are reported in `errors` (up to ORDERS_BULK_MAX_ERRORS). Routes are not calculated,
+    distance and duration are stored as sent. Uploads over ORDERS_BULK_MAX_BYTES or
+    ORDERS_BULK_MAX_ROWS are rejected with 413.
+    """
+    media_type = request.headers.get("content-type", "").split(";")[0].strip()
+    body = read_body(request, max_bytes=settings.ORDERS_BULK_MAX_BYTES)
+    parse = iter_ndjson if media_type in NDJSON_MEDIA_TYPES else iter_json_array
+    return await import_orders(
+        parse(body),
+        uow=uow,
+        chunk_size=settings.ORDERS_BULK_CHUNK_SIZE,
+        max_rows=settings.ORDERS_BULK_MAX_ROWS,
+        max_errors=settings.ORDERS_BULK_MAX_ERRORS,
+    )
+
+
 @router.get(
     "",
     response_model=OrdersSchema,
     summary="Get all orders.",
     status_code=status.HTTP_200_OK,
 )
-async def get_all_orders(
+async def get_all_orders(  # noqa: PLR0913
     uow: UnitOfWork = Depends(get_unit_of_work),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=2, le=100),
+    after: str | None = Query(None, description="`next_cursor` of the previous page"),
+    count: CountMode = Query(CountMode.EXACT, description="How to calculate `total`"),
+    filters: OrderFilters = Depends(get_order_filters),
+) -> Response:
+    """
+    Get all orders matching the filters.
+
+    Filters are combined with AND and work with both page and cursor (`after`) pagination.
+    """
+    orders, total = await uow.order.get_paginated_dicts(
+        page=page,
+        page_size=page_size,
+        after=parse_order_cursor(after) if after else None,
+        count=count,
+        filters=filters,
+    )
+    next_cursor = None
+    if len(orders) == page_size:
+        last = orders[-1]
+        next_cursor = encode_cursor(last["created_at"].isoformat(), last["id"])
+    page_content = {
+        "items": orders,
+        "total": total,
+        "count": count,
+        "page": None if after else page,
+        "page_size": page_size,
+        "next_cursor": next_cursor,
+    }
+    return json_response(orders_page_adapter, page_content)
+
+
+@router.get(
+    "/search/radius",
+    response_model=OrdersSchema,
+    summary="Search orders by pickup distance.",
+    status_code=status.HTTP_200_OK,
+)
+async def search_orders_within_radius(  # noqa: PLR0913
+    uow: UnitOfWork = Depends(get_unit_of_work),
+    center: Point = Depends(get_center),
+    radius_km: float = Query(..., gt=0, le=1000, description="Max pickup distance from center"),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=2, le=100),
+    count: CountMode = Query(CountMode.EXACT, description="How to calculate `total`"),
 ) -> dict:
-    """Get all orders."""
-    orders, total = await uow.order.get_paginated_all(page=page, page_size=page_size)
-    return {"items": orders, "total": total, "page": page, "page_size": page_size}
+    """Get orders whose pickup point is within the radius of the center."""
+    orders, total = await uow.order.get_paginated_within_radius(
+        center, radius_km=radius_km, page=page, page_size=page_size, count=count
+    )
+    return {"items": orders, "total": total, "count": count, "page": page, "page_size": page_size}
+
+
+@router.get(
+    "/search/box",
+    response_model=OrdersSchema,
+    summary="Search orders by pickup bounding box.",
+    status_code=status.HTTP_200_OK,
+)
+async def search_orders_within_box(
+    uow: UnitOfWork = Depends(get_unit_of_work),
+    box: tuple[Point, Point] = Depends(get_bounding_box),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=2, le=100),
+    count: CountMode = Query(CountMode.EXACT, description="How to calculate `total`"),
+) -> dict:
+    """Get orders whose pickup point is within the bounding box."""
+    south_west, north_east = box
+    orders, total = await uow.order.get_paginated_within_box(
+        south_west, north_east, page=page, page_size=page_size, count=count
+    )
+    return {"items": orders, "total": total, "count": count, "page": page, "page_size": page_size}
+
+
+@router.get(
+    "/search/nearest",
+    response_model=OrdersSchema,
+    summary="Search orders with the nearest pickup.",
+    status_code=status.HTTP_200_OK,
+)
+async def search_nearest_orders(
+    uow: UnitOfWork = Depends(get_unit_of_work),
+    center: Point = Depends(get_center),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=2, le=100),
+) -> dict:
+    """Get orders ordered by pickup distance to the center, `total` is not calculated."""
+    orders = await uow.order.get_paginated_nearest(center, page=page, page_size=page_size)
+    return {
+        "items": orders,
+        "total": None,
+        "count": CountMode.NONE,
+        "page": page,
+        "page_size": page_size,
+    }
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export orders.",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"content": {media_type: {} for media_type in MEDIA_TYPES.values()}}
+    },
+)
+async def export_orders(
+    uow: UnitOfWork = Depends(get_unit_of_work),
+    settings: Settings = Depends(get_settings),
+    filters: OrderFilters = Depends(get_order_filters),
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+) -> StreamingResponse:
+    """
+    Stream all orders matching the filters as NDJSON, CSV or Arrow IPC stream.
+
+    Orders are read from a server-side cursor in batches, so any number of orders can be exported
+    with constant memory.
+    """
+    encode = ENCODERS[export_format]
+
+    async def stream() -> AsyncIterator[bytes]:
+        # Dependencies are closed before the response is sent, so export has its own session
+        async with uow.fork() as export_uow:
+            batches = export_uow.order.stream_export(
+                filters, batch_size=settings.ORDERS_EXPORT_BATCH_SIZE
+            )
+            async for chunk in encode(batches):
+                yield chunk
+
+    filename = f"orders.{export_format.value}"
+    return StreamingResponse(
+        stream(),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get(
+    "/feed",
+    response_class=StreamingResponse,
+    summary="Stream order events.",
+    status_code=status.HTTP_200_OK,
+    responses={status.HTTP_200_OK: {"content": {"text/event-stream": {}}}},
+    dependencies=[Depends(get_dispatcher_user)],
+)
+async def order_feed(
+    settings: Settings = Depends(get_settings),
+    hub: OrderFeedHub = Depends(get_order_feed),
+) -> StreamingResponse:
+    """
+    Push `created` and `updated` order events as server-sent events, instead of polling.
+
+    Events carry the order without description. Clients that read slower than events arrive are
+    disconnected after the `dropped` event; after reconnecting (or the `resync` event) they
+    should reload the orders they show.
+    """
+    return StreamingResponse(
+        stream_events(hub, heartbeat=settings.ORDERS_FEED_HEARTBEAT_SECONDS),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def parse_order_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        created_at, id_ = decode_cursor(cursor)
+        return datetime.fromisoformat(created_at), int(id_)
+    except (TypeError, ValueError):
+        error = "Invalid cursor."
+        raise APIValidationError(error)
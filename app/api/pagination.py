@@ -0,0 +1,17 @@
+import base64
+import json
+
+
+def encode_cursor(*values: str | int) -> str:
+    """Encode sort key of the last item into an opaque cursor."""
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list:
+    """Decode cursor built by `encode_cursor`, raises ValueError for malformed cursors."""
+    raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+    values = json.loads(raw)
+    if not isinstance(values, list):
+        raise ValueError(cursor)  # noqa: TRY004
+    return values
@@ -1,11 +1,10 @@
-from fastapi import APIRouter
-from fastapi.params import Depends
-from sqlalchemy import text
+from fastapi import APIRouter, Depends, Response
 from starlette import status
 
 from app.api.root.schemas import HealthCheckSchema
-from app.dependencies.db import get_unit_of_work
-from app.uow.unit_of_work import UnitOfWork
+from app.db.database import DatabaseSessionManager
+from app.dependencies.db import get_database
+from app.monitoring.metrics import render
 
 router = APIRouter(tags=["infrastructure"])
 
@@ -16,6 +15,20 @@ router = APIRouter(tags=["infrastructure"])
     status_code=status.HTTP_200_OK,
     tags=["infrastructure"],
 )
-async def healthcheck(uow: UnitOfWork = Depends(get_unit_of_work)) -> dict:  # type: ignore[assignment]
-    await uow.execute(text("SELECT 1"))
+async def healthcheck(database: DatabaseSessionManager = Depends(get_database)) -> dict:
+    """Check that a connection to the database can be used, without a session and repositories."""
+    await database.ping()
     return {"result": "success"}
+
+
+@router.get(
+    path="/metrics",
+    response_class=Response,
+    status_code=status.HTTP_200_OK,
+    summary="Prometheus metrics.",
+    tags=["infrastructure"],
+)
+async def metrics() -> Response:
+    """Request and SQL statement latency histograms of all workers in Prometheus text format."""
+    content, media_type = render()
+    return Response(content=content, media_type=media_type)
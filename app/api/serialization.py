@@ -0,0 +1,27 @@
+"""
+Fast path for large read responses.
+
+By default FastAPI validates the returned value against `response_model` (ORM objects are read
+attribute by attribute into Pydantic models) and then encodes it with `jsonable_encoder` and
+`json.dumps`. Views that opt in build a page of plain dicts straight from result rows and return
+`json_response`: a prebuilt `TypeAdapter` of a TypedDict serializes it to JSON bytes in one call
+in pydantic-core, without creating models. `response_model` is still set on such routes, so
+OpenAPI stays the same, FastAPI doesn't touch a returned `Response`.
+"""
+
+from typing import Any
+
+from fastapi import Response
+from pydantic import TypeAdapter
+from starlette import status
+
+
+def json_response(
+    adapter: TypeAdapter[Any], content: object, status_code: int = status.HTTP_200_OK
+) -> Response:
+    """Serialize `content` with `adapter`, keys not declared in its TypedDicts are skipped."""
+    return Response(
+        content=adapter.dump_json(content),
+        status_code=status_code,
+        media_type="application/json",
+    )
@@ -1,8 +1,10 @@
-from pydantic import EmailStr
+from typing import TypedDict
+
+from pydantic import EmailStr, TypeAdapter
 from pydantic.fields import Field
 
-from app.domain.enums import UserRoles
-from app.schemas import BaseSchema
+from app.domain.enums import CountMode, UserRoles
+from app.schemas import BasePaginationSchema, BaseSchema
 
 
 class ViewProfileSchema(BaseSchema):
@@ -25,10 +27,31 @@ class AddUserSchema(BaseSchema):
     role: UserRoles = Field(UserRoles.ADMIN, description="User's role, default is 'ADMIN'")
 
 
-class UsersSchema(BaseSchema):
-    """Base schema for paginated responses."""
+class UsersSchema(BasePaginationSchema):
+    """Base schema for user paginated responses."""
+
+    items: list[ViewProfileSchema] = Field(..., description="List of users in the current page")
+
+
+class UserItem(TypedDict):
+    """`ViewProfileSchema` for the fast serialization path."""
+
+    id: int
+    email: str
+    first_name: str
+    last_name: str
+    role: UserRoles
+
+
+class UsersPage(TypedDict):
+    """`UsersSchema` for the fast serialization path."""
+
+    total: int | None
+    count: CountMode
+    items: list[UserItem]
+    page: int | None
+    page_size: int
+    next_cursor: str | None
+
 
-    total: int = Field(..., description="Total number of items")
-    items: list[ViewProfileSchema] = Field(..., description="List of items in the current page")
-    page: int = Field(..., description="Current page number")
-    page_size: int = Field(..., description="Number of items per page")
+users_page_adapter = TypeAdapter(UsersPage)
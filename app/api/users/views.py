@@ -1,13 +1,20 @@
 from logging import getLogger
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from starlette import status
 
-from app.api.authentication.utils import get_password_hash
-from app.api.exceptions import ConflictError, NotFoundError
-from app.api.users.schemas import AddUserSchema, UsersSchema, ViewProfileSchema
+from app.api.exceptions import APIValidationError, ConflictError, NotFoundError
+from app.api.pagination import decode_cursor, encode_cursor
+from app.api.serialization import json_response
+from app.api.users.schemas import (
+    AddUserSchema,
+    UsersSchema,
+    ViewProfileSchema,
+    users_page_adapter,
+)
 from app.dependencies.db import get_unit_of_work
-from app.domain import User
+from app.dependencies.hashing import get_password_hasher
+from app.domain import CountMode, User
 from app.uow.unit_of_work import UnitOfWork
 
 logger = getLogger(__name__)
@@ -33,7 +40,7 @@ async def create_user(
         raise ConflictError(error)
     body_dict = body.model_dump()
     password = body_dict.pop("password")
-    body_dict["hashed_password"] = get_password_hash(password)
+    body_dict["hashed_password"] = await get_password_hasher().hash(password)
     db_user = await uow.user.create(**body_dict, flush=True)
     await uow.commit()
     await uow.refresh(db_user)
@@ -50,13 +57,34 @@ async def get_all_users(
     uow: UnitOfWork = Depends(get_unit_of_work),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=2, le=100),
-) -> dict:
-    """Get all users."""
-    users, total = await uow.user.get_paginated_all(page=page, page_size=page_size)
-    if not users:
+    after: str | None = Query(None, description="`next_cursor` of the previous page"),
+    count: CountMode = Query(CountMode.EXACT, description="How to calculate `total`"),
+) -> Response:
+    """
+    Get all users.
+
+    A page number beyond the last page is not found, a cursor after the last user gives
+    an empty page.
+    """
+    users, total = await uow.user.get_paginated_dicts(
+        page=page,
+        page_size=page_size,
+        after=parse_user_cursor(after) if after else None,
+        count=count,
+    )
+    if not users and not after:
         error = "No users found."
         raise NotFoundError(error)
-    return {"items": users, "total": total, "page": page, "page_size": page_size}
+    next_cursor = encode_cursor(users[-1]["id"]) if len(users) == page_size else None
+    page_content = {
+        "items": users,
+        "total": total,
+        "count": count,
+        "page": None if after else page,
+        "page_size": page_size,
+        "next_cursor": next_cursor,
+    }
+    return json_response(users_page_adapter, page_content)
 
 
 @router.get(
@@ -72,3 +100,12 @@ async def view_user_profile(user_id: int, uow: UnitOfWork = Depends(get_unit_of_
         error = f"User with ID {user_id} does not exist."
         raise NotFoundError(error)
     return user
+
+
+def parse_user_cursor(cursor: str) -> int:
+    try:
+        (id_,) = decode_cursor(cursor)
+        return int(id_)
+    except (TypeError, ValueError):
+        error = "Invalid cursor."
+        raise APIValidationError(error)
@@ -1,8 +1,18 @@
 import contextlib
+import itertools
+from collections.abc import Sequence
+from functools import partial
+from typing import cast
 
+from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 
+from app.db.pool import InstrumentedPool
+from app.db.routing import RoutingSession
+from app.db.statements import StatementCacheMetrics
+from app.monitoring.database import instrument_engine
+
 
 class AsyncSQLAlchemy:
     def __init__(self, session_factory: async_sessionmaker, engine: AsyncEngine) -> None:
@@ -11,12 +21,54 @@ class AsyncSQLAlchemy:
 
 
 class DatabaseSessionManager:
-    def __init__(self, url: str) -> None:
+    """
+    Engine of the primary database and optional engines of its read replicas.
+
+    With replicas, sessions route plain SELECTs to them (round robin, one replica per session)
+    until the session writes, see `RoutingSession`. Every engine has its own pool.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        url: str,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_timeout: float = 30.0,
+        pool_recycle: int = -1,
+        pool_pre_ping: bool = False,
+        replica_urls: Sequence[str] = (),
+        prepared_statement_cache_size: int = 100,
+    ) -> None:
         self._url = url
-        self._engine: AsyncEngine = create_async_engine(url)
-        self._session_maker: async_sessionmaker = async_sessionmaker(
-            bind=self._engine, autoflush=False, autocommit=False
-        )
+        engine_options = {
+            "poolclass": InstrumentedPool,
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_timeout": pool_timeout,
+            "pool_recycle": pool_recycle,
+            "pool_pre_ping": pool_pre_ping,
+            # asyncpg prepared statements cached by SQL per connection, 0 disables the cache
+            "connect_args": {"prepared_statement_cache_size": prepared_statement_cache_size},
+        }
+        self._engine: AsyncEngine = create_async_engine(url, **engine_options)
+        self._replicas = [create_async_engine(url, **engine_options) for url in replica_urls]
+        self.statement_cache = StatementCacheMetrics()
+        for engine in (self._engine, *self._replicas):
+            self.statement_cache.attach(engine.sync_engine)
+            instrument_engine(engine.sync_engine)
+        if self._replicas:
+            replicas = itertools.cycle([replica.sync_engine for replica in self._replicas])
+            self._session_maker: async_sessionmaker = async_sessionmaker(
+                bind=self._engine,
+                autoflush=False,
+                autocommit=False,
+                sync_session_class=RoutingSession,
+                next_replica=partial(next, replicas),
+            )
+        else:
+            self._session_maker = async_sessionmaker(
+                bind=self._engine, autoflush=False, autocommit=False
+            )
 
     def get_db(self) -> AsyncSQLAlchemy:
         return AsyncSQLAlchemy(session_factory=self._session_maker, engine=self._engine)
@@ -32,5 +84,22 @@ class DatabaseSessionManager:
         finally:
             await session.close()
 
+    async def ping(self) -> None:
+        async with self._engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    def pool_metrics(self) -> dict:
+        """Metrics of the primary pool, with replica pools and statement caches of all engines."""
+        return get_pool_metrics(self._engine) | {
+            "replicas": [get_pool_metrics(replica) for replica in self._replicas],
+            "statement_cache": self.statement_cache.metrics(),
+        }
+
     async def dispose(self):
         await self._engine.dispose()
+        for replica in self._replicas:
+            await replica.dispose()
+
+
+def get_pool_metrics(engine: AsyncEngine) -> dict:
+    return cast("InstrumentedPool", engine.pool).metrics()
@@ -0,0 +1,44 @@
+import time
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+from app.metrics import Histogram
+from app.monitoring.metrics import DB_POOL_WAIT, POOL_WAIT_BUCKETS
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """
+    Queue pool of async engines that measures connection checkouts.
+
+    Wait time covers waiting for a free connection, opening a new one and the pre-ping.
+    Metrics are reset when the engine is disposed, the pool is recreated then.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        super().__init__(*args, **kwargs)
+        self.wait = Histogram(buckets=POOL_WAIT_BUCKETS, exported=DB_POOL_WAIT)
+        self.timeouts = 0  # checkouts failed after waiting for `pool_timeout`
+
+    def connect(self) -> PoolProxiedConnection:
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            self.wait.observe(time.perf_counter() - started)
+
+    def metrics(self) -> dict:
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "idle": self.checkedin(),
+            # Negative while the pool itself isn't full yet
+            "overflow": max(self.overflow(), 0),
+            "max_overflow": self._max_overflow,
+            "timeouts": self.timeouts,
+            "wait": self.wait.snapshot(),
+        }
@@ -0,0 +1,44 @@
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import Connection, Engine, Select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ClauseElement
+
+
+def is_read_only(clause: ClauseElement | None) -> bool:
+    """Plain SELECT without row locks, other statements (DML, text, DDL) may write."""
+    return isinstance(clause, Select) and clause._for_update_arg is None
+
+
+class RoutingSession(Session):
+    """
+    Session that sends reads to a read replica and everything else to the primary (`bind`).
+
+    After the first write (flush or a statement that may write) the session sticks to the
+    primary until it is discarded, also after commit: it reads its own writes regardless of
+    replication lag. One replica is picked per session, its reads share one connection.
+    """
+
+    def __init__(self, *args, next_replica: Callable[[], Engine], **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._next_replica = next_replica
+        self._replica: Engine | None = None
+        self.sticky = False
+
+    def get_bind(
+        self,
+        mapper: Any = None,  # noqa: ANN401
+        *,
+        clause: ClauseElement | None = None,
+        **kwargs,
+    ) -> Engine | Connection:
+        primary = super().get_bind(mapper, clause=clause, **kwargs)
+        if self.sticky:
+            return primary
+        if self._flushing or not is_read_only(clause):
+            self.sticky = True
+            return primary
+        if self._replica is None:
+            self._replica = self._next_replica()
+        return self._replica
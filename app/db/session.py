@@ -3,4 +3,13 @@ from app.dependencies.settings import get_settings
 
 settings = get_settings()
 
-db_session_manager = DatabaseSessionManager(settings.DATABASE_URI)
+db_session_manager = DatabaseSessionManager(
+    settings.DATABASE_URI,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_POOL_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    replica_urls=settings.DATABASE_REPLICA_URIS,
+    prepared_statement_cache_size=settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+)
@@ -0,0 +1,59 @@
+from typing import Any
+
+from sqlalchemy import Connection, Engine, event
+from sqlalchemy.engine import default
+
+
+class StatementCacheMetrics:
+    """
+    Hit rates of SQLAlchemy compiled statements cache and asyncpg prepared statements cache.
+
+    Compiled cache is per engine: statements with the same structure are compiled to SQL once.
+    Prepared statements are cached by SQL per connection (`prepared_statement_cache_size`),
+    a miss costs an extra round trip to prepare the statement.
+    """
+
+    def __init__(self) -> None:
+        self.compiled_hits = 0
+        self.compiled_misses = 0
+        self.prepared_hits = 0
+        self.prepared_misses = 0
+
+    def attach(self, engine: Engine) -> None:
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+
+    def metrics(self) -> dict:
+        compiled = self.compiled_hits + self.compiled_misses
+        prepared = self.prepared_hits + self.prepared_misses
+        return {
+            "compiled_hits": self.compiled_hits,
+            "compiled_misses": self.compiled_misses,
+            "compiled_hit_rate": self.compiled_hits / compiled if compiled else 0.0,
+            "prepared_hits": self.prepared_hits,
+            "prepared_misses": self.prepared_misses,
+            "prepared_hit_rate": self.prepared_hits / prepared if prepared else 0.0,
+        }
+
+    def _before_cursor_execute(  # noqa: PLR0913
+        self,
+        connection: Connection,
+        cursor: Any,  # noqa: ANN401
+        statement: str,
+        parameters: Any,  # noqa: ANN401
+        context: Any,  # noqa: ANN401
+        executemany: bool,
+    ) -> None:
+        cache_hit = getattr(context, "cache_hit", None)
+        if cache_hit is default.CACHE_HIT:
+            self.compiled_hits += 1
+        elif cache_hit is default.CACHE_MISS:
+            self.compiled_misses += 1
+
+        # Checked before the driver looks the statement up (and adds it on a miss)
+        dbapi_connection = connection.connection.dbapi_connection
+        prepared = getattr(dbapi_connection, "_prepared_statement_cache", None)
+        if prepared is not None:
+            if statement in prepared:
+                self.prepared_hits += 1
+            else:
+                self.prepared_misses += 1
@@ -0,0 +1,39 @@
+from functools import lru_cache
+
+from app.cache import TTLCache
+from app.dependencies.settings import get_settings
+from app.routing.cache import RouteCache
+
+
+@lru_cache
+def get_principal_cache() -> TTLCache[int, dict]:
+    """Cache of authenticated users' fields by user ID."""
+    settings = get_settings()
+    return TTLCache(
+        max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+        ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    )
+
+
+@lru_cache
+def get_token_cache() -> TTLCache[tuple, dict]:
+    """Cache of verified JWT payloads, entries expire together with tokens."""
+    settings = get_settings()
+    return TTLCache(max_size=settings.TOKEN_CACHE_MAX_SIZE, ttl=0)
+
+
+@lru_cache
+def get_count_cache() -> TTLCache[tuple, int]:
+    """Cache of listing totals by compiled query and its parameters."""
+    settings = get_settings()
+    return TTLCache(
+        max_size=settings.COUNT_CACHE_MAX_SIZE,
+        ttl=settings.COUNT_CACHE_TTL_SECONDS,
+    )
+
+
+@lru_cache
+def get_route_cache() -> RouteCache:
+    """Worker level of the route cache, see `CachedRouteProvider`."""
+    settings = get_settings()
+    return RouteCache(max_size=settings.ROUTE_CACHE_MAX_SIZE)
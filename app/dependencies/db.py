@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from app.db.database import AsyncSQLAlchemy
+from app.db.database import DatabaseSessionManager
 from app.db.session import db_session_manager
 from app.uow.unit_of_work import UnitOfWork
 
@@ -11,3 +12,7 @@ async def get_unit_of_work() -> AsyncGenerator:
     db: AsyncSQLAlchemy = db_session_manager.get_db()
     async with UnitOfWork(db) as uow:
         yield uow
+
+
+def get_database() -> DatabaseSessionManager:
+    return db_session_manager
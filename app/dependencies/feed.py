@@ -0,0 +1,13 @@
+from functools import lru_cache
+
+from app.dependencies.settings import get_settings
+from app.feed.hub import OrderFeedHub, connect_to
+
+
+@lru_cache
+def get_order_feed() -> OrderFeedHub:
+    """Order events of this worker, fed by one LISTEN connection."""
+    settings = get_settings()
+    return OrderFeedHub(
+        connect_to(settings.DATABASE_URI), queue_size=settings.ORDERS_FEED_QUEUE_SIZE
+    )
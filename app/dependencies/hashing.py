@@ -0,0 +1,16 @@
+from functools import lru_cache
+
+from app.api.authentication.hashing import PasswordHasher
+from app.dependencies.settings import get_settings
+from app.monitoring.metrics import PASSWORD_HASHING_DURATION
+
+
+@lru_cache
+def get_password_hasher() -> PasswordHasher:
+    settings = get_settings()
+    return PasswordHasher(
+        max_workers=settings.HASHING_MAX_WORKERS,
+        max_concurrency=settings.HASHING_MAX_CONCURRENCY,
+        queue_timeout=settings.HASHING_QUEUE_TIMEOUT_SECONDS,
+        exported_latency=PASSWORD_HASHING_DURATION,
+    )
@@ -0,0 +1,17 @@
+from functools import lru_cache
+
+from app.dependencies.settings import get_settings
+from app.monitoring.profiling import RequestProfiler
+
+
+@lru_cache
+def get_request_profiler() -> RequestProfiler:
+    """Profiler of requests of this worker, profiles are shared by workers via PROFILES_DIR."""
+    settings = get_settings()
+    return RequestProfiler(
+        directory=settings.PROFILES_DIR,
+        secret=settings.SECRET_KEY,
+        interval=settings.PROFILING_INTERVAL_SECONDS,
+        max_per_minute=settings.PROFILING_MAX_PER_MINUTE,
+        max_profiles=settings.PROFILING_MAX_PROFILES,
+    )
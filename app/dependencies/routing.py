@@ -0,0 +1,93 @@
+from functools import lru_cache
+
+from fastapi import Depends
+
+from app.config import Settings
+from app.db.session import db_session_manager
+from app.dependencies.caches import get_route_cache
+from app.dependencies.db import get_unit_of_work
+from app.dependencies.settings import get_settings
+from app.routing.batching import RouteBatcher
+from app.routing.cache import CachedRouteProvider, RouteCachePurger
+from app.routing.osrm import OsrmClient, build_http_client
+from app.routing.types import RouteProvider
+from app.uow.unit_of_work import UnitOfWork
+
+
+@lru_cache
+def get_worker_osrm_client() -> OsrmClient | None:
+    """OSRM client of this worker, built on startup, None if OSRM_URL is not configured."""
+    settings = get_settings()
+    if not settings.OSRM_URL:
+        return None
+    http_client = build_http_client(
+        base_url=settings.OSRM_URL,
+        timeout=settings.OSRM_TIMEOUT_SECONDS,
+        max_connections=settings.OSRM_MAX_CONNECTIONS,
+    )
+    return OsrmClient(
+        http_client,
+        profile=settings.OSRM_PROFILE,
+        retries=settings.OSRM_RETRIES,
+        retry_backoff=settings.OSRM_RETRY_BACKOFF_SECONDS,
+        max_concurrency=settings.OSRM_MAX_CONNECTIONS,
+        max_table_size=settings.OSRM_MAX_TABLE_SIZE,
+    )
+
+
+@lru_cache
+def get_worker_route_batcher() -> RouteBatcher | None:
+    """
+    Coalesces concurrent route lookups of this worker to its OSRM client, built on startup.
+
+    None if OSRM is not configured or lookups are not batched.
+    """
+    settings = get_settings()
+    osrm_client = get_worker_osrm_client()
+    if osrm_client is None or settings.ROUTE_BATCH_WINDOW_SECONDS <= 0:
+        return None
+    return RouteBatcher(
+        osrm_client,
+        window=settings.ROUTE_BATCH_WINDOW_SECONDS,
+        max_batch_size=settings.ROUTE_BATCH_MAX_SIZE,
+    )
+
+
+@lru_cache
+def get_route_cache_purger() -> RouteCachePurger:
+    """Deletes stale routes of the Postgres level of the route cache in the background."""
+    settings = get_settings()
+    return RouteCachePurger(
+        get_route_cache(),
+        uow_factory=lambda: UnitOfWork(db_session_manager.get_db()),
+        interval=settings.ROUTE_CACHE_PURGE_INTERVAL_SECONDS,
+    )
+
+
+# Async dependencies are resolved on the event loop, sync ones would hop to the threadpool
+async def get_osrm_client() -> OsrmClient | None:
+    return get_worker_osrm_client()
+
+
+async def get_route_batcher() -> RouteBatcher | None:
+    return get_worker_route_batcher()
+
+
+async def get_route_provider(
+    settings: Settings = Depends(get_settings),
+    uow: UnitOfWork = Depends(get_unit_of_work),
+    osrm_client: OsrmClient | None = Depends(get_osrm_client),
+    route_batcher: RouteBatcher | None = Depends(get_route_batcher),
+) -> RouteProvider | None:
+    """Calculates distance and duration of orders: cache, then coalesced OSRM lookups."""
+    if osrm_client is None:
+        return None
+    provider: RouteProvider = osrm_client if route_batcher is None else route_batcher
+    return CachedRouteProvider(
+        provider,
+        cache=get_route_cache(),
+        repository=uow.route_cache,
+        version=settings.OSRM_DATASET_VERSION,
+        precision=settings.ROUTE_CACHE_PRECISION,
+        ttl=settings.ROUTE_CACHE_TTL_SECONDS,
+    )
@@ -1,6 +1,64 @@
-# @lru_cache
-from app.config import Settings
+import asyncio
+import signal
+import threading
+from logging import getLogger
+
+from pydantic import ValidationError
+
+from app.config import STARTUP_SETTINGS, Settings
+
+logger = getLogger(__name__)
+
+_settings: Settings | None = None
+_settings_lock = threading.Lock()
 
 
 def get_settings() -> Settings:
-    return Settings()  # type: ignore[call-arg]
+    """Return the process-wide settings snapshot (built once per worker)."""
+    settings = _settings
+    if settings is None:
+        with _settings_lock:
+            settings = _settings or _swap_settings()
+    return settings
+
+
+def reload_settings() -> Settings:
+    """
+    Re-read settings and atomically replace the snapshot.
+
+    The previous snapshot stays active if the new settings are invalid.
+    """
+    with _settings_lock:
+        return _swap_settings()
+
+
+def restart_required(previous: Settings, current: Settings) -> list[str]:
+    """Changed settings that a reload doesn't apply, see `STARTUP_SETTINGS`."""
+    return sorted(
+        name for name in STARTUP_SETTINGS if getattr(previous, name) != getattr(current, name)
+    )
+
+
+def _swap_settings() -> Settings:
+    global _settings  # noqa: PLW0603
+    _settings = Settings()  # type: ignore[call-arg]
+    return _settings
+
+
+def _reload_on_signal() -> None:
+    previous = get_settings()
+    try:
+        current = reload_settings()
+    except ValidationError:
+        logger.exception("Unable to reload settings, keeping the previous snapshot.")
+        return
+    logger.info("Settings were reloaded by SIGHUP.")
+    if not_applied := restart_required(previous, current):
+        logger.warning(f"Changed settings are applied after restart only: {not_applied}.")
+
+
+def install_reload_signal_handler() -> None:
+    """Reload settings on SIGHUP (must be called inside a running event loop)."""
+    if not hasattr(signal, "SIGHUP"):  # not available on Windows
+        return
+    asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, _reload_on_signal)
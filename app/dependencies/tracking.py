@@ -0,0 +1,24 @@
+from functools import lru_cache
+
+from app.db.session import db_session_manager
+from app.dependencies.settings import get_settings
+from app.tracking.positions import PositionFlusher, PositionStore
+from app.uow.unit_of_work import UnitOfWork
+
+
+@lru_cache
+def get_position_store() -> PositionStore:
+    """Latest courier positions received by this worker."""
+    return PositionStore()
+
+
+@lru_cache
+def get_position_flusher() -> PositionFlusher:
+    """Writes positions of this worker's store to Postgres and reads those of all workers."""
+    settings = get_settings()
+    return PositionFlusher(
+        get_position_store(),
+        uow_factory=lambda: UnitOfWork(db_session_manager.get_db()),
+        interval=settings.COURIER_POSITIONS_FLUSH_SECONDS,
+        max_age=settings.COURIER_POSITIONS_MAX_AGE_SECONDS,
+    )
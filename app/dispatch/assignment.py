@@ -0,0 +1,152 @@
+"""
+Courier to order assignment.
+
+Costs are matrices with couriers as rows and orders as columns, `inf` (or NaN) marks pairs that
+can't be assigned, e.g. there is no road route. Every courier gets at most one order.
+"""
+
+from enum import StrEnum
+from typing import NamedTuple
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment  # type: ignore[import-untyped]
+
+EARTH_RADIUS_KM = 6371.0088
+GREEDY_CANDIDATES = 32  # nearest orders a courier may be moved to
+GREEDY_MAX_ITERATIONS = 100
+GREEDY_MIN_GAIN = 1e-9
+
+
+class Solver(StrEnum):
+    OPTIMAL = "optimal"  # minimal total cost (Hungarian method), O(n^3)
+    GREEDY = "greedy"  # mutually nearest pairs improved by swaps, close to optimal and faster
+
+
+class Assignment(NamedTuple):
+    courier: int  # row of the cost matrix
+    order: int  # column of the cost matrix
+    cost: float
+
+
+def haversine_matrix(sources: np.ndarray, destinations: np.ndarray) -> np.ndarray:
+    """Great-circle distances (km) from every source to every destination, points are (lat, lng)."""
+    sources, destinations = np.radians(sources), np.radians(destinations)
+    lat1, lng1 = sources[:, 0, None], sources[:, 1, None]
+    lat2, lng2 = destinations[None, :, 0], destinations[None, :, 1]
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+
+
+def assign(cost: np.ndarray, solver: Solver = Solver.OPTIMAL) -> list[Assignment]:
+    """Assign as many orders as possible with minimal total cost, ordered by courier."""
+    cost = np.where(np.isnan(cost), np.inf, cost)
+    if not np.isfinite(cost).any():
+        return []
+    if solver == Solver.OPTIMAL:
+        rows, cols = solve_optimal(cost)
+    elif cost.shape[0] > cost.shape[1]:
+        # Couriers are moved to free orders only, so the smaller side must be rows
+        cols, rows = solve_greedy(cost.T)
+    else:
+        rows, cols = solve_greedy(cost)
+    order = np.argsort(rows)
+    return [
+        Assignment(int(row), int(col), float(cost[row, col]))
+        for row, col in zip(rows[order], cols[order], strict=True)
+    ]
+
+
+def solve_optimal(cost: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    finite = np.isfinite(cost)
+    # Unassignable pairs cost more than any complete assignment of assignable ones,
+    # so the solver picks them only when nothing else is left and they are dropped
+    penalty = (cost[finite].max() + 1) * min(cost.shape) + 1
+    rows, cols = linear_sum_assignment(np.where(finite, cost, penalty))
+    keep = finite[rows, cols]
+    return rows[keep], cols[keep]
+
+
+def solve_greedy(
+    cost: np.ndarray,
+    candidates: int = GREEDY_CANDIDATES,
+    max_iterations: int = GREEDY_MAX_ITERATIONS,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Pair mutually nearest couriers and orders, then improve the pairs by local moves.
+
+    A move gives a courier one of its `candidates` nearest orders: a free one, or the order of
+    another courier, who takes the courier's order in exchange. Cost must have no more rows than
+    columns. Every iteration is O(rows * candidates), so it scales where the optimal solver can't.
+    """
+    rows, cols = _mutual_nearest(cost)
+    if not rows.size:
+        return rows, cols
+    candidates = min(candidates, cost.shape[1])
+    nearest = np.argpartition(cost[rows], candidates - 1, axis=1)[:, :candidates]
+    for _ in range(max_iterations):
+        if not _improve(cost, rows, cols, nearest):
+            break
+    return rows, cols
+
+
+def _mutual_nearest(cost: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Pair up rows and columns that are the nearest to each other, round by round.
+
+    The global minimum is always a mutual pair, so every round assigns at least one pair.
+    """
+    free_rows, free_cols = np.arange(cost.shape[0]), np.arange(cost.shape[1])
+    rows, cols = [], []
+    while free_rows.size and free_cols.size:
+        sub = cost[np.ix_(free_rows, free_cols)]
+        best_col = sub.argmin(axis=1)
+        best_row = sub.argmin(axis=0)
+        index = np.arange(free_rows.size)
+        mutual = (best_row[best_col] == index) & np.isfinite(sub[index, best_col])
+        if not mutual.any():
+            break
+        rows.append(free_rows[mutual])
+        cols.append(free_cols[best_col[mutual]])
+        free_rows = free_rows[~mutual]
+        free_cols = np.delete(free_cols, best_col[mutual])
+    if not rows:
+        return np.empty(0, dtype=int), np.empty(0, dtype=int)
+    return np.concatenate(rows), np.concatenate(cols)
+
+
+def _improve(cost: np.ndarray, rows: np.ndarray, cols: np.ndarray, nearest: np.ndarray) -> bool:
+    """Apply the best improving move of every courier, skipping moves that touch the same pairs."""
+    holder = np.full(cost.shape[1], -1)  # pair index by order, -1 for free orders
+    holder[cols] = np.arange(rows.size)
+    current = cost[rows, cols]
+
+    others = holder[nearest]
+    swapped = others >= 0
+    other = np.where(swapped, others, 0)
+    # Courier takes the candidate order; in a swap the other courier takes the courier's order
+    after = cost[rows[:, None], nearest] + np.where(swapped, cost[rows[other], cols[:, None]], 0)
+    before = current[:, None] + np.where(swapped, current[other], 0)
+    with np.errstate(invalid="ignore"):
+        gain = np.nan_to_num(before - after, nan=0, neginf=0)
+
+    best = gain.argmax(axis=1)
+    best_gain = gain[np.arange(rows.size), best]
+    improved = False
+    touched = np.zeros(rows.size, dtype=bool)
+    taken = np.zeros(cost.shape[1], dtype=bool)
+    for i in np.argsort(-best_gain):
+        if not best_gain[i] > GREEDY_MIN_GAIN:
+            break
+        order, j = nearest[i, best[i]], others[i, best[i]]
+        if touched[i] or taken[order] or (j >= 0 and touched[j]):
+            continue
+        if j >= 0:
+            cols[j] = cols[i]
+            touched[j] = True
+        taken[cols[i]] = True
+        cols[i] = order
+        touched[i] = taken[order] = improved = True
+    return improved
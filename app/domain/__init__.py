@@ -1,9 +1,14 @@
 from app.domain.base import MinimalBase, metadata_
-from app.domain.enums import UserRoles
+from app.domain.couriers import CourierPosition
+from app.domain.enums import CountMode, UserRoles
 from app.domain.orders import Order
+from app.domain.routes import CachedRoute
 from app.domain.users import User
 
 __all__ = [
+    "CachedRoute",
+    "CountMode",
+    "CourierPosition",
     "MinimalBase",
     "Order",
     "User",
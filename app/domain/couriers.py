@@ -0,0 +1,21 @@
+from datetime import datetime
+from typing import Any
+
+from geoalchemy2 import Geometry
+from sqlalchemy import DateTime, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import MinimalBase
+
+
+class CourierPosition(MinimalBase):
+    """Latest known position of a courier, flushed from memory of workers in bulk."""
+
+    __tablename__ = "courier_positions"
+
+    courier_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    position: Mapped[Any] = mapped_column(Geometry("POINT", srid=4326), nullable=False)
+    # UTC time of the GPS fix
+    recorded_at: Mapped[datetime] = mapped_column(DateTime(), nullable=False)
@@ -1,4 +1,4 @@
-from enum import Enum, auto
+from enum import Enum, StrEnum, auto
 
 
 class AutoName(Enum):
@@ -12,3 +12,20 @@ class UserRoles(AutoName):
     DISPATCHER = auto()
     COURIER = auto()
     CLIENT = auto()
+
+
+class CountMode(StrEnum):
+    """How the total number of items is calculated for paginated listings."""
+
+    EXACT = "exact"  # count(*) over the filtered rows
+    # Planner statistics of the table, cheap but approximate. Filtered listings use CACHED.
+    ESTIMATED = "estimated"
+    CACHED = "cached"  # exact count, reused for COUNT_CACHE_TTL_SECONDS
+    NONE = "none"  # total is not calculated at all
+
+
+class ProfileFormat(StrEnum):
+    """Output formats of request profiles."""
+
+    SPEEDSCOPE = "speedscope"  # JSON for https://www.speedscope.app
+    PSTATS = "pstats"  # marshaled stats for pstats, snakeviz, etc.
@@ -1,7 +1,8 @@
+from datetime import datetime
 from typing import Any
 
 from geoalchemy2 import Geometry
-from sqlalchemy import DateTime, Float, String, Text
+from sqlalchemy import DateTime, Float, ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -10,14 +11,32 @@ from .base import IDOrmModel
 
 class Order(IDOrmModel):
     __tablename__ = "orders"
+    __table_args__ = (
+        # Keyset pagination order
+        Index("idx_orders_created_at_id", "created_at", "id"),
+        Index("idx_orders_courier_id", "courier_id"),
+        # Range filters of listings
+        Index("idx_orders_distance_km", "distance_km"),
+        Index("idx_orders_duration_minutes", "duration_minutes"),
+    )
 
     name: Mapped[str | None] = mapped_column(String(255), nullable=True)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
-    start_point: Mapped[Any] = mapped_column(Geometry("POINT", srid=4326), nullable=False)
-    end_point: Mapped[Any] = mapped_column(Geometry("POINT", srid=4326), nullable=False)
+    # Geometries are not loaded with orders, responses don't need them. Access without
+    # `undefer` raises instead of emitting a lazy load, which is not possible with async IO.
+    start_point: Mapped[Any] = mapped_column(
+        Geometry("POINT", srid=4326), nullable=False, deferred=True, deferred_raiseload=True
+    )
+    end_point: Mapped[Any] = mapped_column(
+        Geometry("POINT", srid=4326), nullable=False, deferred=True, deferred_raiseload=True
+    )
     distance_km: Mapped[float | None] = mapped_column(Float, nullable=True)
     duration_minutes: Mapped[float | None] = mapped_column(Float, nullable=True)
-    created_at: Mapped[DateTime] = mapped_column(
+    # Open orders have no courier yet
+    courier_id: Mapped[int | None] = mapped_column(
+        ForeignKey("users.id", ondelete="SET NULL"), nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
         DateTime(),
         server_default=func.now(),
         nullable=False,
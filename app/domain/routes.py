@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import MinimalBase
+
+
+class CachedRoute(MinimalBase):
+    """Route calculated by OSRM, shared by all workers (second level of the route cache)."""
+
+    __tablename__ = "route_cache"
+
+    # OSRM map data build, routes of other builds are never read
+    dataset_version: Mapped[str] = mapped_column(String(64), primary_key=True)
+    # Quantized coordinates
+    start_lat: Mapped[float] = mapped_column(Float, primary_key=True)
+    start_lng: Mapped[float] = mapped_column(Float, primary_key=True)
+    end_lat: Mapped[float] = mapped_column(Float, primary_key=True)
+    end_lng: Mapped[float] = mapped_column(Float, primary_key=True)
+    distance_km: Mapped[float] = mapped_column(Float, nullable=False)
+    duration_minutes: Mapped[float] = mapped_column(Float, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(), nullable=False)
@@ -0,0 +1,178 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from logging import getLogger
+from typing import Any
+
+import asyncpg  # type: ignore[import-untyped]
+
+logger = getLogger(__name__)
+
+# Channel of the orders table triggers, see migration "batch order events"
+ORDER_EVENTS_CHANNEL = "order_events"
+
+
+class Subscription:
+    """Events of one client, buffered up to the queue size."""
+
+    def __init__(self, queue_size: int) -> None:
+        self._queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=queue_size)
+        self.dropped = asyncio.Event()
+
+    def put(self, event: dict) -> bool:
+        """Queue the event, False if the client is too slow and has been dropped."""
+        if self.dropped.is_set():
+            return False
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.dropped.set()
+            return False
+        return True
+
+    async def get(self) -> dict:
+        return await self._queue.get()
+
+
+class OrderFeedHub:
+    """
+    Fan out order events of Postgres NOTIFY to subscribers of this worker.
+
+    One connection per worker LISTENs to the channel, it is opened with the first subscriber,
+    reopened if it is lost and closed when the last subscriber leaves. Every subscriber has
+    a bounded queue: a client that doesn't read fast enough is dropped instead of buffering
+    events without limit.
+
+    The triggers notify once per statement: orders of small statements are published one by
+    one, larger statements are published as one `resync` event.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Awaitable[Any]],
+        queue_size: int,
+        reconnect_delay: float = 1.0,
+    ) -> None:
+        self._connect = connect
+        self._queue_size = queue_size
+        self._reconnect_delay = reconnect_delay
+        self._subscriptions: set[Subscription] = set()
+        self._connection: Any = None
+        self._lost = asyncio.Event()
+        self.listening = asyncio.Event()  # set while notifications are received
+        self._task: asyncio.Task | None = None
+        self._stopping: asyncio.Task | None = None  # cancelled listener closing its connection
+
+        # Metrics
+        self.events = 0
+        self.dropped = 0  # subscribers dropped for being too slow
+        self.reconnects = 0
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[Subscription]:
+        if self._task is None:
+            await self._start_listening()
+        subscription = Subscription(self._queue_size)
+        self._subscriptions.add(subscription)
+        try:
+            yield subscription
+        finally:
+            self._subscriptions.discard(subscription)
+            if not self._subscriptions:
+                self._stop_listening()
+
+    def publish(self, event: dict) -> None:
+        self.events += 1
+        for subscription in list(self._subscriptions):
+            if not subscription.put(event):
+                self._subscriptions.discard(subscription)
+                self.dropped += 1
+
+    def metrics(self) -> dict:
+        return {
+            "subscribers": len(self._subscriptions),
+            "events": self.events,
+            "dropped": self.dropped,
+            "reconnects": self.reconnects,
+            "connected": self.listening.is_set(),
+        }
+
+    async def close(self) -> None:
+        self._stop_listening()
+        await self._wait_stopped()
+        await self._disconnect()
+
+    async def _start_listening(self) -> None:
+        # Listeners share the connection and `_lost`, the previous one must be gone first
+        await self._wait_stopped()
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    def _stop_listening(self) -> None:
+        """Cancel the listener, it closes the connection when it stops."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            self._stopping = task
+
+    async def _wait_stopped(self) -> None:
+        if self._stopping is not None:
+            await asyncio.wait([self._stopping])
+            self._stopping = None
+
+    async def _listen(self) -> None:
+        reconnecting = False
+        try:
+            while True:
+                try:
+                    self._lost.clear()
+                    self._connection = await self._connect()
+                    self._connection.add_termination_listener(self._on_termination)
+                    await self._connection.add_listener(ORDER_EVENTS_CHANNEL, self._on_notification)
+                    self.listening.set()
+                    if reconnecting:
+                        # Events were missed while reconnecting, clients should reload orders
+                        self.publish({"type": "resync"})
+                    await self._lost.wait()
+                except Exception:
+                    logger.exception("Order events listener failed.")
+                await self._disconnect()
+                reconnecting = True
+                self.reconnects += 1
+                await asyncio.sleep(self._reconnect_delay)
+        finally:
+            await self._disconnect()
+
+    def _on_notification(self, _connection: Any, _pid: int, _channel: str, payload: str) -> None:  # noqa: ANN401
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            logger.warning(f"Invalid order event payload: {payload}")
+            return
+        # Orders of one statement come in one notification
+        orders = event.pop("orders", None)
+        if orders is None:
+            self.publish(event)
+            return
+        for order in orders:
+            self.publish({"type": event["type"], "order": order})
+
+    def _on_termination(self, connection: Any) -> None:  # noqa: ANN401
+        if connection is not self._connection:
+            # Closed by the hub, or an earlier connection
+            return
+        logger.warning("Order events listener connection was lost, reconnecting.")
+        self._lost.set()
+
+    async def _disconnect(self) -> None:
+        self.listening.clear()
+        connection, self._connection = self._connection, None
+        if connection is not None and not connection.is_closed():
+            await connection.close()
+
+
+def connect_to(dsn: str) -> Callable[[], Awaitable[asyncpg.Connection]]:
+    """Connection factory for the hub, DSN is a SQLAlchemy URL or a plain Postgres one."""
+    dsn = dsn.replace("postgresql+asyncpg://", "postgresql://", 1)
+    return lambda: asyncpg.connect(dsn)
@@ -1,4 +1,6 @@
 import logging
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI, Request
@@ -7,8 +9,18 @@ from fastapi.staticfiles import StaticFiles
 from starlette import status
 from starlette.responses import JSONResponse
 
-from app.dependencies.settings import get_settings
+from app.dependencies.feed import get_order_feed
+from app.dependencies.hashing import get_password_hasher
+from app.dependencies.profiling import get_request_profiler
+from app.dependencies.routing import (
+    get_route_cache_purger,
+    get_worker_osrm_client,
+    get_worker_route_batcher,
+)
+from app.dependencies.settings import get_settings, install_reload_signal_handler
+from app.dependencies.tracking import get_position_flusher
 from app.exceptions import FastAPIHttpError
+from app.monitoring.middleware import ProfilingMiddleware, PrometheusMiddleware
 from app.routes import register_routes
 
 BASE_DIR = Path(__file__).parent.parent
@@ -24,7 +36,25 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
-fastapi_app = FastAPI(title=settings.TITLE, version=settings.VERSION)
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncGenerator:
+    """Set up worker-level resources on startup and release them on shutdown."""
+    install_reload_signal_handler()
+    # Built before requests arrive, so concurrent first requests can't build duplicates
+    get_worker_route_batcher()
+    get_position_flusher().start()
+    get_route_cache_purger().start()
+    yield
+    get_route_cache_purger().stop()
+    await get_position_flusher().stop()
+    await get_order_feed().close()
+    get_password_hasher().shutdown()
+    if osrm_client := get_worker_osrm_client():
+        await osrm_client.close()
+
+
+fastapi_app = FastAPI(title=settings.TITLE, version=settings.VERSION, lifespan=lifespan)
 fastapi_app.mount("/static", StaticFiles(directory=BASE_DIR / "static"), name="static")
 
 # CORS middleware
@@ -35,6 +65,9 @@ fastapi_app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+fastapi_app.add_middleware(ProfilingMiddleware, profiler=get_request_profiler())
+# Added last to be the outermost, so the time of other middlewares is observed too
+fastapi_app.add_middleware(PrometheusMiddleware)
 
 
 # custom exception handler
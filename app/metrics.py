@@ -0,0 +1,45 @@
+from bisect import bisect_left
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import prometheus_client
+
+# Latency buckets in seconds, suitable for most in-process operations
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """
+    Cumulative histogram with fixed upper bounds (Prometheus-like).
+
+    Snapshots are metrics of one object of this worker for admin endpoints. Observations are
+    also forwarded to the `exported` Prometheus histogram with the same buckets, `/metrics`
+    aggregates them across objects and workers.
+    """
+
+    def __init__(
+        self,
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+        exported: "prometheus_client.Histogram | None" = None,
+    ) -> None:
+        self.buckets = buckets
+        self._exported = exported
+        # The last counter is the implicit "+Inf" bucket
+        self._counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if self._exported is not None:
+            self._exported.observe(value)
+
+    def snapshot(self) -> dict:
+        """Return cumulative bucket counters keyed by upper bound."""
+        cumulative, buckets = 0, {}
+        for bound, count in zip((*self.buckets, float("inf")), self._counts, strict=True):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        return {"buckets": buckets, "count": self.count, "sum": self.sum}
@@ -0,0 +1,71 @@
+import inspect
+import time
+from collections.abc import Callable
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, TypeVar, cast
+
+from sqlalchemy import Connection, Engine, event
+
+from app.monitoring.metrics import STATEMENT_DURATION
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Statements executed outside of repository methods (e.g. flush on commit)
+UNKNOWN_OPERATION = "<unknown>"
+
+current_operation: ContextVar[str] = ContextVar("current_operation", default=UNKNOWN_OPERATION)
+
+
+def track_operation(name: str) -> Callable[[F], F]:
+    """Label statements executed by the decorated coroutine or async generator with `name`."""
+
+    def decorator(func: F) -> F:
+        if inspect.isasyncgenfunction(func):
+
+            @wraps(func)
+            async def generator_wrapper(*args, **kwargs) -> Any:  # noqa: ANN401
+                # Set only while the generator runs, not while the caller handles its items
+                iterator = func(*args, **kwargs)
+                try:
+                    while True:
+                        token = current_operation.set(name)
+                        try:
+                            item = await anext(iterator)
+                        except StopAsyncIteration:
+                            return
+                        finally:
+                            current_operation.reset(token)
+                        yield item
+                finally:
+                    await iterator.aclose()
+
+            return cast("F", generator_wrapper)
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:  # noqa: ANN401
+            token = current_operation.set(name)
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                current_operation.reset(token)
+
+        return cast("F", wrapper)
+
+    return decorator
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Observe duration of every statement of the engine by the current operation."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _before_cursor_execute(connection: Connection, *_: object) -> None:
+    # A connection runs one statement at a time, failed ones are overwritten by the next
+    connection.info["statement_started"] = time.perf_counter()
+
+
+def _after_cursor_execute(connection: Connection, *_: object) -> None:
+    started = connection.info["statement_started"]
+    STATEMENT_DURATION.labels(current_operation.get()).observe(time.perf_counter() - started)
@@ -0,0 +1,77 @@
+"""
+Prometheus metrics of the application.
+
+With several workers every process has its own metrics, so `PROMETHEUS_MULTIPROC_DIR` must be
+set (before the app is imported) to a directory shared by the workers and emptied on start.
+Workers write their samples to files there and `/metrics` served by any worker aggregates them.
+Without it metrics of the serving worker only are returned.
+"""
+
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+from app.metrics import DEFAULT_LATENCY_BUCKETS
+
+# Requests of most routes take milliseconds, exports and event streams take much longer
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+STATEMENT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+# Checkouts from a warm pool take microseconds, waiting for a free connection takes much longer
+POOL_WAIT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0)
+BATCH_SIZE_BUCKETS = (1, 2, 5, 10, 20, 50, 100)
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Duration of HTTP requests by route template and status code.",
+    ["method", "route", "status"],
+    buckets=REQUEST_BUCKETS,
+)
+STATEMENT_DURATION = Histogram(
+    "db_statement_duration_seconds",
+    "Duration of SQL statements by the repository method that executed them.",
+    ["operation"],
+    buckets=STATEMENT_BUCKETS,
+)
+
+# Exported by the in-process histograms of admin metrics, see `app.metrics.Histogram`
+DB_POOL_WAIT = Histogram(
+    "db_pool_wait_seconds",
+    "Time to check out a database connection of any engine, connecting and pre-ping included.",
+    buckets=POOL_WAIT_BUCKETS,
+)
+PASSWORD_HASHING_DURATION = Histogram(
+    "password_hashing_duration_seconds",
+    "Time password hashing and verification calls spend in the process pool.",
+    buckets=DEFAULT_LATENCY_BUCKETS,
+)
+ROUTE_BATCH_SIZE = Histogram(
+    "route_batch_pairs",
+    "Distinct start and end pairs per batch of route lookups.",
+    buckets=BATCH_SIZE_BUCKETS,
+)
+ROUTE_BATCH_DURATION = Histogram(
+    "route_batch_duration_seconds",
+    "Duration of batches of route lookups sent to OSRM.",
+    buckets=DEFAULT_LATENCY_BUCKETS,
+)
+POSITIONS_FLUSH_DURATION = Histogram(
+    "courier_positions_flush_duration_seconds",
+    "Duration of writing courier positions to the database.",
+    buckets=DEFAULT_LATENCY_BUCKETS,
+)
+
+
+def render() -> tuple[bytes, str]:
+    """Metrics in Prometheus text format and its content type."""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
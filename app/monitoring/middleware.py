@@ -0,0 +1,94 @@
+import asyncio
+import time
+from logging import getLogger
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.monitoring.metrics import REQUEST_DURATION
+from app.monitoring.profiling import RequestProfiler
+
+logger = getLogger(__name__)
+
+# Requests that matched no route are not labeled by their path: it is chosen by clients
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class PrometheusMiddleware:
+    """
+    Observe duration of HTTP requests labeled by method, route template and status code.
+
+    Pure ASGI middleware: the response is not buffered or wrapped, only the status is read.
+    Streaming responses are observed when the stream ends.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500  # unless the app started a response
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # The router puts the matched route into the scope
+            route = scope.get("route")
+            REQUEST_DURATION.labels(
+                scope["method"], getattr(route, "path", UNMATCHED_ROUTE), str(status_code)
+            ).observe(time.perf_counter() - started)
+
+
+class ProfilingMiddleware:
+    """
+    Profile requests selected by `RequestProfiler`, other requests pass through untouched.
+
+    The profile is saved after the response is sent, so its client doesn't wait for that.
+    """
+
+    def __init__(self, app: ASGIApp, profiler: RequestProfiler) -> None:
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        reason = self.profiler.select(scope["headers"])
+        if reason is None:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500  # unless the app started a response
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        profiler = self.profiler.start(description=f"{scope['method']} {scope['path']}")
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            session = profiler.stop()
+            details = {
+                "method": scope["method"],
+                "path": scope["path"],
+                "route": getattr(scope.get("route"), "path", UNMATCHED_ROUTE),
+                "status": status_code,
+                "reason": reason,
+            }
+            try:
+                await asyncio.to_thread(self.profiler.save, session, details)
+            except OSError:
+                logger.exception(f"Unable to save profile of {scope['method']} {scope['path']}.")
@@ -0,0 +1,189 @@
+"""
+On-demand profiling of selected requests.
+
+A request is profiled if it carries a valid `X-Profile` token issued via the admin API, or if it
+is sampled while sampling is enabled via the admin API. pyinstrument samples the call stack of
+the request's async context only, so concurrent requests don't get into its profile. Profiles
+are saved to a directory (shared by workers) and rendered to speedscope or pstats on demand.
+"""
+
+import hashlib
+import hmac
+import json
+import random
+import secrets
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from logging import getLogger
+from pathlib import Path
+
+from pyinstrument import Profiler
+from pyinstrument.renderers import PstatsRenderer, SpeedscopeRenderer
+from pyinstrument.session import Session
+
+from app.domain.enums import ProfileFormat
+
+logger = getLogger(__name__)
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_ID_PATTERN = r"^\d+-[0-9a-f]{8}$"
+RATE_LIMIT_WINDOW_SECONDS = 60.0
+
+_PROFILE_HEADER_KEY = PROFILE_HEADER.lower().encode()
+
+
+class RequestProfiler:
+    """
+    Select requests to profile, record and store their profiles.
+
+    At most `max_per_minute` requests of this worker are profiled, both by tokens and sampling.
+    Only the latest `max_profiles` profiles are kept in `directory`.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        directory: Path,
+        secret: str,
+        interval: float,
+        max_per_minute: int,
+        max_profiles: int,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._directory = directory
+        self._secret = secret.encode()
+        self._interval = interval
+        self._max_per_minute = max_per_minute
+        self._max_profiles = max_profiles
+        self._clock = clock
+        # Sampling of requests without a token, enabled via admin API until `_sample_until`
+        self._sample_rate = 0.0
+        self._sample_until = 0.0
+        self._started: deque[float] = deque()  # start times within the rate limit window
+
+        # Metrics
+        self.profiled = 0
+        self.rate_limited = 0  # selected requests that weren't profiled because of the limit
+        self.invalid_tokens = 0
+
+    def issue_token(self, ttl: int) -> tuple[str, int]:
+        """Token for the `X-Profile` header and its expiration (UNIX time)."""
+        expires = int(self._clock()) + ttl
+        return f"{expires}.{self._sign(expires)}", expires
+
+    def enable_sampling(self, rate: float, duration: float) -> None:
+        self._sample_rate = rate
+        self._sample_until = self._clock() + duration
+
+    def disable_sampling(self) -> None:
+        self._sample_rate = 0.0
+        self._sample_until = 0.0
+
+    def sampling(self) -> dict:
+        if self._sample_rate and self._clock() >= self._sample_until:
+            self.disable_sampling()
+        return {"sample_rate": self._sample_rate, "until": self._sample_until or None}
+
+    def select(self, headers: Iterable[tuple[bytes, bytes]]) -> str | None:
+        """
+        Reason to profile a request with raw ASGI `headers`: "token" or "sampling".
+
+        It runs for every request, so the common case (sampling is disabled, no header)
+        takes a scan of the headers only.
+        """
+        token = None
+        for name, value in headers:
+            if name == _PROFILE_HEADER_KEY:
+                token = value
+                break
+
+        if token is not None:
+            if not self._verify(token):
+                self.invalid_tokens += 1
+                return None
+            reason = "token"
+        elif self._sample_rate and random.random() < self._sample_rate:  # noqa: S311 not crypto
+            if self._clock() >= self._sample_until:
+                self.disable_sampling()
+                return None
+            reason = "sampling"
+        else:
+            return None
+
+        now = self._clock()
+        while self._started and self._started[0] <= now - RATE_LIMIT_WINDOW_SECONDS:
+            self._started.popleft()
+        if len(self._started) >= self._max_per_minute:
+            self.rate_limited += 1
+            return None
+        self._started.append(now)
+        return reason
+
+    def start(self, description: str) -> Profiler:
+        """Start profiling the current async context, e.g. a request."""
+        profiler = Profiler(interval=self._interval, async_mode="enabled")
+        profiler.start(target_description=description)
+        return profiler
+
+    def save(self, session: Session, details: dict) -> str:
+        """Save a profile with `details` of the request, return ID of the profile."""
+        profile_id = f"{int(session.start_time)}-{secrets.token_hex(4)}"
+        self._directory.mkdir(parents=True, exist_ok=True)
+        session.save(self._directory / f"{profile_id}.pyisession")
+        info = {
+            "id": profile_id,
+            **details,
+            "started_at": session.start_time,
+            "duration_seconds": session.duration,
+            "samples": session.sample_count,
+        }
+        # Info is written last: profiles are listed by info files
+        (self._directory / f"{profile_id}.json").write_text(json.dumps(info))
+        self.profiled += 1
+
+        for stale in self._info_files()[self._max_profiles :]:
+            stale.with_suffix(".pyisession").unlink(missing_ok=True)
+            stale.unlink(missing_ok=True)
+        return profile_id
+
+    def list_profiles(self) -> list[dict]:
+        """Info of stored profiles, the newest first."""
+        profiles = []
+        for path in self._info_files():
+            try:
+                profiles.append(json.loads(path.read_text()))
+            except FileNotFoundError:
+                continue  # deleted by another worker meanwhile
+        return profiles
+
+    def render(self, profile_id: str, output_format: ProfileFormat) -> bytes | None:
+        """Profile rendered to `output_format`, None if there is no such profile."""
+        try:
+            session = Session.load(self._directory / f"{profile_id}.pyisession")
+        except FileNotFoundError:
+            return None
+        if output_format == ProfileFormat.PSTATS:
+            # The renderer returns marshaled bytes decoded with "surrogateescape"
+            return PstatsRenderer().render(session).encode("utf-8", errors="surrogateescape")
+        return SpeedscopeRenderer().render(session).encode()
+
+    def metrics(self) -> dict:
+        return {
+            "profiled": self.profiled,
+            "rate_limited": self.rate_limited,
+            "invalid_tokens": self.invalid_tokens,
+        }
+
+    def _info_files(self) -> list[Path]:
+        # IDs start with UNIX time, so names are ordered by time
+        return sorted(self._directory.glob("*.json"), reverse=True)
+
+    def _sign(self, expires: int) -> str:
+        message = f"profile:{expires}".encode()
+        return hmac.new(self._secret, message, hashlib.sha256).hexdigest()
+
+    def _verify(self, token: bytes) -> bool:
+        expires, _, signature = token.decode("latin-1").partition(".")
+        if not expires.isdigit() or int(expires) <= self._clock():
+            return False
+        return hmac.compare_digest(signature, self._sign(int(expires)))
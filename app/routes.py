@@ -1,7 +1,10 @@
 from fastapi import APIRouter, FastAPI
 
+from app.api.admin.views import router as admin_router
 from app.api.authentication.views import router as authentication_router
 from app.api.common.views import router as common_router
+from app.api.couriers.views import router as couriers_router
+from app.api.dispatch.views import router as dispatch_router
 from app.api.orders.views import router as orders_router
 from app.api.root.views import router as root_router
 from app.api.users.views import router as users_router
@@ -11,8 +14,11 @@ def register_routes(fastapi_app: FastAPI):
     """Function to register all API routers in one place."""
     # versions level
     v1_router = APIRouter(prefix="/api/v1")
+    v1_router.include_router(admin_router)
     v1_router.include_router(authentication_router)
     v1_router.include_router(common_router)
+    v1_router.include_router(couriers_router)
+    v1_router.include_router(dispatch_router)
     v1_router.include_router(orders_router)
     v1_router.include_router(users_router)
 
@@ -0,0 +1,163 @@
+import asyncio
+import time
+from collections import defaultdict
+
+import numpy as np
+
+from app.metrics import Histogram
+from app.monitoring.metrics import BATCH_SIZE_BUCKETS, ROUTE_BATCH_DURATION, ROUTE_BATCH_SIZE
+from app.routing.osrm import OsrmClient
+from app.routing.types import Point, Route, RoutingError
+
+
+class RouteBatcher:
+    """
+    Coalesce route lookups of concurrent requests.
+
+    Lookups arriving within `window` seconds are collected: identical pairs share one future,
+    distinct pairs sharing a start or an end go to OSRM as one `table` request and results are
+    fanned out to the waiting coroutines. A batch is sent right away once it has
+    `max_batch_size` distinct pairs.
+    """
+
+    def __init__(self, client: OsrmClient, window: float, max_batch_size: int) -> None:
+        self._client = client
+        self._window = window
+        self._max_batch_size = max_batch_size
+        # Pending and in-flight lookups
+        self._futures: dict[tuple[Point, Point], asyncio.Future[Route]] = {}
+        self._batch: list[tuple[Point, Point]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+        # Metrics
+        self.lookups = 0
+        self.coalesced = 0  # lookups joined an identical pending or in-flight pair
+        self.calls = 0  # OSRM requests
+        # Distinct pairs per batch
+        self.batches = Histogram(buckets=BATCH_SIZE_BUCKETS, exported=ROUTE_BATCH_SIZE)
+        self.latency = Histogram(
+            exported=ROUTE_BATCH_DURATION
+        )  # batch duration (seconds), its OSRM calls are concurrent
+
+    async def route(self, start: Point, end: Point) -> Route:
+        self.lookups += 1
+        key = (start, end)
+        future = self._futures.get(key)
+        if future is not None:
+            self.coalesced += 1
+        else:
+            loop = asyncio.get_running_loop()
+            future = self._futures[key] = loop.create_future()
+            self._batch.append(key)
+            if len(self._batch) >= self._max_batch_size:
+                self._flush()
+            elif self._timer is None:
+                self._timer = loop.call_later(self._window, self._flush)
+        # A cancelled waiter must not cancel the lookup shared with others
+        return await asyncio.shield(future)
+
+    def metrics(self) -> dict:
+        calls_saved = max(self.lookups - self.calls, 0)
+        mean_latency = self.latency.sum / self.latency.count if self.latency.count else 0.0
+        return {
+            "lookups": self.lookups,
+            "coalesced": self.coalesced,
+            "osrm_calls": self.calls,
+            "osrm_calls_saved": calls_saved,
+            # Estimate: every saved call would take the mean batch duration
+            "time_saved_seconds": calls_saved * mean_latency,
+            "batch_size": self.batches.snapshot(),
+            "latency": self.latency.snapshot(),
+        }
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._batch = self._batch, []
+        task = asyncio.create_task(self._send(batch))
+        # Keep a reference, so the task is not garbage collected while running
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: list[tuple[Point, Point]]) -> None:
+        self.batches.observe(len(batch))
+        started = time.perf_counter()
+        results: list[Route | Exception] | None = None
+        try:
+            results = await self._fetch(batch)
+        except Exception as exc:  # noqa: BLE001 waiters get any error, nobody else would see it
+            results = [exc] * len(batch)
+        finally:
+            # Also when the task is cancelled (e.g. on shutdown): a future left pending would
+            # hang its waiters and every later identical lookup joining it
+            if results is None:
+                results = [RoutingError("Route lookup was cancelled")] * len(batch)
+            else:
+                self.latency.observe(time.perf_counter() - started)
+            for key, result in zip(batch, results, strict=True):
+                future = self._futures.pop(key)
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    async def _fetch(self, batch: list[tuple[Point, Point]]) -> list[Route | Exception]:
+        """
+        Route distinct pairs with few OSRM calls, but without calculating routes nobody needs.
+
+        A table of all starts and ends of the batch would be up to N² routes to answer N pairs,
+        so pairs are grouped by their start and then (the rest) by their end: a group is one
+        `table` of 1 x K (or K x 1) routes. Pairs sharing nothing are sent as `route` calls.
+        """
+        groups: list[list[int]] = []
+        rest = list(range(len(batch)))
+        for side in (0, 1):
+            by_point: dict[Point, list[int]] = defaultdict(list)
+            for index in rest:
+                by_point[batch[index][side]].append(index)
+            rest = []
+            for indices in by_point.values():
+                if len(indices) > 1:
+                    groups.append(indices)
+                else:
+                    rest += indices
+        groups += [[index] for index in rest]
+
+        self.calls += len(groups)
+        group_results = await asyncio.gather(
+            *(self._fetch_group([batch[index] for index in indices]) for indices in groups),
+            return_exceptions=True,
+        )
+        results: list[Route | Exception] = [RoutingError("Route was not fetched")] * len(batch)
+        for indices, group_result in zip(groups, group_results, strict=True):
+            if isinstance(group_result, Exception):
+                for index in indices:
+                    results[index] = group_result
+            elif isinstance(group_result, BaseException):
+                raise group_result
+            else:
+                for index, result in zip(indices, group_result, strict=True):
+                    results[index] = result
+        return results
+
+    async def _fetch_group(self, pairs: list[tuple[Point, Point]]) -> list[Route | Exception]:
+        if len(pairs) == 1:
+            return [await self._client.route(*pairs[0])]
+
+        sources = list(dict.fromkeys(start for start, _ in pairs))
+        destinations = list(dict.fromkeys(end for _, end in pairs))
+        matrix = await self._client.table(sources, destinations)
+        rows = {point: row for row, point in enumerate(sources)}
+        cols = {point: col for col, point in enumerate(destinations)}
+
+        results: list[Route | Exception] = []
+        for start, end in pairs:
+            distance_km = matrix.distance_km[rows[start], cols[end]]
+            duration_minutes = matrix.duration_minutes[rows[start], cols[end]]
+            if np.isnan(distance_km) or np.isnan(duration_minutes):
+                results.append(RoutingError(f"OSRM has no route from {start} to {end}"))
+            else:
+                results.append(Route(float(distance_km), float(duration_minutes)))
+        return results
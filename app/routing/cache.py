@@ -0,0 +1,140 @@
+import asyncio
+import time
+from collections.abc import Callable
+from logging import getLogger
+from typing import TYPE_CHECKING
+
+from app.cache import TTLCache
+from app.routing.types import Point, Route, RouteKey, RouteProvider
+
+if TYPE_CHECKING:
+    from app.uow.route_cache.repository import RouteCacheRepository
+    from app.uow.unit_of_work import UnitOfWork
+
+logger = getLogger(__name__)
+
+
+def quantize(point: Point, precision: int) -> Point:
+    """Round coordinates to `precision` decimals (4 decimals are ~11 m)."""
+    return Point(lat=round(point.lat, precision), lng=round(point.lng, precision))
+
+
+class RouteCache:
+    """
+    Worker level of the route cache: in-memory LRU in front of the shared Postgres table.
+
+    Counters cover both levels, so the hit rate of the whole cache is visible per worker.
+    """
+
+    def __init__(self, max_size: int, clock: Callable[[], float] = time.monotonic) -> None:
+        # Entries are stored with explicit TTL, see `CachedRouteProvider`
+        self.memory: TTLCache[tuple[str, RouteKey], Route] = TTLCache(
+            max_size=max_size, ttl=0, clock=clock
+        )
+        self.db_hits = 0
+        self.db_misses = 0
+        self.db_purged = 0  # rows deleted from Postgres by this worker, see `RouteCachePurger`
+
+    def metrics(self) -> dict:
+        memory = self.memory.metrics()
+        lookups = memory["hits"] + memory["misses"]
+        hits = memory["hits"] + self.db_hits
+        return {
+            "memory": memory,
+            "db_hits": self.db_hits,
+            "db_misses": self.db_misses,
+            "db_purged": self.db_purged,
+            "hit_rate": hits / lookups if lookups else 0.0,
+        }
+
+
+class CachedRouteProvider:
+    """
+    Look routes up in memory, then in Postgres, and only then ask `provider`.
+
+    It is built per request: the Postgres level uses the request's session, so new routes are
+    stored together with the caller's transaction. Routes are keyed by the OSRM dataset
+    `version`, so rebuilt map data never serves routes of the previous build.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        provider: RouteProvider,
+        cache: RouteCache,
+        repository: "RouteCacheRepository",
+        version: str,
+        precision: int,
+        ttl: float,
+    ) -> None:
+        self._provider = provider
+        self._cache = cache
+        self._repository = repository
+        self._version = version
+        self._precision = precision
+        self._ttl = ttl
+
+    async def route(self, start: Point, end: Point) -> Route:
+        if self._ttl <= 0:
+            # The cache is disabled, nothing would ever be found in it
+            return await self._provider.route(start, end)
+
+        key = RouteKey(quantize(start, self._precision), quantize(end, self._precision))
+        memory_key = (self._version, key)
+        route = self._cache.memory.get(memory_key)
+        if route is not None:
+            return route
+
+        cached = await self._repository.get(self._version, key)
+        if cached is not None:
+            self._cache.db_hits += 1
+            route, ttl = cached
+            self._cache.memory.set(memory_key, route, ttl=min(ttl, self._ttl))
+            return route
+        self._cache.db_misses += 1
+
+        # Quantized points are routed, so the cached value doesn't depend on the first caller
+        route = await self._provider.route(key.start, key.end)
+        await self._repository.save(self._version, key, route, ttl=self._ttl)
+        self._cache.memory.set(memory_key, route, ttl=self._ttl)
+        return route
+
+
+class RouteCachePurger:
+    """
+    Delete expired routes from Postgres, routes of previous dataset versions expire too.
+
+    Routes are purged on start and then every `interval` seconds, otherwise the table would keep
+    every route ever calculated. Every worker purges, deleting the same rows twice is harmless.
+    """
+
+    def __init__(
+        self, cache: RouteCache, uow_factory: Callable[[], "UnitOfWork"], interval: float
+    ) -> None:
+        self._cache = cache
+        self._uow_factory = uow_factory
+        self._interval = interval
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def purge(self) -> int:
+        async with self._uow_factory() as uow:
+            purged = await uow.route_cache.purge()
+            await uow.commit()
+        self._cache.db_purged += purged
+        return purged
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.purge()
+            except Exception:
+                logger.exception("Unable to purge the route cache, retrying with the next purge.")
+            await asyncio.sleep(self._interval)
@@ -0,0 +1,139 @@
+import asyncio
+from logging import getLogger
+
+import httpx
+import numpy as np
+
+from app.routing.types import Point, Route, RouteMatrix, RoutingError
+
+logger = getLogger(__name__)
+
+# OSRM answers with 429 when it is overloaded, 5xx - when it is restarting
+RETRY_STATUS_CODES = {429, 502, 503, 504}
+
+
+def build_http_client(base_url: str, timeout: float, max_connections: int) -> httpx.AsyncClient:
+    """HTTP client with a pool of keep-alive connections to OSRM."""
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+    )
+    return httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits)
+
+
+def split(points: list[Point], size: int) -> list[tuple[int, list[Point]]]:
+    """Split points into chunks of `size`, each chunk comes with its offset."""
+    return [(offset, points[offset : offset + size]) for offset in range(0, len(points), size)]
+
+
+def format_coordinates(points: list[Point]) -> str:
+    """OSRM expects `lng,lat` pairs separated by `;`."""
+    return ";".join(f"{point.lng:.6f},{point.lat:.6f}" for point in points)
+
+
+class OsrmClient:
+    """
+    Async client for OSRM HTTP API.
+
+    One client per worker: `http_client` keeps a pool of keep-alive connections (see
+    `build_http_client`) and the number of concurrent requests to OSRM is capped.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        http_client: httpx.AsyncClient,
+        profile: str = "driving",
+        retries: int = 2,
+        retry_backoff: float = 0.1,
+        max_concurrency: int = 20,
+        max_table_size: int = 100,
+    ) -> None:
+        self._client = http_client
+        self._profile = profile
+        self._max_table_size = max_table_size
+        self._retries = retries
+        self._retry_backoff = retry_backoff
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def route(self, start: Point, end: Point) -> Route:
+        """Fastest route between two points."""
+        data = await self.request("route", [start, end], params={"overview": "false"})
+        route = data["routes"][0]
+        return Route(distance_km=route["distance"] / 1000, duration_minutes=route["duration"] / 60)
+
+    async def table(self, sources: list[Point], destinations: list[Point]) -> RouteMatrix:
+        """
+        Routes from every source to every destination using OSRM `table` service.
+
+        OSRM rejects tables bigger than `--max-table-size` squared, so large matrices are split
+        into chunks of at most `max_table_size` sources and destinations, fetched concurrently
+        (the number of requests in flight is still capped by the client).
+        """
+        shape = (len(sources), len(destinations))
+        distance_km, duration_minutes = np.full(shape, np.nan), np.full(shape, np.nan)
+
+        async def fetch(
+            row: int, chunk_sources: list[Point], col: int, chunk_destinations: list[Point]
+        ) -> None:
+            chunk = await self._table_chunk(chunk_sources, chunk_destinations)
+            rows = slice(row, row + len(chunk_sources))
+            cols = slice(col, col + len(chunk_destinations))
+            distance_km[rows, cols] = chunk.distance_km
+            duration_minutes[rows, cols] = chunk.duration_minutes
+
+        await asyncio.gather(
+            *(
+                fetch(row, chunk_sources, col, chunk_destinations)
+                for row, chunk_sources in split(sources, self._max_table_size)
+                for col, chunk_destinations in split(destinations, self._max_table_size)
+            )
+        )
+        return RouteMatrix(distance_km=distance_km, duration_minutes=duration_minutes)
+
+    async def _table_chunk(self, sources: list[Point], destinations: list[Point]) -> RouteMatrix:
+        params = {
+            "sources": ";".join(str(index) for index in range(len(sources))),
+            "destinations": ";".join(
+                str(index) for index in range(len(sources), len(sources) + len(destinations))
+            ),
+            "annotations": "distance,duration",
+        }
+        data = await self.request("table", sources + destinations, params=params)
+        # Unreachable pairs come as null and become NaN
+        distances = np.array(data["distances"], dtype=np.float64) / 1000
+        durations = np.array(data["durations"], dtype=np.float64) / 60
+        return RouteMatrix(distance_km=distances, duration_minutes=durations)
+
+    async def request(self, service: str, points: list[Point], params: dict) -> dict:
+        """Call OSRM service, retrying transient errors with exponential backoff."""
+        url = f"/{service}/v1/{self._profile}/{format_coordinates(points)}"
+        for attempt in range(self._retries + 1):
+            try:
+                async with self._semaphore:
+                    response = await self._client.get(url, params=params)
+            except httpx.TransportError as exc:  # includes timeouts
+                error = f"OSRM request failed: {exc!r}"
+            else:
+                if response.status_code not in RETRY_STATUS_CODES:
+                    return self._parse(response)
+                error = f"OSRM is unavailable: HTTP {response.status_code}"
+            if attempt < self._retries:
+                logger.warning(f"{error}, retry #{attempt + 1}")
+                await asyncio.sleep(self._retry_backoff * 2**attempt)
+        raise RoutingError(error)
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+    @staticmethod
+    def _parse(response: httpx.Response) -> dict:
+        try:
+            data = response.json()
+        except ValueError:
+            error = f"OSRM returned invalid response: HTTP {response.status_code}"
+            raise RoutingError(error)
+        # Errors like NoRoute/InvalidQuery come with HTTP 400 and are not retried
+        if data.get("code") != "Ok":
+            error = f"OSRM error {data.get('code')}: {data.get('message')}"
+            raise RoutingError(error)
+        return data
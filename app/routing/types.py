@@ -0,0 +1,37 @@
+from typing import NamedTuple, Protocol
+
+import numpy as np
+
+
+class Point(NamedTuple):
+    lat: float
+    lng: float
+
+
+class Route(NamedTuple):
+    distance_km: float
+    duration_minutes: float
+
+
+class RouteMatrix(NamedTuple):
+    """Routes from every source (rows) to every destination (columns), NaN if unreachable."""
+
+    distance_km: np.ndarray
+    duration_minutes: np.ndarray
+
+
+class RouteKey(NamedTuple):
+    """Route cache key, points are quantized."""
+
+    start: Point
+    end: Point
+
+
+class RoutingError(Exception):
+    """Route can not be calculated (no route, routing server is unavailable, etc.)."""
+
+
+class RouteProvider(Protocol):
+    """Anything that can calculate a route between two points."""
+
+    async def route(self, start: Point, end: Point) -> Route: ...
@@ -1,5 +1,7 @@
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.domain.enums import CountMode
+
 
 class BaseSchema(BaseModel):
     """Base schema for all schemas in the project."""
@@ -12,7 +14,11 @@ class BaseSchema(BaseModel):
 class BasePaginationSchema(BaseSchema):
     """Base schema for paginated responses."""
 
-    total: int = Field(..., description="Total number of items")
+    total: int | None = Field(..., description="Total number of items, calculated by `count` mode")
+    count: CountMode = Field(CountMode.EXACT, description="How `total` was calculated")
     items: list = Field(..., description="List of items in the current page")
-    page: int = Field(..., description="Current page number")
+    page: int | None = Field(None, description="Current page number (not set for cursor mode)")
     page_size: int = Field(..., description="Number of items per page")
+    next_cursor: str | None = Field(
+        None, description="Pass it as `after` to get the next page, empty for the last page"
+    )
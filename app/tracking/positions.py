@@ -0,0 +1,230 @@
+import asyncio
+import time
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime
+from logging import getLogger
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+from app.metrics import Histogram
+from app.monitoring.metrics import POSITIONS_FLUSH_DURATION
+
+if TYPE_CHECKING:
+    from app.uow.unit_of_work import UnitOfWork
+
+logger = getLogger(__name__)
+
+
+class Ping(NamedTuple):
+    courier_id: int
+    lat: float
+    lng: float
+    recorded_at: float  # UTC timestamp of the GPS fix (seconds)
+
+
+def merge_latest(*sources: Iterable[Ping]) -> list[Ping]:
+    """The newest ping of every courier from all `sources`, ordered by courier ID."""
+    latest: dict[int, Ping] = {}
+    for pings in sources:
+        for ping in pings:
+            known = latest.get(ping.courier_id)
+            if known is None or ping.recorded_at > known.recorded_at:
+                latest[ping.courier_id] = ping
+    return [latest[courier_id] for courier_id in sorted(latest)]
+
+
+class PositionStore:
+    """
+    Latest position of every courier who sent pings to this worker.
+
+    Positions are kept in flat arrays, one slot per courier (32 bytes), so even 100k couriers
+    take a few megabytes and reading all current positions is a vectorized filter. Couriers
+    whose position changed since the last flush are tracked as dirty slots.
+
+    Positions flushed by all workers are kept as a snapshot refreshed by `PositionFlusher`,
+    so current positions of all couriers are read from memory.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self._slots: dict[int, int] = {}  # slot by courier ID
+        self._ids = np.zeros(capacity, dtype=np.int64)
+        self._coordinates = np.zeros((capacity, 2))  # lat, lng
+        self._recorded_at = np.zeros(capacity)
+        self._dirty: set[int] = set()
+        self._shared: list[Ping] = []  # flushed by all workers
+
+        # Metrics
+        self.pings = 0
+        self.stale = 0  # pings older than the known position, they are ignored
+
+    def update(self, pings: Iterable[Ping]) -> int:
+        """Keep the newest position of every courier, return the number of accepted pings."""
+        accepted = 0
+        for ping in pings:
+            self.pings += 1
+            slot = self._slots.get(ping.courier_id)
+            if slot is None:
+                slot = self._add(ping.courier_id)
+            elif ping.recorded_at <= self._recorded_at[slot]:
+                self.stale += 1
+                continue
+            self._coordinates[slot] = ping.lat, ping.lng
+            self._recorded_at[slot] = ping.recorded_at
+            self._dirty.add(slot)
+            accepted += 1
+        return accepted
+
+    def get(self, courier_id: int) -> Ping | None:
+        slot = self._slots.get(courier_id)
+        if slot is None:
+            return None
+        return self._ping(slot)
+
+    def positions(self, max_age: float, now: float | None = None) -> list[Ping]:
+        """Positions recorded within the last `max_age` seconds."""
+        size = len(self._slots)
+        now = time.time() if now is None else now
+        slots = np.flatnonzero(self._recorded_at[:size] >= now - max_age)
+        return [self._ping(slot) for slot in slots.tolist()]
+
+    def all_positions(self, max_age: float, now: float | None = None) -> list[Ping]:
+        """
+        Positions of all workers recorded within the last `max_age` seconds, by courier ID.
+
+        Positions received by other workers are up to a flush interval old, the newest position
+        of every courier wins.
+        """
+        now = time.time() if now is None else now
+        shared = [ping for ping in self._shared if ping.recorded_at >= now - max_age]
+        return merge_latest(shared, self.positions(max_age, now=now))
+
+    def share(self, pings: list[Ping]) -> None:
+        """Replace the snapshot of positions flushed by all workers."""
+        self._shared = pings
+
+    def take_dirty(self) -> list[Ping]:
+        """Positions changed since the previous call."""
+        dirty, self._dirty = self._dirty, set()
+        return [self._ping(slot) for slot in dirty]
+
+    def mark_dirty(self, courier_ids: Iterable[int]) -> None:
+        """Return positions to the next flush, e.g. when the current one failed."""
+        self._dirty.update(self._slots[courier_id] for courier_id in courier_ids)
+
+    def metrics(self) -> dict:
+        return {
+            "couriers": len(self._slots),
+            "dirty": len(self._dirty),
+            "shared": len(self._shared),
+            "pings": self.pings,
+            "stale": self.stale,
+        }
+
+    def _add(self, courier_id: int) -> int:
+        slot = len(self._slots)
+        if slot == len(self._ids):
+            capacity = 2 * slot
+            self._ids = np.resize(self._ids, capacity)
+            self._coordinates = np.resize(self._coordinates, (capacity, 2))
+            self._recorded_at = np.resize(self._recorded_at, capacity)
+        self._ids[slot] = courier_id
+        self._recorded_at[slot] = -np.inf
+        self._slots[courier_id] = slot
+        return slot
+
+    def _ping(self, slot: int) -> Ping:
+        lat, lng = self._coordinates[slot]
+        return Ping(int(self._ids[slot]), float(lat), float(lng), float(self._recorded_at[slot]))
+
+
+class PositionFlusher:
+    """
+    Write changed positions of the store to Postgres in bulk every `interval` seconds.
+
+    After every flush positions of the last `max_age` seconds flushed by all workers are read
+    back into the store.
+    """
+
+    def __init__(
+        self,
+        store: PositionStore,
+        uow_factory: Callable[[], "UnitOfWork"],
+        interval: float,
+        max_age: float = 0.0,
+    ) -> None:
+        self._store = store
+        self._uow_factory = uow_factory
+        self._interval = interval
+        self._max_age = max_age
+        self._task: asyncio.Task | None = None
+
+        # Metrics
+        self.flushed = 0  # positions written
+        self.failures = 0
+        self.latency = Histogram(exported=POSITIONS_FLUSH_DURATION)  # flush duration (seconds)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop flushing periodically and write the remaining positions."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            # A flush in progress returns its positions to the store when it is cancelled
+            await asyncio.wait([task])
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("Unable to flush courier positions on shutdown.")
+
+    async def flush(self) -> int:
+        """Write changed positions, they are kept for the next flush if it fails."""
+        pings = self._store.take_dirty()
+        if not pings:
+            return 0
+        started = time.perf_counter()
+        try:
+            async with self._uow_factory() as uow:
+                await uow.courier_position.save_latest(pings)
+                await uow.commit()
+        except Exception:
+            self.failures += 1
+            self._store.mark_dirty(ping.courier_id for ping in pings)
+            raise
+        except asyncio.CancelledError:
+            self._store.mark_dirty(ping.courier_id for ping in pings)
+            raise
+        self.latency.observe(time.perf_counter() - started)
+        self.flushed += len(pings)
+        return len(pings)
+
+    async def refresh(self) -> int:
+        """Read positions flushed by all workers into the store, return their number."""
+        recorded_after = datetime.fromtimestamp(time.time() - self._max_age, UTC)
+        async with self._uow_factory() as uow:
+            pings = await uow.courier_position.get_recent(recorded_after.replace(tzinfo=None))
+        self._store.share(pings)
+        return len(pings)
+
+    def metrics(self) -> dict:
+        return {
+            "flushed": self.flushed,
+            "failures": self.failures,
+            "latency": self.latency.snapshot(),
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Unable to flush courier positions, retrying with the next flush.")
+            if self._max_age > 0:
+                try:
+                    await self.refresh()
+                except Exception:
+                    logger.exception("Unable to read courier positions of all workers.")
@@ -0,0 +1,92 @@
+from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime
+from itertools import batched
+
+from sqlalchemy import DateTime, Float, Integer, column, func, select, values
+from sqlalchemy.dialects.postgresql import insert
+
+from app.domain import CourierPosition, User
+from app.routing.types import Point
+from app.tracking.positions import Ping
+from app.uow.repository import BaseModelRepository
+
+# Every row takes 4 parameters, asyncpg allows 32767 per statement
+SAVE_BATCH_SIZE = 5_000
+
+
+class CourierPositionRepository(BaseModelRepository):
+    async def get_all(self) -> Sequence[CourierPosition]:
+        result = await self._session.execute(select(CourierPosition))
+        return result.scalars().all()
+
+    async def get_latest(
+        self, courier_ids: Iterable[int], recorded_after: datetime
+    ) -> dict[int, Point]:
+        """Positions of couriers recorded after the time (UTC) by courier ID."""
+        query = select(
+            CourierPosition.courier_id,
+            func.ST_Y(CourierPosition.position),
+            func.ST_X(CourierPosition.position),
+        ).filter(
+            CourierPosition.courier_id.in_(courier_ids),
+            CourierPosition.recorded_at > recorded_after,
+        )
+        result = await self._session.execute(query)
+        return {courier_id: Point(lat=lat, lng=lng) for courier_id, lat, lng in result}
+
+    async def get_recent(self, recorded_after: datetime) -> list[Ping]:
+        """Positions of all couriers recorded after the time (UTC), flushed by all workers."""
+        query = select(
+            CourierPosition.courier_id,
+            func.ST_Y(CourierPosition.position),
+            func.ST_X(CourierPosition.position),
+            CourierPosition.recorded_at,
+        ).filter(CourierPosition.recorded_at > recorded_after)
+        result = await self._session.execute(query)
+        return [
+            Ping(courier_id, lat, lng, recorded_at.replace(tzinfo=UTC).timestamp())
+            for courier_id, lat, lng, recorded_at in result
+        ]
+
+    async def save_latest(self, pings: Sequence[Ping]) -> None:
+        """
+        Upsert positions of couriers, older than the stored ones are skipped.
+
+        Several workers flush positions of the same courier, so the newest fix wins regardless
+        of the flush order. Pings of deleted users are skipped as well.
+        """
+        for batch in batched(pings, SAVE_BATCH_SIZE):
+            rows = values(
+                column("courier_id", Integer),
+                column("lat", Float),
+                column("lng", Float),
+                column("recorded_at", DateTime),
+                name="pings",
+            ).data(
+                [
+                    (
+                        ping.courier_id,
+                        ping.lat,
+                        ping.lng,
+                        datetime.fromtimestamp(ping.recorded_at, UTC).replace(tzinfo=None),
+                    )
+                    for ping in batch
+                ]
+            )
+            query = insert(CourierPosition).from_select(
+                ["courier_id", "position", "recorded_at"],
+                select(
+                    rows.c.courier_id,
+                    func.ST_SetSRID(func.ST_MakePoint(rows.c.lng, rows.c.lat), 4326),
+                    rows.c.recorded_at,
+                ).join(User, User.id == rows.c.courier_id),
+            )
+            query = query.on_conflict_do_update(
+                index_elements=[CourierPosition.courier_id],
+                set_={
+                    "position": query.excluded.position,
+                    "recorded_at": query.excluded.recorded_at,
+                },
+                where=query.excluded.recorded_at > CourierPosition.recorded_at,
+            )
+            await self._session.execute(query)
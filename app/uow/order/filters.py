@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import Select
+
+from app.domain import Order
+
+
+@dataclass(frozen=True)
+class OrderFilters:
+    """Filters shared by order listings, empty values are not applied."""
+
+    min_distance_km: float | None = None
+    max_distance_km: float | None = None
+    min_duration_minutes: float | None = None
+    max_duration_minutes: float | None = None
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+
+    def apply(self, query: Select) -> Select:
+        if self.min_distance_km is not None:
+            query = query.filter(Order.distance_km >= self.min_distance_km)
+        if self.max_distance_km is not None:
+            query = query.filter(Order.distance_km <= self.max_distance_km)
+        if self.min_duration_minutes is not None:
+            query = query.filter(Order.duration_minutes >= self.min_duration_minutes)
+        if self.max_duration_minutes is not None:
+            query = query.filter(Order.duration_minutes <= self.max_duration_minutes)
+        if self.created_from is not None:
+            query = query.filter(Order.created_at >= self.created_from)
+        if self.created_to is not None:
+            query = query.filter(Order.created_at < self.created_to)
+        return query
@@ -1,35 +1,235 @@
-from collections.abc import Sequence
+import math
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
 
-from sqlalchemy import func, select
+from geoalchemy2 import Geography
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    Row,
+    Select,
+    bindparam,
+    cast,
+    column,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.orm import undefer
 
-from app.domain import Order
+from app.domain import CountMode, Order
+from app.routing.types import Point
+from app.uow.order.filters import OrderFilters
 from app.uow.repository import BaseModelRepository
 
+# Flat columns of exported orders, points are split into coordinates
+EXPORT_COLUMNS = (
+    Order.id,
+    Order.name,
+    Order.description,
+    func.ST_Y(Order.start_point).label("start_lat"),
+    func.ST_X(Order.start_point).label("start_lng"),
+    func.ST_Y(Order.end_point).label("end_lat"),
+    func.ST_X(Order.end_point).label("end_lng"),
+    Order.distance_km,
+    Order.duration_minutes,
+    Order.created_at,
+)
+EXPORT_FIELDS = [column.key for column in EXPORT_COLUMNS]
+
+# Columns of order listings, fields of `ViewOrderSchema` and `created_at` for the cursor
+LIST_COLUMNS = (
+    Order.id,
+    Order.name,
+    Order.description,
+    Order.distance_km,
+    Order.duration_minutes,
+    Order.courier_id,
+    Order.created_at,
+)
+
+# Geometries are deferred in the model, pass to `options()` to load them with orders
+UNDEFER_GEOMETRY = (undefer(Order.start_point), undefer(Order.end_point))
+
+# Built once, see `GET_BY_ID` of users
+GET_BY_ID = select(Order).where(Order.id == bindparam("id"))
+GET_BY_ID_WITH_GEOMETRY = GET_BY_ID.options(*UNDEFER_GEOMETRY)
+
+# The shortest degree of latitude (at the equator), so that the prefilter never undershoots
+KM_PER_DEGREE = 110.57
+# Beyond this latitude every longitude may be within the radius of a pole
+MAX_LAT = 89.0
+MAX_LNG = 180.0
+
+
+def make_point(point: Point) -> ColumnElement:
+    return func.ST_SetSRID(func.ST_MakePoint(point.lng, point.lat), 4326)
+
+
+def radius_in_degrees(center: Point, radius_km: float) -> float:
+    """Radius in degrees that covers `radius_km` around the center (degrees of longitude shrink)."""
+    lat_degrees = radius_km / KM_PER_DEGREE
+    max_lat = abs(center.lat) + lat_degrees
+    if max_lat >= MAX_LAT:
+        return 2 * MAX_LNG
+    return lat_degrees / math.cos(math.radians(max_lat))
+
+
+def within_degrees(center: Point, radius_degrees: float) -> ColumnElement[bool]:
+    """Pickup within the planar radius, also across the antimeridian."""
+    condition = func.ST_DWithin(Order.start_point, make_point(center), radius_degrees)
+    if abs(center.lng) + radius_degrees <= MAX_LNG:
+        return condition
+    # The other side of the antimeridian is near the center shifted by a full turn
+    shifted = Point(lat=center.lat, lng=center.lng - math.copysign(2 * MAX_LNG, center.lng))
+    return or_(condition, func.ST_DWithin(Order.start_point, make_point(shifted), radius_degrees))
+
 
 class OrderRepository(BaseModelRepository):
-    async def get_all(self) -> Sequence[Order]:
+    async def get_all(self, with_geometry: bool = False) -> Sequence[Order]:
         query = select(Order)
+        if with_geometry:
+            query = query.options(*UNDEFER_GEOMETRY)
         result = await self._session.execute(query)
         return result.scalars().all()
 
-    async def get_paginated_all(self, page: int, page_size: int) -> tuple[Sequence[Order], int]:
-        """Get paginated list of orders."""
-        # Fetch orders with pagination parameters
-        offset = (page - 1) * page_size
-        query = select(Order).offset(offset).limit(page_size)
-        result = await self._session.execute(query)
-        orders = result.scalars().all()
+    async def get_paginated_all(
+        self,
+        page: int,
+        page_size: int,
+        after: tuple[datetime, int] | None = None,
+        count: CountMode = CountMode.EXACT,
+        filters: OrderFilters | None = None,
+    ) -> tuple[Sequence[Order], int | None]:
+        """
+        Get paginated list of orders matching the filters ordered by (created_at, id).
+
+        If `after` (created_at, id) of the last seen order is passed, keyset pagination is used
+        instead of OFFSET, so deep pages are as cheap as the first one.
+        """
+        query, keyset = self._listing(select(Order), after=after, filters=filters)
+        return await self._get_page(
+            query,
+            page=page,
+            page_size=page_size,
+            after=keyset,
+            count=count,
+        )
+
+    async def get_paginated_dicts(
+        self,
+        page: int,
+        page_size: int,
+        after: tuple[datetime, int] | None = None,
+        count: CountMode = CountMode.EXACT,
+        filters: OrderFilters | None = None,
+    ) -> tuple[Sequence[dict], int | None]:
+        """
+        Same page as `get_paginated_all`, but as dicts of LIST_COLUMNS.
+
+        ORM objects are not built and geometries are not loaded, the dicts can be serialized as is.
+        """
+        query, keyset = self._listing(select(*LIST_COLUMNS), after=after, filters=filters)
+        return await self._get_page(
+            query,
+            page=page,
+            page_size=page_size,
+            after=keyset,
+            count=count,
+            as_dicts=True,
+        )
 
-        # Count total number of orders
-        count_query = select(func.count()).select_from(Order)
-        total_result = await self._session.execute(count_query)
-        total = total_result.scalar_one()
+    @staticmethod
+    def _listing(
+        query: Select, after: tuple[datetime, int] | None, filters: OrderFilters | None
+    ) -> tuple[Select, ColumnElement[bool] | None]:
+        """Order listing query and its keyset condition."""
+        query = query.order_by(Order.created_at, Order.id)
+        if filters is not None:
+            query = filters.apply(query)
+        keyset = None
+        if after is not None:
+            created_at, id_ = after
+            keyset = tuple_(Order.created_at, Order.id) > tuple_(literal(created_at), literal(id_))
+        return query, keyset
 
-        return orders, total
+    async def get_paginated_within_radius(
+        self,
+        center: Point,
+        radius_km: float,
+        page: int,
+        page_size: int,
+        count: CountMode = CountMode.EXACT,
+    ) -> tuple[Sequence[Order], int | None]:
+        """Orders with pickup within `radius_km` of the center, ordered by ID."""
+        center_point = make_point(center)
+        query = select(Order).filter(
+            # Coarse check in degrees uses GiST index, the exact one measures meters on a spheroid
+            within_degrees(center, radius_in_degrees(center, radius_km)),
+            func.ST_DWithin(
+                cast(Order.start_point, Geography), cast(center_point, Geography), radius_km * 1000
+            ),
+        )
+        return await self._get_page(
+            query.order_by(Order.id), page=page, page_size=page_size, count=count
+        )
+
+    async def get_paginated_within_box(
+        self,
+        south_west: Point,
+        north_east: Point,
+        page: int,
+        page_size: int,
+        count: CountMode = CountMode.EXACT,
+    ) -> tuple[Sequence[Order], int | None]:
+        """Orders with pickup within the bounding box, ordered by ID."""
+        box = func.ST_MakeEnvelope(
+            south_west.lng, south_west.lat, north_east.lng, north_east.lat, 4326
+        )
+        query = select(Order).filter(Order.start_point.intersects(box))
+        return await self._get_page(
+            query.order_by(Order.id), page=page, page_size=page_size, count=count
+        )
+
+    async def get_paginated_nearest(
+        self, center: Point, page: int, page_size: int
+    ) -> Sequence[Order]:
+        """
+        Orders ordered by pickup distance to the center (KNN search by GiST index).
 
-    async def get_by_id(self, id_: int) -> Order | None:
-        query = select(Order).filter(Order.id == id_)
+        The distance is planar (degrees), which is close to the true order for nearby pickups.
+        """
+        query = (
+            select(Order)
+            .order_by(Order.start_point.distance_centroid(make_point(center)), Order.id)
+            .limit(page_size)
+            .offset((page - 1) * page_size)
+        )
         result = await self._session.execute(query)
+        return result.scalars().all()
+
+    async def stream_export(
+        self, filters: OrderFilters, batch_size: int
+    ) -> AsyncIterator[Sequence[Row]]:
+        """
+        Yield filtered orders ordered by ID as batches of rows of EXPORT_COLUMNS.
+
+        Rows are read from a server-side cursor `batch_size` at a time, so memory usage doesn't
+        depend on the number of orders.
+        """
+        query = filters.apply(select(*EXPORT_COLUMNS)).order_by(Order.id)
+        result = await self._session.stream(query.execution_options(yield_per=batch_size))
+        async for partition in result.partitions():
+            yield partition
+
+    async def get_by_id(self, id_: int, with_geometry: bool = False) -> Order | None:
+        query = GET_BY_ID_WITH_GEOMETRY if with_geometry else GET_BY_ID
+        result = await self._session.execute(query, {"id": id_})
         return result.scalar_one_or_none()
 
     async def create(self, flush: bool = False, **data):
@@ -40,32 +240,45 @@ class OrderRepository(BaseModelRepository):
             await self._session.flush([record])
         return record
 
-    async def get_orders_by_distance_range(
-        self, min_distance_km: float | None = None, max_distance_km: float | None = None
-    ) -> Sequence[Order]:
-        """Get orders filtered by distance range."""
-        query = select(Order)
+    async def bulk_create(self, values: list[dict]) -> None:
+        """
+        Insert many orders at once, without loading them back.
 
-        if min_distance_km is not None:
-            query = query.filter(Order.distance_km >= min_distance_km)
-        if max_distance_km is not None:
-            query = query.filter(Order.distance_km <= max_distance_km)
+        SQLAlchemy sends them as multi-row INSERT statements ("insertmanyvalues").
+        """
+        await self._session.execute(insert(Order), values)
 
+    async def get_open_pickups(self, limit: int) -> Sequence[Row]:
+        """Pickups (id, lat, lng) of the oldest orders without a courier."""
+        query = (
+            select(
+                Order.id,
+                func.ST_Y(Order.start_point).label("lat"),
+                func.ST_X(Order.start_point).label("lng"),
+            )
+            .filter(Order.courier_id.is_(None))
+            .order_by(Order.created_at, Order.id)
+            .limit(limit)
+        )
         result = await self._session.execute(query)
-        return result.scalars().all()
-
-    async def get_orders_by_duration_range(
-        self,
-        min_duration_minutes: float | None = None,
-        max_duration_minutes: float | None = None,
-    ) -> Sequence[Order]:
-        """Get orders filtered by duration range."""
-        query = select(Order)
+        return result.all()
 
-        if min_duration_minutes is not None:
-            query = query.filter(Order.duration_minutes >= min_duration_minutes)
-        if max_duration_minutes is not None:
-            query = query.filter(Order.duration_minutes <= max_duration_minutes)
+    async def assign_couriers(self, couriers: dict[int, int]) -> set[int]:
+        """
+        Set couriers of open orders by order ID in one statement, return IDs of assigned orders.
 
+        Orders that got a courier in the meantime are left as they are.
+        """
+        if not couriers:
+            return set()
+        assignments = values(
+            column("order_id", Integer), column("courier_id", Integer), name="assignments"
+        ).data(list(couriers.items()))
+        query = (
+            update(Order)
+            .where(Order.id == assignments.c.order_id, Order.courier_id.is_(None))
+            .values(courier_id=assignments.c.courier_id)
+            .returning(Order.id)
+        )
         result = await self._session.execute(query)
-        return result.scalars().all()
+        return set(result.scalars())
@@ -1,12 +1,115 @@
+import inspect
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import ColumnElement, Select, func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.dependencies.caches import get_count_cache
+from app.domain.base import MinimalBase
+from app.domain.enums import CountMode
+from app.monitoring.database import track_operation
+
+TOTAL_COLUMN = "_total"
+ESTIMATED_COUNT_SQL = "SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"
+
 
 class SqlAlchemyRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Label statements of public methods by their names, e.g. "UserRepository.get_by_id"."""
+        super().__init_subclass__(**kwargs)
+        for name, method in list(vars(cls).items()):
+            is_async = inspect.iscoroutinefunction(method) or inspect.isasyncgenfunction(method)
+            if is_async and not name.startswith("_"):
+                setattr(cls, name, track_operation(f"{cls.__name__}.{name}")(method))
+
 
 class BaseModelRepository(SqlAlchemyRepository):
-    def __init__(self, session: AsyncSession, model: type) -> None:
+    def __init__(self, session: AsyncSession, model: type[MinimalBase]) -> None:
         super().__init__(session=session)
         self._model = model
+
+    async def _get_page(  # noqa: PLR0913
+        self,
+        query: Select,
+        page: int,
+        page_size: int,
+        after: ColumnElement[bool] | None = None,
+        count: CountMode = CountMode.EXACT,
+        as_dicts: bool = False,
+    ) -> tuple[Sequence[Any], int | None]:
+        """
+        Fetch one page of ordered `query` and its total number of rows according to `count` mode.
+
+        `after` is a keyset condition, if it is set OFFSET (page) is not used. Items are the first
+        column of rows (e.g. ORM objects), or whole rows as dicts by column name for `as_dicts`.
+        """
+        page_query = query.limit(page_size)
+        if after is not None:
+            page_query = page_query.filter(after)
+        else:
+            page_query = page_query.offset((page - 1) * page_size)
+
+        # Window count is evaluated before LIMIT/OFFSET: page and total in one round trip.
+        # With keyset condition it would count only the remaining rows, so it is not used there.
+        if count == CountMode.EXACT and after is None:
+            result = await self._session.execute(
+                page_query.add_columns(func.count().over().label(TOTAL_COLUMN))
+            )
+            rows = result.all()
+            if rows:
+                total = rows[0][-1]
+                if as_dicts:
+                    dicts = [row._asdict() for row in rows]
+                    for item in dicts:
+                        del item[TOTAL_COLUMN]
+                    return dicts, total
+                return [row[0] for row in rows], total
+            # Empty page carries no total, e.g. page is out of range
+            return [], 0 if page == 1 else await self._count(query)
+
+        result = await self._session.execute(page_query)
+        items: Sequence[Any] = (
+            [row._asdict() for row in result] if as_dicts else result.scalars().all()
+        )
+        return items, await self._get_total(query, count=count)
+
+    async def _get_total(self, query: Select, count: CountMode) -> int | None:
+        match count:
+            case CountMode.EXACT:
+                return await self._count(query)
+            case CountMode.ESTIMATED if query.whereclause is None:
+                return await self._estimate_count(query)
+            case CountMode.ESTIMATED:
+                # Statistics of the table would be returned as the total of filtered rows
+                return await self._cached_count(query)
+            case CountMode.CACHED:
+                return await self._cached_count(query)
+        return None
+
+    async def _count(self, query: Select) -> int:
+        count_query = select(func.count()).select_from(query.order_by(None).subquery())
+        result = await self._session.execute(count_query)
+        return result.scalar_one()
+
+    async def _estimate_count(self, query: Select) -> int:
+        """Planner statistics of the whole table, only for queries without filters."""
+        result = await self._session.execute(
+            text(ESTIMATED_COUNT_SQL), {"table": self._model.__tablename__}
+        )
+        estimate = result.scalar_one()
+        # -1 means that the table has never been analyzed yet
+        return estimate if estimate >= 0 else await self._count(query)
+
+    async def _cached_count(self, query: Select) -> int:
+        compiled = query.compile()
+        key = (str(compiled), repr(sorted(compiled.params.items())))
+        count_cache = get_count_cache()
+        total = count_cache.get(key)
+        if total is None:
+            total = await self._count(query)
+            count_cache.set(key, total)
+        return total
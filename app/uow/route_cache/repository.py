@@ -0,0 +1,71 @@
+from datetime import timedelta
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.domain import CachedRoute
+from app.routing.types import Route, RouteKey
+from app.uow.repository import BaseModelRepository
+
+
+class RouteCacheRepository(BaseModelRepository):
+    async def get(self, version: str, key: RouteKey) -> tuple[Route, float] | None:
+        """Get a non-expired route and the number of seconds it remains valid."""
+        query = select(
+            CachedRoute.distance_km,
+            CachedRoute.duration_minutes,
+            func.extract("epoch", CachedRoute.expires_at - func.localtimestamp()),
+        ).filter(
+            CachedRoute.dataset_version == version,
+            CachedRoute.start_lat == key.start.lat,
+            CachedRoute.start_lng == key.start.lng,
+            CachedRoute.end_lat == key.end.lat,
+            CachedRoute.end_lng == key.end.lng,
+            CachedRoute.expires_at > func.localtimestamp(),
+        )
+        result = await self._session.execute(query)
+        row = result.one_or_none()
+        if row is None:
+            return None
+        distance_km, duration_minutes, ttl = row
+        return Route(distance_km, duration_minutes), float(ttl)
+
+    async def save(self, version: str, key: RouteKey, route: Route, ttl: float) -> None:
+        """Insert or refresh the route, it is visible to others once the transaction commits."""
+        expires_at = func.localtimestamp() + timedelta(seconds=ttl)
+        query = insert(CachedRoute).values(
+            dataset_version=version,
+            start_lat=key.start.lat,
+            start_lng=key.start.lng,
+            end_lat=key.end.lat,
+            end_lng=key.end.lng,
+            distance_km=route.distance_km,
+            duration_minutes=route.duration_minutes,
+            expires_at=expires_at,
+        )
+        query = query.on_conflict_do_update(
+            index_elements=[
+                CachedRoute.dataset_version,
+                CachedRoute.start_lat,
+                CachedRoute.start_lng,
+                CachedRoute.end_lat,
+                CachedRoute.end_lng,
+            ],
+            set_={
+                "distance_km": query.excluded.distance_km,
+                "duration_minutes": query.excluded.duration_minutes,
+                "expires_at": query.excluded.expires_at,
+            },
+        )
+        await self._session.execute(query)
+
+    async def purge(self) -> int:
+        """
+        Delete expired routes, return their number.
+
+        Routes of other dataset versions are kept until they expire: during a rolling deploy
+        workers of both versions use the table.
+        """
+        query = delete(CachedRoute).where(CachedRoute.expires_at <= func.localtimestamp())
+        result = await self._session.execute(query)
+        return result.rowcount
@@ -1,10 +1,14 @@
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, TypeVar
 
 from sqlalchemy import Executable, Result
 
 from app.db.database import AsyncSQLAlchemy
-from app.domain import Order, User
+from app.domain import CachedRoute, CourierPosition, Order, User
+from app.monitoring.database import track_operation
+from app.uow.courier_position.repository import CourierPositionRepository
 from app.uow.order.repository import OrderRepository
+from app.uow.route_cache.repository import RouteCacheRepository
 from app.uow.user.repository import UserRepository
 
 if TYPE_CHECKING:
@@ -14,31 +18,79 @@ T = TypeVar("T")
 
 
 class UnitOfWork:
+    """
+    Repositories sharing one session.
+
+    The session and repositories are created on first use, so requests that never reach the
+    database (cached, rejected by validation) cost nothing. The session takes a connection from
+    the pool with the first query and keeps it until commit, rollback or `release`.
+    """
+
     def __init__(self, db: AsyncSQLAlchemy) -> None:
         self.session_factory = db.session_factory
         self.engine = db.engine
+        self._session: AsyncSession | None = None
+
+    def fork(self) -> "UnitOfWork":
+        """New unit of work with its own session to the same database."""
+        return UnitOfWork(AsyncSQLAlchemy(session_factory=self.session_factory, engine=self.engine))
 
     async def __aenter__(self) -> "UnitOfWork":
         """Start unit of work here"""
-        self._session: AsyncSession = self.session_factory()
-
-        self.order = OrderRepository(session=self._session, model=Order)
-        self.user = UserRepository(session=self._session, model=User)
-
         return self
 
     async def __aexit__(self, *args) -> None:
         """Close unit of work here"""
-        await self._session.close()
+        await self.release()
+
+    @property
+    def session(self) -> "AsyncSession":
+        if self._session is None:
+            self._session = self.session_factory()
+        return self._session
+
+    @cached_property
+    def order(self) -> OrderRepository:
+        return OrderRepository(session=self.session, model=Order)
 
+    @cached_property
+    def user(self) -> UserRepository:
+        return UserRepository(session=self.session, model=User)
+
+    @cached_property
+    def route_cache(self) -> RouteCacheRepository:
+        return RouteCacheRepository(session=self.session, model=CachedRoute)
+
+    @cached_property
+    def courier_position(self) -> CourierPositionRepository:
+        return CourierPositionRepository(session=self.session, model=CourierPosition)
+
+    async def release(self) -> None:
+        """
+        Return the connection to the pool, e.g. before a slow call to another service.
+
+        Uncommitted changes are discarded and loaded objects are detached with their loaded
+        attributes. The unit of work stays usable, the next query takes a connection again.
+        """
+        if self._session is not None:
+            await self._session.close()
+
+    @track_operation("UnitOfWork.commit")
     async def commit(self) -> None:
-        await self._session.commit()
+        if self._session is not None:
+            await self._session.commit()
+
+    async def rollback(self) -> None:
+        if self._session is not None:
+            await self._session.rollback()
 
+    @track_operation("UnitOfWork.refresh")
     async def refresh(self, instance: T) -> None:
-        await self._session.refresh(instance)
+        await self.session.refresh(instance)
 
     def add(self, instance: T) -> None:
-        self._session.add(instance)
+        self.session.add(instance)
 
-    async def execute(self, query: Executable) -> Result[Any]:
-        return await self._session.execute(query)
+    @track_operation("UnitOfWork.execute")
+    async def execute(self, query: Executable, params: dict | None = None) -> Result[Any]:
+        return await self.session.execute(query, params)
@@ -1,10 +1,18 @@
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 
-from sqlalchemy import func, select
+from sqlalchemy import bindparam, select
 
-from app.domain import User
+from app.domain import CountMode, User, UserRoles
 from app.uow.repository import BaseModelRepository
 
+# Lookups of authentication and login are built once with bound parameters: building a statement
+# and its cache key on every call costs more than the cached compilation it leads to
+GET_BY_ID = select(User).where(User.id == bindparam("user_id"))
+GET_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+
+# Columns of user listings, fields of `ViewProfileSchema`
+LIST_COLUMNS = (User.id, User.email, User.first_name, User.last_name, User.role)
+
 
 class UserRepository(BaseModelRepository):
     async def get_all(self) -> Sequence[User]:
@@ -12,31 +20,57 @@ class UserRepository(BaseModelRepository):
         result = await self._session.execute(query)
         return result.scalars().all()
 
-    async def get_paginated_all(self, page: int, page_size: int) -> tuple[Sequence[User], int]:
-        """Get paginated list of users."""
-        # Fetch users with pagination parameters
-        offset = (page - 1) * page_size
-        query = select(User).offset(offset).limit(page_size)
-        result = await self._session.execute(query)
-        users = result.scalars().all()
+    async def get_paginated_all(
+        self,
+        page: int,
+        page_size: int,
+        after: int | None = None,
+        count: CountMode = CountMode.EXACT,
+    ) -> tuple[Sequence[User], int | None]:
+        """
+        Get paginated list of users ordered by id.
 
-        # Count total number of users
-        count_query = select(func.count()).select_from(User)
-        total_result = await self._session.execute(count_query)
-        total = total_result.scalar_one()
+        If `after` (id of the last seen user) is passed, keyset pagination is used
+        instead of OFFSET.
+        """
+        return await self._get_page(
+            select(User).order_by(User.id),
+            page=page,
+            page_size=page_size,
+            after=User.id > after if after is not None else None,
+            count=count,
+        )
 
-        return users, total
+    async def get_paginated_dicts(
+        self,
+        page: int,
+        page_size: int,
+        after: int | None = None,
+        count: CountMode = CountMode.EXACT,
+    ) -> tuple[Sequence[dict], int | None]:
+        """Same page as `get_paginated_all`, but as dicts of LIST_COLUMNS, without ORM objects."""
+        return await self._get_page(
+            select(*LIST_COLUMNS).order_by(User.id),
+            page=page,
+            page_size=page_size,
+            after=User.id > after if after is not None else None,
+            count=count,
+            as_dicts=True,
+        )
 
     async def get_by_id(self, user_id: int) -> User | None:
-        query = select(User).filter(User.id == user_id)
-        result = await self._session.execute(query)
+        result = await self._session.execute(GET_BY_ID, {"user_id": user_id})
         return result.scalar_one_or_none()
 
     async def get_by_email(self, email: str) -> User | None:
-        query = select(User).filter(User.email == email)
-        result = await self._session.execute(query)
+        result = await self._session.execute(GET_BY_EMAIL, {"email": email})
         return result.scalar_one_or_none()
 
+    async def get_couriers(self, user_ids: Iterable[int]) -> Sequence[User]:
+        query = select(User).filter(User.id.in_(user_ids), User.role == UserRoles.COURIER)
+        result = await self._session.execute(query)
+        return result.scalars().all()
+
     async def create(self, flush: bool = False, **data):
         """Create a new record in DB."""
         record = self._model(**data)
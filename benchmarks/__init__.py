@@ -0,0 +1,4 @@
+import os
+
+# Settings require SECRET_KEY, benchmarks should run without a .env file
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
@@ -0,0 +1,75 @@
+"""
+Courier to order assignment at 1k x 1k: cost matrix and solvers.
+
+Couriers and pickups are random points around Kyiv.
+
+Usage: python -m benchmarks.assignment
+"""
+
+import math
+
+import numpy as np
+
+from app.dispatch.assignment import (
+    EARTH_RADIUS_KM,
+    Assignment,
+    Solver,
+    assign,
+    haversine_matrix,
+)
+from benchmarks.utils import per_call_us, print_results
+
+COURIERS = 1_000
+ORDERS = 1_000
+KYIV_BOX = ((50.3, 30.3), (50.6, 30.8))
+
+
+def haversine_loop(sources: list, destinations: list) -> list[list[float]]:
+    """Pure Python matrix, the baseline for the vectorized one."""
+    matrix = []
+    for lat1, lng1 in sources:
+        row = []
+        for lat2, lng2 in destinations:
+            phi1, phi2 = math.radians(lat1), math.radians(lat2)
+            d_phi, d_lambda = phi2 - phi1, math.radians(lng2 - lng1)
+            a = (
+                math.sin(d_phi / 2) ** 2
+                + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+            )
+            row.append(2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a)))
+        matrix.append(row)
+    return matrix
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    couriers = rng.uniform(*KYIV_BOX, size=(COURIERS, 2))
+    pickups = rng.uniform(*KYIV_BOX, size=(ORDERS, 2))
+    couriers_list, pickups_list = couriers.tolist(), pickups.tolist()
+
+    print_results(
+        f"Cost matrix {COURIERS} x {ORDERS}",
+        {
+            "python loops": per_call_us(lambda: haversine_loop(couriers_list, pickups_list), 1)
+            / 1000,
+            "numpy": per_call_us(lambda: haversine_matrix(couriers, pickups), 1) / 1000,
+        },
+        unit="ms",
+    )
+
+    cost = haversine_matrix(couriers, pickups)
+    results, totals = {}, {}
+    for solver in Solver:
+
+        def solve(solver: Solver = solver) -> list[Assignment]:
+            return assign(cost, solver)
+
+        totals[solver] = sum(item.cost for item in solve())
+        results[f"{solver} (total {totals[solver]:.0f} km)"] = per_call_us(solve, 1) / 1000
+    print_results(f"Solvers {COURIERS} x {ORDERS}", results, unit="ms")
+    gap = totals[Solver.GREEDY] / totals[Solver.OPTIMAL] - 1
+    print(f"  greedy total is {gap:.1%} above optimal")
+
+
+if __name__ == "__main__":
+    main()
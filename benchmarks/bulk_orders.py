@@ -0,0 +1,79 @@
+"""
+Compare order creation throughput of `POST /orders` with `POST /orders/bulk`.
+
+Requires a migrated database from DATABASE_URI. Created orders are deleted at the end.
+
+Usage: python -m benchmarks.bulk_orders
+"""
+
+import asyncio
+import json
+import random
+import time
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+
+from app.db.session import db_session_manager
+from app.main import fastapi_app
+from app.uow.unit_of_work import UnitOfWork
+from benchmarks.utils import print_results
+
+ORDERS = 5_000
+NAME_PREFIX = "benchmark-bulk-"
+
+
+def build_order(index: int) -> dict:
+    return {
+        "name": f"{NAME_PREFIX}{index}",
+        "start_point": {"lat": 50 + random.random(), "lng": 30 + random.random()},
+        "end_point": {"lat": 50 + random.random(), "lng": 30 + random.random()},
+        "distance_km": random.random() * 100,
+        "duration_minutes": random.random() * 120,
+    }
+
+
+async def one_by_one(client: AsyncClient, orders: list[dict]) -> None:
+    for order in orders:
+        response = await client.post("/api/v1/orders", json=order)
+        response.raise_for_status()
+
+
+async def bulk(client: AsyncClient, orders: list[dict], media_type: str) -> None:
+    if media_type == "application/x-ndjson":
+        content = "\n".join(json.dumps(order) for order in orders)
+    else:
+        content = json.dumps(orders)
+    response = await client.post(
+        "/api/v1/orders/bulk", content=content, headers={"Content-Type": media_type}
+    )
+    response.raise_for_status()
+    assert response.json()["created"] == len(orders)  # noqa: S101
+
+
+async def main() -> None:
+    orders = [build_order(index) for index in range(ORDERS)]
+    transport = ASGITransport(app=fastapi_app)
+    results = {}
+    async with AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        for name, upload in (
+            ("POST /orders one by one", one_by_one(client, orders)),
+            ("POST /orders/bulk JSON array", bulk(client, orders, "application/json")),
+            ("POST /orders/bulk NDJSON", bulk(client, orders, "application/x-ndjson")),
+        ):
+            started = time.perf_counter()
+            await upload
+            results[name] = (time.perf_counter() - started) / ORDERS * 1_000_000
+
+    async with UnitOfWork(db_session_manager.get_db()) as uow:
+        await uow.execute(
+            text("DELETE FROM orders WHERE name LIKE :prefix"), {"prefix": f"{NAME_PREFIX}%"}
+        )
+        await uow.commit()
+    await db_session_manager.dispose()
+
+    print_results(f"Creating {ORDERS:,} orders", results, unit="ms/1k orders")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
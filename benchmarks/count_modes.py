@@ -0,0 +1,59 @@
+"""
+Compare `count` modes of the orders listing on different table sizes.
+
+Requires a migrated database from DATABASE_URI. All rows are inserted inside one transaction
+which is rolled back at the end, so the database is left untouched.
+
+Usage: python -m benchmarks.count_modes
+"""
+
+import asyncio
+import time
+
+from sqlalchemy import text
+
+from app.db.session import db_session_manager
+from app.dependencies.caches import get_count_cache
+from app.domain import CountMode
+from app.uow.unit_of_work import UnitOfWork
+from benchmarks.utils import print_results
+
+TABLE_SIZES = (10_000, 100_000, 1_000_000)
+REPEAT = 20
+
+INSERT_ORDERS_SQL = """
+INSERT INTO orders (name, start_point, end_point, distance_km, duration_minutes)
+SELECT
+    'Order ' || n,
+    ST_SetSRID(ST_MakePoint(30 + random(), 50 + random()), 4326),
+    ST_SetSRID(ST_MakePoint(30 + random(), 50 + random()), 4326),
+    random() * 100,
+    random() * 120
+FROM generate_series(1, :rows) AS n
+"""
+
+
+async def measure(uow: UnitOfWork, count: CountMode) -> float:
+    """Return average latency of the first listing page in milliseconds."""
+    get_count_cache().clear()
+    started = time.perf_counter()
+    for _ in range(REPEAT):
+        await uow.order.get_paginated_all(page=1, page_size=20, count=count)
+    return (time.perf_counter() - started) / REPEAT * 1000
+
+
+async def main() -> None:
+    async with UnitOfWork(db_session_manager.get_db()) as uow:
+        inserted = 0
+        for size in TABLE_SIZES:
+            await uow.execute(text(INSERT_ORDERS_SQL), {"rows": size - inserted})
+            await uow.execute(text("ANALYZE orders"))
+            inserted = size
+            results = {mode.value: await measure(uow, mode) for mode in CountMode}
+            print_results(f"Orders listing with {size:,} rows", results, unit="ms")
+        await uow.rollback()
+    await db_session_manager.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,58 @@
+"""
+Compare event loop stalls of inline bcrypt with the process pool hasher.
+
+Usage: python -m benchmarks.hashing
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+from app.api.authentication.hashing import PasswordHasher, get_password_hash
+from benchmarks.utils import print_results
+
+HASHES = 8
+TICK_SECONDS = 0.001
+
+
+async def max_loop_lag(work: Callable[[], Awaitable[object]]) -> float:
+    """Run work while a ticker measures the worst event loop delay (ms)."""
+    lag = 0.0
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+        nonlocal lag
+        while not done.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(TICK_SECONDS)
+            lag = max(lag, time.perf_counter() - started - TICK_SECONDS)
+
+    ticker_task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    await work()
+    done.set()
+    await ticker_task
+    return lag * 1000
+
+
+async def main() -> None:
+    async def inline() -> None:
+        for _ in range(HASHES):
+            get_password_hash("benchmark")
+
+    hasher = PasswordHasher(max_workers=2, max_concurrency=2, queue_timeout=60)
+    await hasher.hash("warm-up")  # spawn the pool workers before measuring
+
+    async def pooled() -> None:
+        await asyncio.gather(*(hasher.hash("benchmark") for _ in range(HASHES)))
+
+    results = {
+        "inline bcrypt": await max_loop_lag(inline),
+        "process pool": await max_loop_lag(pooled),
+    }
+    hasher.shutdown()
+    print_results(f"Max event loop stall while hashing {HASHES} passwords", results, unit="ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
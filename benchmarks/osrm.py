@@ -0,0 +1,73 @@
+"""
+Compare a new HTTP connection per OSRM request with the pooled keep-alive client.
+
+Routes are calculated by the fake OSRM server (tests/fake_osrm.py) started on a local port.
+
+Usage: python -m benchmarks.osrm
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+import httpx
+import uvicorn
+
+from app.routing.osrm import OsrmClient, build_http_client
+from app.routing.types import Point
+from benchmarks.utils import print_results
+from tests.fake_osrm import FakeOsrmServer
+
+PORT = 9011
+BASE_URL = f"http://127.0.0.1:{PORT}"
+ROUTES = 500
+CONCURRENCY = 20
+START = Point(lat=50.4501, lng=30.5234)
+END = Point(lat=50.5111, lng=30.7906)
+
+
+async def ms_per_route(route: Callable[[Point, Point], Awaitable[object]]) -> float:
+    """Wall time of ROUTES concurrent lookups divided by their number."""
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def one() -> None:
+        async with semaphore:
+            await route(START, END)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(ROUTES)))
+    return (time.perf_counter() - started) / ROUTES * 1000
+
+
+async def main() -> None:
+    config = uvicorn.Config(FakeOsrmServer().app, port=PORT, log_level="warning")
+    server = uvicorn.Server(config)
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:  # noqa: ASYNC110 uvicorn has no "started" event
+        await asyncio.sleep(0.01)
+
+    async def new_connection(start: Point, end: Point) -> None:
+        # Keep-alive is disabled, so every request opens a new TCP connection
+        limits = httpx.Limits(max_keepalive_connections=0)
+        async with httpx.AsyncClient(base_url=BASE_URL, limits=limits) as http_client:
+            await OsrmClient(http_client).route(start, end)
+
+    pooled_client = OsrmClient(
+        build_http_client(BASE_URL, timeout=5, max_connections=CONCURRENCY),
+        max_concurrency=CONCURRENCY,
+    )
+
+    results = {
+        "new connection per request": await ms_per_route(new_connection),
+        "pooled keep-alive client": await ms_per_route(pooled_client.route),
+    }
+    await pooled_client.close()
+    server.should_exit = True
+    await server_task
+    print_results(
+        f"OSRM route lookups ({ROUTES} routes, {CONCURRENCY} concurrent)", results, unit="ms/route"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
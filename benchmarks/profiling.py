@@ -0,0 +1,90 @@
+"""
+Overhead of the profiling middleware per request: when the request isn't selected (the usual
+case) and when it is profiled. The app is a bare ASGI app, so only the middleware is measured.
+
+Usage: python -m benchmarks.profiling
+"""
+
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.monitoring.middleware import ProfilingMiddleware
+from app.monitoring.profiling import RequestProfiler
+from benchmarks.utils import print_results
+
+NUMBER = 20_000
+PROFILED_NUMBER = 20
+HEADERS = [
+    (b"host", b"api.example.com"),
+    (b"user-agent", b"Mozilla/5.0"),
+    (b"accept", b"application/json"),
+    (b"accept-encoding", b"gzip, deflate, br"),
+    (b"authorization", b"Bearer eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9"),
+    (b"connection", b"keep-alive"),
+]
+
+
+async def app(scope: Scope, receive: Receive, send: Send) -> None:  # noqa: ARG001
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+async def receive() -> Message:
+    return {"type": "http.request", "body": b""}
+
+
+async def send(_: Message) -> None:
+    pass
+
+
+async def per_request_us(asgi_app: ASGIApp, headers: list, number: int) -> float:
+    scope = {"type": "http", "method": "GET", "path": "/api/v1/orders", "headers": headers}
+    started = time.perf_counter()
+    for _ in range(number):
+        await asgi_app(scope, receive, send)
+    return (time.perf_counter() - started) / number * 1_000_000
+
+
+def create_profiler(directory: Path) -> RequestProfiler:
+    return RequestProfiler(
+        directory=directory,
+        secret="secret",  # noqa: S106
+        interval=0.001,
+        max_per_minute=PROFILED_NUMBER,
+        max_profiles=PROFILED_NUMBER,
+    )
+
+
+async def run(directory: Path) -> None:
+    profiler = create_profiler(directory)
+    middleware = ProfilingMiddleware(app, profiler=profiler)
+    results = {
+        "no middleware": await per_request_us(app, HEADERS, NUMBER),
+        "middleware, not selected": await per_request_us(middleware, HEADERS, NUMBER),
+    }
+    profiler.enable_sampling(rate=0.01, duration=60)
+    results["middleware, sampling 1% (limited)"] = await per_request_us(middleware, HEADERS, NUMBER)
+    sampling_metrics = profiler.metrics()
+
+    # Sampling has used up the rate limit of the profiler
+    profiler = create_profiler(directory)
+    middleware = ProfilingMiddleware(app, profiler=profiler)
+    token, _ = profiler.issue_token(ttl=60)
+    results["middleware, profiled"] = await per_request_us(
+        middleware, [*HEADERS, (b"x-profile", token.encode())], PROFILED_NUMBER
+    )
+    print_results("Profiling middleware per request", results)
+    print(f"  sampling: {sampling_metrics}")
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(run(Path(directory)))
+
+
+if __name__ == "__main__":
+    main()
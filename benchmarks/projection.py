@@ -0,0 +1,83 @@
+"""
+Compare loading a page of orders with geometries, with deferred geometries and as listing columns.
+
+Requires a migrated database from DATABASE_URI. Rows are inserted inside one transaction which
+is rolled back at the end, so the database is left untouched.
+
+Usage: python -m benchmarks.projection
+"""
+
+import asyncio
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy import select, text
+
+from app.db.session import db_session_manager
+from app.domain import Order
+from app.uow.order.repository import UNDEFER_GEOMETRY
+from app.uow.unit_of_work import UnitOfWork
+from benchmarks.count_modes import INSERT_ORDERS_SQL
+from benchmarks.utils import print_results
+
+TABLE_SIZE = 10_000
+PAGE_SIZE = 100
+REPEAT = 50
+
+
+async def measure(load: Callable[[], Awaitable[object]]) -> tuple[float, float]:
+    """Return average latency (ms) and peak memory of one call (KiB)."""
+    await load()  # warm up statement caches
+    started = time.perf_counter()
+    for _ in range(REPEAT):
+        await load()
+    latency = (time.perf_counter() - started) / REPEAT * 1000
+
+    tracemalloc.start()
+    await load()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return latency, peak / 1024
+
+
+async def main() -> None:
+    async with UnitOfWork(db_session_manager.get_db()) as uow:
+        await uow.execute(text(INSERT_ORDERS_SQL), {"rows": TABLE_SIZE})
+        await uow.execute(text("ANALYZE orders"))
+        page = select(Order).order_by(Order.created_at, Order.id).limit(PAGE_SIZE)
+
+        # Orders are not kept, so the identity map (weak references) doesn't reuse them
+        async def with_geometry() -> object:
+            result = await uow.execute(page.options(*UNDEFER_GEOMETRY))
+            return len(result.scalars().all())
+
+        async def deferred() -> object:
+            result = await uow.execute(page)
+            return len(result.scalars().all())
+
+        async def columns() -> object:
+            return await uow.order.get_paginated_dicts(page=1, page_size=PAGE_SIZE)
+
+        loads = {
+            "ORM objects with geometry": with_geometry,
+            "ORM objects, deferred geometry": deferred,
+            "listing columns (dicts)": columns,
+        }
+        results = {name: await measure(load) for name, load in loads.items()}
+        print_results(
+            f"Page of {PAGE_SIZE} orders, latency",
+            {name: latency for name, (latency, _) in results.items()},
+            unit="ms",
+        )
+        print_results(
+            f"Page of {PAGE_SIZE} orders, peak memory",
+            {name: memory for name, (_, memory) in results.items()},
+            unit="KiB",
+        )
+        await uow.rollback()
+    await db_session_manager.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
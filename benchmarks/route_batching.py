@@ -0,0 +1,65 @@
+"""
+Compare direct OSRM lookups with coalesced ones under a burst of concurrent lookups.
+
+The fake OSRM server (tests/fake_osrm.py) answers every request after a fixed latency.
+
+Usage: python -m benchmarks.route_batching
+"""
+
+import asyncio
+import random
+import time
+
+import httpx
+
+from app.routing.batching import RouteBatcher
+from app.routing.osrm import OsrmClient
+from app.routing.types import Point, RouteProvider
+from benchmarks.utils import print_results
+from tests.fake_osrm import FakeOsrmServer
+
+LOOKUPS = 1_000
+POINTS = 30
+OSRM_LATENCY = 0.01
+MAX_CONNECTIONS = 20
+
+
+async def burst(provider: RouteProvider, pairs: list[tuple[Point, Point]]) -> float:
+    """Wall time (ms) of looking all pairs up at once."""
+    started = time.perf_counter()
+    await asyncio.gather(*(provider.route(start, end) for start, end in pairs))
+    return (time.perf_counter() - started) * 1000
+
+
+def build_client(osrm_server: FakeOsrmServer) -> OsrmClient:
+    http_client = httpx.AsyncClient(transport=osrm_server.transport(), base_url="http://osrm")
+    return OsrmClient(http_client, max_concurrency=MAX_CONNECTIONS)
+
+
+async def main() -> None:
+    random.seed(0)
+    points = [Point(lat=50 + random.random(), lng=30 + random.random()) for _ in range(POINTS)]
+    pairs = [(random.choice(points), random.choice(points)) for _ in range(LOOKUPS)]
+
+    direct_server = FakeOsrmServer(latency=OSRM_LATENCY)
+    direct = await burst(build_client(direct_server), pairs)
+
+    batched_server = FakeOsrmServer(latency=OSRM_LATENCY)
+    batcher = RouteBatcher(build_client(batched_server), window=0.005, max_batch_size=50)
+    batched = await burst(batcher, pairs)
+
+    distinct = len(set(pairs))
+    print_results(
+        f"{LOOKUPS} concurrent lookups of {distinct} distinct routes, OSRM latency "
+        f"{OSRM_LATENCY * 1000:.0f} ms",
+        {
+            f"direct ({direct_server.requests} OSRM calls)": direct,
+            f"coalesced ({batched_server.requests} OSRM calls, "
+            f"{batched_server.table_cells} table cells)": batched,
+        },
+        unit="ms",
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,86 @@
+"""
+Compare the default `response_model` path with the fast serialization path for an orders page.
+
+Default: 100 ORM objects are validated against `OrdersSchema` and serialized like FastAPI does
+(`serialize_response`), then rendered by `JSONResponse`. Fast: 100 dicts of listing columns are
+dumped to JSON by the prebuilt `TypeAdapter`. Loading rows from the database is not measured,
+building ORM objects only adds to the default path.
+
+Usage: python -m benchmarks.serialization
+"""
+
+import random
+from datetime import UTC, datetime
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+
+from app.api.orders.schemas import orders_page_adapter
+from app.api.orders.views import router
+from app.api.serialization import json_response
+from app.domain import CountMode, Order
+from app.uow.order.repository import LIST_COLUMNS
+from benchmarks.utils import per_call_us, print_results
+
+PAGE_SIZE = 100
+NUMBER = 200
+
+
+def make_orders() -> list[Order]:
+    created_at = datetime.now(UTC)
+    return [
+        Order(
+            id=id_,
+            name=f"Order {id_}",
+            description="Leave at the door" if id_ % 2 else None,
+            distance_km=random.uniform(1, 50),
+            duration_minutes=random.uniform(5, 90),
+            courier_id=random.choice([None, 1, 2]),
+            created_at=created_at,
+        )
+        for id_ in range(1, PAGE_SIZE + 1)
+    ]
+
+
+def make_page(items: list) -> dict:
+    return {
+        "items": items,
+        "total": 10_000,
+        "count": CountMode.EXACT,
+        "page": 1,
+        "page_size": PAGE_SIZE,
+        "next_cursor": None,
+    }
+
+
+def main() -> None:
+    route = next(
+        route
+        for route in router.routes
+        if isinstance(route, APIRoute) and route.path == "/orders" and "GET" in route.methods
+    )
+    field = route.response_field
+    if field is None:
+        error = "GET /orders has no response model."
+        raise RuntimeError(error)
+
+    orders = make_orders()
+    rows = [{column.key: getattr(order, column.key) for column in LIST_COLUMNS} for order in orders]
+
+    def response_model() -> bytes:
+        # Same steps as fastapi.routing.serialize_response for pydantic v2
+        value, _ = field.validate(make_page(orders), {}, loc=("response",))
+        return JSONResponse(field.serialize(value)).body
+
+    def fast() -> bytes:
+        return json_response(orders_page_adapter, make_page(rows)).body
+
+    results = {
+        "response_model (ORM objects)": per_call_us(response_model, NUMBER),
+        "TypeAdapter (row dicts)": per_call_us(fast, NUMBER),
+    }
+    print_results(f"Orders page of {PAGE_SIZE} items", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+"""
+Compare building Settings on every request with the cached worker snapshot.
+
+Usage: python -m benchmarks.settings
+"""
+
+from app.config import Settings
+from app.dependencies.settings import get_settings
+from benchmarks.utils import per_call_us, print_results
+
+NUMBER = 2_000
+
+
+def main() -> None:
+    results = {
+        "Settings() per request": per_call_us(lambda: Settings(), number=NUMBER),  # type: ignore[call-arg]
+        "get_settings() snapshot": per_call_us(get_settings, number=NUMBER),
+    }
+    print_results("Settings dependency cost", results)
+
+
+if __name__ == "__main__":
+    main()
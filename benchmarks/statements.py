@@ -0,0 +1,79 @@
+"""
+Compare Python overhead of the user lookup built per call, as a lambda statement and prebuilt.
+
+Statements are executed through an ORM session on in-memory SQLite, so the time is dominated by
+SQLAlchemy (statement construction, cache key, compiled cache, ORM loading), not the database.
+
+Usage: python -m benchmarks.statements
+"""
+
+from sqlalchemy import create_engine, lambda_stmt, select
+from sqlalchemy.orm import Session
+
+from app.domain import User, UserRoles
+from app.uow.user.repository import GET_BY_ID
+from benchmarks.utils import per_call_us, print_results
+
+NUMBER = 5_000
+
+
+def main() -> None:
+    engine = create_engine("sqlite://")
+    User.__table__.create(engine)  # type: ignore[attr-defined]
+    with Session(engine) as session:
+        session.add(
+            User(
+                id=1,
+                email="admin@example.com",
+                first_name="John",
+                last_name="Doe",
+                role=UserRoles.ADMIN,
+                hashed_password="hash",  # noqa: S106
+            )
+        )
+        session.commit()
+
+        user_id = 1
+
+        def per_call() -> object:
+            query = select(User).filter(User.id == user_id)
+            return session.execute(query).scalar_one_or_none()
+
+        def lambda_statement() -> object:
+            query = lambda_stmt(lambda: select(User).where(User.id == user_id))
+            return session.execute(query).scalar_one_or_none()
+
+        def prebuilt() -> object:
+            return session.execute(GET_BY_ID, {"user_id": user_id}).scalar_one_or_none()
+
+        print_results(
+            "User lookup by ID, statement construction and cache key",
+            {
+                "select() per call": per_call_us(
+                    lambda: select(User).filter(User.id == user_id)._generate_cache_key(),
+                    NUMBER,
+                ),
+                "lambda_stmt": per_call_us(
+                    lambda: lambda_stmt(
+                        lambda: select(User).where(User.id == user_id)
+                    )._generate_cache_key(),
+                    NUMBER,
+                ),
+                # The key is memoized on the statement object
+                "prebuilt + bindparam": per_call_us(
+                    lambda: GET_BY_ID._generate_cache_key(), NUMBER
+                ),
+            },
+        )
+        print_results(
+            "User lookup by ID, whole session.execute()",
+            {
+                "select() per call": per_call_us(per_call, NUMBER),
+                "lambda_stmt": per_call_us(lambda_statement, NUMBER),
+                "prebuilt + bindparam": per_call_us(prebuilt, NUMBER),
+            },
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Compare JWT verification on every request with the verified-token cache.
+
+Requests are sent to a bare FastAPI app (no middlewares) whose only route depends on the
+verification, so dependency resolution (and the threadpool for sync dependencies) is measured.
+All variants get settings from the same dependency as the app does.
+
+Usage: python -m benchmarks.token_cache
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from typing import Any
+
+import jwt
+from fastapi import Depends, FastAPI
+from fastapi.security import HTTPAuthorizationCredentials
+from starlette.types import ASGIApp, Message
+
+from app.api.authentication.utils import auth_schema, generate_access_token, get_token_payload
+from app.config import Settings
+from app.dependencies.caches import get_token_cache
+from app.dependencies.settings import get_settings
+from app.domain import User, UserRoles
+from benchmarks.utils import print_results
+
+NUMBER = 5_000
+
+
+def decode_sync(
+    token: HTTPAuthorizationCredentials = Depends(auth_schema),
+    settings: Settings = Depends(get_settings),
+) -> dict:
+    return jwt.decode(token.credentials, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+
+
+async def decode_async(
+    token: HTTPAuthorizationCredentials = Depends(auth_schema),
+    settings: Settings = Depends(get_settings),
+) -> dict:
+    return jwt.decode(token.credentials, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+
+
+def create_app(dependency: Callable[..., Any]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/")
+    async def view(payload: dict = Depends(dependency)) -> dict:
+        return payload
+
+    return app
+
+
+async def per_request_us(app: ASGIApp, access_token: str) -> float:
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "query_string": b"",
+        "headers": [(b"authorization", f"Bearer {access_token}".encode())],
+    }
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b""}
+
+    async def send(_: Message) -> None:
+        pass
+
+    started = time.perf_counter()
+    for _ in range(NUMBER):
+        await app(scope, receive, send)
+    return (time.perf_counter() - started) / NUMBER * 1_000_000
+
+
+async def run() -> None:
+    settings = get_settings()
+    user = User(id=1, email="bob.feta@example.com", first_name="Bob", last_name="Feta")
+    user.role = UserRoles.ADMIN
+    access_token = generate_access_token(
+        user,
+        exp_minutes=settings.ACCESS_TOKEN_EXP_MINUTES,
+        secret_key=settings.SECRET_KEY,
+        algorithm=settings.ALGORITHM,
+    )
+
+    results = {
+        "jwt.decode, sync dependency": await per_request_us(create_app(decode_sync), access_token),
+        "jwt.decode, async dependency": await per_request_us(
+            create_app(decode_async), access_token
+        ),
+        "get_token_payload (cached)": await per_request_us(
+            create_app(get_token_payload), access_token
+        ),
+    }
+    print_results("Verified JWT payload per request", results)
+    print(f"  token cache: {get_token_cache().metrics()}")
+
+
+def main() -> None:
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Compare pool pressure of mixed traffic when connections are held for the whole request and
+when they are released before slow calls to other services.
+
+Traffic: requests served from caches (no queries), listings and requests that look up the user
+and then wait for OSRM before their next query. Requires a migrated database from DATABASE_URI,
+nothing is written.
+
+Usage: python -m benchmarks.unit_of_work
+"""
+
+import asyncio
+import random
+import time
+
+from sqlalchemy import text
+
+from app.db.database import DatabaseSessionManager
+from app.dependencies.settings import get_settings
+from app.uow.unit_of_work import UnitOfWork
+from benchmarks.utils import print_results
+
+REQUESTS = 500
+CONCURRENCY = 50
+POOL_SIZE = 5
+OSRM_LATENCY = 0.02
+KINDS = ("cached", "listing", "external")
+
+
+async def handle(database: DatabaseSessionManager, kind: str, release: bool) -> None:
+    async with UnitOfWork(database.get_db()) as uow:
+        if kind == "cached":
+            await asyncio.sleep(0)
+            return
+        await uow.user.get_by_id(user_id=1)  # authentication
+        if kind == "listing":
+            await uow.order.get_paginated_dicts(page=1, page_size=20)
+            return
+        if release:
+            await uow.release()
+        await asyncio.sleep(OSRM_LATENCY)
+        await uow.execute(text("SELECT 1"))
+
+
+async def run(release: bool) -> dict:
+    database = DatabaseSessionManager(
+        get_settings().DATABASE_URI, pool_size=POOL_SIZE, max_overflow=0
+    )
+    random.seed(0)
+    kinds = random.choices(KINDS, k=REQUESTS)
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def limited(kind: str) -> None:
+        async with semaphore:
+            await handle(database, kind, release=release)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(limited(kind) for kind in kinds))
+    elapsed = time.perf_counter() - started
+    metrics = database.pool_metrics()
+    await database.dispose()
+    wait = metrics["wait"]
+    return {"elapsed": elapsed * 1000, "wait": wait["sum"] / wait["count"] * 1000}
+
+
+async def main() -> None:
+    held = await run(release=False)
+    released = await run(release=True)
+    title = f"{REQUESTS} requests, {CONCURRENCY} concurrent, pool of {POOL_SIZE}"
+    print_results(
+        f"{title}: total time",
+        {"connection held": held["elapsed"], "released before OSRM": released["elapsed"]},
+        unit="ms",
+    )
+    print_results(
+        f"{title}: mean checkout wait",
+        {"connection held": held["wait"], "released before OSRM": released["wait"]},
+        unit="ms",
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
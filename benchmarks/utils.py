@@ -0,0 +1,18 @@
+import timeit
+from collections.abc import Callable
+
+
+def per_call_us(func: Callable[[], object], number: int) -> float:
+    """Return the best average time of one call in microseconds."""
+    best = min(timeit.repeat(func, number=number, repeat=5))
+    return best / number * 1_000_000
+
+
+def print_results(title: str, results: dict[str, float], unit: str = "us/call") -> None:
+    """Print benchmark results as a simple aligned table."""
+    print(f"\n{title}")
+    width = max(len(name) for name in results)
+    baseline = next(iter(results.values()))
+    for name, value in results.items():
+        ratio = baseline / value if value else float("inf")
+        print(f"  {name:<{width}}  {value:>12.2f} {unit}  (x{ratio:.1f})")
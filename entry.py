@@ -1,5 +1,8 @@
 #!venv/bin/python
 
+import os
+from pathlib import Path
+
 import uvicorn
 
 from app.dependencies.settings import get_settings
@@ -8,6 +11,12 @@ settings = get_settings()
 
 
 def main():
+    # Samples of previous runs must not be aggregated with the new ones
+    if multiproc_dir := os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        Path(multiproc_dir).mkdir(parents=True, exist_ok=True)
+        # Only the metric files are removed, the directory may be shared with other files
+        for path in Path(multiproc_dir).glob("*.db"):
+            path.unlink()
     uvicorn.run(
         app="app.main:fastapi_app",
         host=settings.HOST,
@@ -0,0 +1,55 @@
+"""
+add order events trigger
+
+Revision ID: c3e9a7d5b104
+Revises: a52f8d13c6e7
+Create Date: 2026-10-18 18:02:36.270418
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3e9a7d5b104"
+down_revision: str | Sequence[str] | None = "a52f8d13c6e7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Payload is limited to 8000 bytes, so long fields (description) are not sent
+CREATE_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION notify_order_event() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('order_events', json_build_object(
+        'type', CASE TG_OP WHEN 'INSERT' THEN 'created' ELSE 'updated' END,
+        'order', json_build_object(
+            'id', NEW.id,
+            'name', NEW.name,
+            'distance_km', NEW.distance_km,
+            'duration_minutes', NEW.duration_minutes,
+            'courier_id', NEW.courier_id,
+            'created_at', NEW.created_at
+        )
+    )::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+CREATE_TRIGGER_SQL = """
+CREATE TRIGGER orders_notify_event
+AFTER INSERT OR UPDATE ON orders
+FOR EACH ROW EXECUTE FUNCTION notify_order_event();
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(CREATE_FUNCTION_SQL)
+    op.execute(CREATE_TRIGGER_SQL)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS orders_notify_event ON orders;")
+    op.execute("DROP FUNCTION IF EXISTS notify_order_event();")
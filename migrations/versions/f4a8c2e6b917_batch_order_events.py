@@ -0,0 +1,102 @@
+"""
+batch order events
+
+Revision ID: f4a8c2e6b917
+Revises: d8b2f6a41e93
+Create Date: 2026-10-18 21:14:09.538112
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f4a8c2e6b917"
+down_revision: str | Sequence[str] | None = "d8b2f6a41e93"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# One notification per statement. Payload is limited to 8000 bytes, so statements of more than
+# 20 orders (bulk imports, batch assignments) send `resync` and clients reload orders instead.
+CREATE_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION notify_order_events() RETURNS trigger AS $$
+DECLARE
+    row_count integer;
+    payload text;
+BEGIN
+    SELECT count(*) INTO row_count FROM (SELECT 1 FROM new_rows LIMIT 21) AS batch;
+    IF row_count = 0 THEN
+        RETURN NULL;
+    END IF;
+    IF row_count <= 20 THEN
+        SELECT json_build_object(
+            'type', CASE TG_OP WHEN 'INSERT' THEN 'created' ELSE 'updated' END,
+            'orders', json_agg(json_build_object(
+                'id', id,
+                'name', name,
+                'distance_km', distance_km,
+                'duration_minutes', duration_minutes,
+                'courier_id', courier_id,
+                'created_at', created_at
+            ) ORDER BY id)
+        )::text INTO payload FROM new_rows;
+    END IF;
+    IF payload IS NULL OR octet_length(payload) > 7900 THEN
+        payload := json_build_object('type', 'resync')::text;
+    END IF;
+    PERFORM pg_notify('order_events', payload);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+# Triggers with transition tables can't have several events, one trigger per event
+CREATE_TRIGGER_SQL = """
+CREATE TRIGGER orders_notify_{name}
+AFTER {event} ON orders
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION notify_order_events();
+"""
+
+# Row trigger of the "add order events trigger" migration
+CREATE_ROW_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION notify_order_event() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('order_events', json_build_object(
+        'type', CASE TG_OP WHEN 'INSERT' THEN 'created' ELSE 'updated' END,
+        'order', json_build_object(
+            'id', NEW.id,
+            'name', NEW.name,
+            'distance_km', NEW.distance_km,
+            'duration_minutes', NEW.duration_minutes,
+            'courier_id', NEW.courier_id,
+            'created_at', NEW.created_at
+        )
+    )::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+CREATE_ROW_TRIGGER_SQL = """
+CREATE TRIGGER orders_notify_event
+AFTER INSERT OR UPDATE ON orders
+FOR EACH ROW EXECUTE FUNCTION notify_order_event();
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS orders_notify_event ON orders;")
+    op.execute("DROP FUNCTION IF EXISTS notify_order_event();")
+    op.execute(CREATE_FUNCTION_SQL)
+    op.execute(CREATE_TRIGGER_SQL.format(name="created", event="INSERT"))
+    op.execute(CREATE_TRIGGER_SQL.format(name="updated", event="UPDATE"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS orders_notify_created ON orders;")
+    op.execute("DROP TRIGGER IF EXISTS orders_notify_updated ON orders;")
+    op.execute("DROP FUNCTION IF EXISTS notify_order_events();")
+    op.execute(CREATE_ROW_FUNCTION_SQL)
+    op.execute(CREATE_ROW_TRIGGER_SQL)
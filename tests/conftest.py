@@ -22,7 +22,8 @@ class TestSettings(Settings):
     POSTGRES_PORT_EXTERNAL: int | None = None
     POSTGRES_DOCKER_IMAGE: str = "postgis/postgis:16-3.4"
 
-    model_config = SettingsConfigDict(env_file=Path(__file__).parent / ".testenv")
+    # DATABASE_URI is rewritten once the test container is started
+    model_config = SettingsConfigDict(env_file=Path(__file__).parent / ".testenv", frozen=False)
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -1,5 +1,20 @@
 class Urls:
     HEALTHCHECK = "/healthcheck"
+    METRICS = "/metrics"
+
+    class Admin:
+        RELOAD_SETTINGS = "/api/v1/admin/settings/reload"
+        HASHING_METRICS = "/api/v1/admin/metrics/hashing"
+        CACHES_METRICS = "/api/v1/admin/metrics/caches"
+        ROUTING_METRICS = "/api/v1/admin/metrics/routing"
+        POSITIONS_METRICS = "/api/v1/admin/metrics/positions"
+        FEED_METRICS = "/api/v1/admin/metrics/feed"
+        DATABASE_METRICS = "/api/v1/admin/metrics/database"
+        PROFILING = "/api/v1/admin/profiling"
+        PROFILING_SAMPLING = "/api/v1/admin/profiling/sampling"
+        PROFILING_TOKENS = "/api/v1/admin/profiling/tokens"
+        PROFILES = "/api/v1/admin/profiles"
+        PROFILE = "/api/v1/admin/profiles/{profile_id}"
 
     class Auth:
         LOGIN = "/api/v1/authentication/login"
@@ -8,10 +23,23 @@ class Urls:
     class Common:
         INFO = "/api/v1/common/info"
 
+    class Couriers:
+        REPORT_POSITIONS = "/api/v1/couriers/me/positions"
+        POSITIONS = "/api/v1/couriers/positions"
+
+    class Dispatch:
+        ASSIGNMENTS = "/api/v1/dispatch/assignments"
+
     class Orders:
         CREATE = "/api/v1/orders"
         GET_ALL = "/api/v1/orders"
         GET_BY_ID = "/api/v1/orders/{order_id}"
+        BULK = "/api/v1/orders/bulk"
+        EXPORT = "/api/v1/orders/export"
+        FEED = "/api/v1/orders/feed"
+        SEARCH_RADIUS = "/api/v1/orders/search/radius"
+        SEARCH_BOX = "/api/v1/orders/search/box"
+        SEARCH_NEAREST = "/api/v1/orders/search/nearest"
 
     class Users:
         CREATE = "/api/v1/users"
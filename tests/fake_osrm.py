@@ -0,0 +1,95 @@
+"""
+Fake OSRM server for tests and benchmarks.
+
+Distances are straight lines (haversine), durations are derived from a constant speed.
+Run it standalone with `uvicorn tests.fake_osrm:app --port 9010`.
+"""
+
+import asyncio
+import math
+from itertools import pairwise
+
+import httpx
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+EARTH_RADIUS_M = 6_371_000
+
+
+def haversine_m(lng1: float, lat1: float, lng2: float, lat2: float) -> float:
+    lat1, lat2 = math.radians(lat1), math.radians(lat2)
+    d_lat, d_lng = lat2 - lat1, math.radians(lng2 - lng1)
+    a = math.sin(d_lat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(d_lng / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+def parse_coordinates(coordinates: str) -> list[tuple[float, float]]:
+    pairs = (pair.split(",") for pair in coordinates.split(";"))
+    return [(float(lng), float(lat)) for lng, lat in pairs]
+
+
+class FakeOsrmServer:
+    def __init__(
+        self, speed_kmh: float = 36.0, latency: float = 0.0, max_table_size: int = 100
+    ) -> None:
+        self.speed_ms = speed_kmh / 3.6
+        self.latency = latency
+        self.max_table_size = max_table_size
+        self.requests = 0
+        self.table_cells = 0  # routes calculated by `table` requests
+        self.fail_next = 0  # number of next requests answered with HTTP 503
+        self.no_route = False
+        self.app = Starlette(
+            routes=[
+                Route("/route/v1/{profile}/{coordinates}", self.route),
+                Route("/table/v1/{profile}/{coordinates}", self.table),
+            ],
+        )
+
+    def transport(self) -> httpx.ASGITransport:
+        return httpx.ASGITransport(app=self.app)
+
+    async def error(self) -> JSONResponse | None:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.fail_next:
+            self.fail_next -= 1
+            return JSONResponse({"message": "Service Unavailable"}, status_code=503)
+        if self.no_route:
+            return JSONResponse(
+                {"code": "NoRoute", "message": "Impossible route between points"}, status_code=400
+            )
+        return None
+
+    async def route(self, request: Request) -> JSONResponse:
+        if error := await self.error():
+            return error
+
+        points = parse_coordinates(request.path_params["coordinates"])
+        distance = sum(haversine_m(*start, *end) for start, end in pairwise(points))
+        route = {"distance": distance, "duration": distance / self.speed_ms}
+        return JSONResponse({"code": "Ok", "routes": [route], "waypoints": []})
+
+    async def table(self, request: Request) -> JSONResponse:
+        if error := await self.error():
+            return error
+
+        points = parse_coordinates(request.path_params["coordinates"])
+        sources = [points[int(index)] for index in request.query_params["sources"].split(";")]
+        destinations = [
+            points[int(index)] for index in request.query_params["destinations"].split(";")
+        ]
+        self.table_cells += len(sources) * len(destinations)
+        if len(sources) * len(destinations) > self.max_table_size**2:
+            return JSONResponse(
+                {"code": "TooBig", "message": "Too many table coordinates"}, status_code=400
+            )
+        distances = [[haversine_m(*start, *end) for end in destinations] for start in sources]
+        durations = [[distance / self.speed_ms for distance in row] for row in distances]
+        return JSONResponse({"code": "Ok", "distances": distances, "durations": durations})
+
+
+app = FakeOsrmServer().app
@@ -0,0 +1,69 @@
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from starlette import status
+
+from app.dependencies.routing import get_route_batcher
+from app.routing.batching import RouteBatcher
+from app.routing.osrm import OsrmClient
+from tests.constants import Urls
+from tests.fake_osrm import FakeOsrmServer
+
+
+@pytest.mark.anyio
+async def test_hashing_metrics(test_client: AsyncClient) -> None:
+    response = await test_client.get(url=Urls.Admin.HASHING_METRICS)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    response_json = response.json()
+    assert {"queue_depth", "in_flight", "rejected", "latency"} <= set(response_json)
+
+
+@pytest.mark.anyio
+async def test_caches_metrics(test_client: AsyncClient) -> None:
+    response = await test_client.get(url=Urls.Admin.CACHES_METRICS)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    response_json = response.json()
+    for name in ("principal", "token"):
+        assert {"size", "max_size", "hits", "misses"} == set(response_json[name])
+    assert {"memory", "db_hits", "db_misses", "db_purged", "hit_rate"} == set(
+        response_json["route"]
+    )
+
+
+@pytest.mark.anyio
+async def test_routing_metrics_without_osrm(test_client: AsyncClient) -> None:
+    response = await test_client.get(url=Urls.Admin.ROUTING_METRICS)
+    assert response.status_code == status.HTTP_404_NOT_FOUND, response.text
+
+
+@pytest.mark.anyio
+async def test_routing_metrics(test_app: FastAPI, test_client: AsyncClient) -> None:
+    osrm_server = FakeOsrmServer()
+    http_client = AsyncClient(transport=osrm_server.transport(), base_url="http://osrm")
+    route_batcher = RouteBatcher(OsrmClient(http_client), window=0.01, max_batch_size=10)
+    test_app.dependency_overrides[get_route_batcher] = lambda: route_batcher
+    try:
+        response = await test_client.get(url=Urls.Admin.ROUTING_METRICS)
+    finally:
+        del test_app.dependency_overrides[get_route_batcher]
+    assert response.status_code == status.HTTP_200_OK, response.text
+    response_json = response.json()
+    assert response_json["lookups"] == 0
+    assert {"count", "sum", "buckets"} == set(response_json["batch_size"])
+
+
+@pytest.mark.anyio
+async def test_database_metrics(test_client: AsyncClient) -> None:
+    response = await test_client.get(url=Urls.Admin.DATABASE_METRICS)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    response_json = response.json()
+    assert response_json["size"] == 5
+    assert response_json["timeouts"] == 0
+    assert response_json["replicas"] == []
+    assert (
+        response_json["statement_cache"]["compiled_hits"]
+        + (response_json["statement_cache"]["compiled_misses"])
+        >= 1
+    )
+    # The admin user was loaded from the database
+    assert response_json["wait"]["count"] >= 1
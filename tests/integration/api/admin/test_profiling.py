@@ -0,0 +1,76 @@
+import pytest
+from httpx import AsyncClient
+from starlette import status
+
+from tests.constants import Urls
+
+
+@pytest.mark.anyio
+async def test_profile_request_with_token(test_client: AsyncClient) -> None:
+    response = await test_client.post(url=Urls.Admin.PROFILING_TOKENS, json={"ttl_seconds": 60})
+    assert response.status_code == status.HTTP_201_CREATED, response.text
+    token = response.json()
+
+    response = await test_client.get(
+        url=Urls.Users.GET_ALL, headers={token["header"]: token["token"]}
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+    response = await test_client.get(url=Urls.Admin.PROFILES)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    profile = response.json()[0]
+    assert profile["path"] == Urls.Users.GET_ALL
+    assert profile["status"] == status.HTTP_200_OK
+    assert profile["reason"] == "token"
+
+    url = Urls.Admin.PROFILE.format(profile_id=profile["id"])
+    response = await test_client.get(url=url)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json()["$schema"] == "https://www.speedscope.app/file-format-schema.json"
+
+    response = await test_client.get(url=url, params={"format": "pstats"})
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.headers["content-disposition"].endswith('.pstats"')
+
+
+@pytest.mark.anyio
+async def test_profile_with_invalid_token(test_client: AsyncClient) -> None:
+    response = await test_client.get(url=Urls.Admin.PROFILING)
+    invalid_tokens = response.json()["invalid_tokens"]
+
+    response = await test_client.get(url=Urls.HEALTHCHECK, headers={"X-Profile": "1.invalid"})
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+    response = await test_client.get(url=Urls.Admin.PROFILING)
+    assert response.json()["invalid_tokens"] == invalid_tokens + 1
+
+
+@pytest.mark.anyio
+async def test_token_ttl_is_limited(test_client: AsyncClient) -> None:
+    response = await test_client.post(
+        url=Urls.Admin.PROFILING_TOKENS, json={"ttl_seconds": 24 * 60 * 60}
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
+
+
+@pytest.mark.anyio
+async def test_profiling_sampling(test_client: AsyncClient) -> None:
+    body = {"sample_rate": 0.5, "duration_seconds": 60}
+    response = await test_client.put(url=Urls.Admin.PROFILING_SAMPLING, json=body)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json()["sample_rate"] == 0.5
+    assert response.json()["until"] is not None
+
+    response = await test_client.delete(url=Urls.Admin.PROFILING_SAMPLING)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json()["sample_rate"] == 0
+    assert response.json()["until"] is None
+
+
+@pytest.mark.anyio
+async def test_profile_not_found(test_client: AsyncClient) -> None:
+    response = await test_client.get(url=Urls.Admin.PROFILE.format(profile_id="1-00000000"))
+    assert response.status_code == status.HTTP_404_NOT_FOUND, response.text
+
+    response = await test_client.get(url=Urls.Admin.PROFILE.format(profile_id="not-an-id"))
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY, response.text
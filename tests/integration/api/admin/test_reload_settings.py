@@ -0,0 +1,42 @@
+import pytest
+from httpx import AsyncClient
+from starlette import status
+
+from app.api.authentication.utils import generate_access_token
+from app.domain.enums import UserRoles
+from app.uow.unit_of_work import UnitOfWork
+from tests.conftest import TestSettings
+from tests.constants import Urls
+from tests.factories import UserFactory
+
+
+@pytest.mark.anyio
+async def test_reload_settings_success(test_client: AsyncClient) -> None:
+    response = await test_client.post(url=Urls.Admin.RELOAD_SETTINGS)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert set(response.json()) == {"title", "version", "pid", "restart_required"}
+    assert response.json()["restart_required"] == []
+
+
+@pytest.mark.anyio
+async def test_reload_settings_unauthorized(unauthenticated_client: AsyncClient) -> None:
+    response = await unauthenticated_client.post(url=Urls.Admin.RELOAD_SETTINGS)
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.anyio
+async def test_reload_settings_forbidden_for_non_admin(
+    unauthenticated_client: AsyncClient,
+    test_uow: UnitOfWork,
+    test_settings: TestSettings,
+) -> None:
+    user = await UserFactory.create_(uow=test_uow, role=UserRoles.DISPATCHER)
+    access_token = generate_access_token(
+        user,
+        exp_minutes=test_settings.ACCESS_TOKEN_EXP_MINUTES,
+        secret_key=test_settings.SECRET_KEY,
+        algorithm=test_settings.ALGORITHM,
+    )
+    headers = {"Authorization": f"Bearer {access_token}"}
+    response = await unauthenticated_client.post(url=Urls.Admin.RELOAD_SETTINGS, headers=headers)
+    assert response.status_code == status.HTTP_403_FORBIDDEN
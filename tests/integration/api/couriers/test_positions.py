@@ -0,0 +1,170 @@
+import time
+from collections.abc import Iterator
+
+import pytest
+from geoalchemy2.shape import to_shape
+from httpx import AsyncClient
+from starlette import status
+
+from app.api.authentication.utils import generate_access_token
+from app.dependencies.tracking import get_position_store
+from app.domain import User, UserRoles
+from app.tracking.positions import Ping, PositionFlusher, PositionStore
+from app.uow.unit_of_work import UnitOfWork
+from tests.conftest import TestSettings
+from tests.constants import Urls
+from tests.factories import OrderFactory, UserFactory
+
+
+@pytest.fixture
+def position_store() -> Iterator[PositionStore]:
+    """Empty store of the app, views read it directly."""
+    get_position_store.cache_clear()
+    yield get_position_store()
+    get_position_store.cache_clear()
+
+
+def courier_headers(courier: User, test_settings: TestSettings) -> dict:
+    access_token = generate_access_token(
+        courier,
+        exp_minutes=test_settings.ACCESS_TOKEN_EXP_MINUTES,
+        secret_key=test_settings.SECRET_KEY,
+        algorithm=test_settings.ALGORITHM,
+    )
+    return {"Authorization": f"Bearer {access_token}"}
+
+
+@pytest.mark.anyio
+async def test_report_and_get_positions(
+    unauthenticated_client: AsyncClient,
+    test_client: AsyncClient,
+    test_uow: UnitOfWork,
+    test_settings: TestSettings,
+    position_store: PositionStore,
+) -> None:
+    """Test that the latest reported position is listed without writing to the database."""
+    courier = await UserFactory.create_(uow=test_uow, role=UserRoles.COURIER)
+
+    response = await unauthenticated_client.post(
+        url=Urls.Couriers.REPORT_POSITIONS,
+        json={
+            "pings": [
+                {"lat": 50.45, "lng": 30.52, "recorded_at": "2026-10-18T10:00:05Z"},
+                {"lat": 50.44, "lng": 30.51, "recorded_at": "2026-10-18T10:00:00Z"},
+            ]
+        },
+        headers=courier_headers(courier, test_settings),
+    )
+    assert response.status_code == status.HTTP_202_ACCEPTED, response.text
+    assert response.json() == {"accepted": 2}
+
+    response = await test_client.get(url=Urls.Couriers.POSITIONS, params={"max_age_seconds": 10**9})
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json()["items"] == [
+        {
+            "courier_id": courier.id,
+            "lat": 50.45,
+            "lng": 30.52,
+            "recorded_at": "2026-10-18T10:00:05Z",
+        }
+    ]
+    assert await test_uow.courier_position.get_all() == []
+
+
+@pytest.mark.anyio
+async def test_get_positions_of_other_workers(
+    test_client: AsyncClient, test_uow: UnitOfWork, position_store: PositionStore
+) -> None:
+    """Test that positions flushed by other workers are listed with the ones in memory."""
+    local = await UserFactory.create_(uow=test_uow, role=UserRoles.COURIER)
+    remote = await UserFactory.create_(uow=test_uow, role=UserRoles.COURIER)
+    now = time.time()
+    position_store.update([Ping(local.id, 50.45, 30.52, now)])
+    other_store = PositionStore()
+    other_store.update([Ping(remote.id, 50.46, 30.53, now), Ping(local.id, 49.0, 29.0, now - 5)])
+    await PositionFlusher(other_store, uow_factory=test_uow.fork, interval=60).flush()
+    # This worker reads positions of all workers after its own flush
+    flusher = PositionFlusher(position_store, uow_factory=test_uow.fork, interval=60, max_age=60)
+    assert await flusher.refresh() == 2
+
+    response = await test_client.get(url=Urls.Couriers.POSITIONS)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    positions = {
+        item["courier_id"]: (item["lat"], item["lng"]) for item in response.json()["items"]
+    }
+    # The newest position wins, wherever it is
+    assert positions == {local.id: (50.45, 30.52), remote.id: (50.46, 30.53)}
+
+
+@pytest.mark.anyio
+async def test_get_positions_skips_outdated(
+    test_client: AsyncClient, position_store: PositionStore
+) -> None:
+    position_store.update([Ping(1, 50.45, 30.52, 0.0)])
+
+    response = await test_client.get(url=Urls.Couriers.POSITIONS)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json()["items"] == []
+
+
+@pytest.mark.anyio
+async def test_report_positions_only_couriers(
+    test_client: AsyncClient, position_store: PositionStore
+) -> None:
+    response = await test_client.post(
+        url=Urls.Couriers.REPORT_POSITIONS, json={"pings": [{"lat": 50.45, "lng": 30.52}]}
+    )
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    assert position_store.metrics()["pings"] == 0
+
+
+@pytest.mark.anyio
+async def test_flush_positions(test_uow: UnitOfWork) -> None:
+    """Test that positions are upserted and older positions don't overwrite newer ones."""
+    first = await UserFactory.create_(uow=test_uow, role=UserRoles.COURIER)
+    second = await UserFactory.create_(uow=test_uow, role=UserRoles.COURIER)
+    store = PositionStore()
+    flusher = PositionFlusher(store, uow_factory=test_uow.fork, interval=60)
+
+    store.update([Ping(first.id, 50.45, 30.52, 100.0), Ping(second.id, 50.40, 30.60, 100.0)])
+    assert await flusher.flush() == 2
+
+    # Another worker flushes an older position of the first courier and a newer of the second
+    other_store = PositionStore()
+    other_store.update([Ping(first.id, 49.0, 29.0, 50.0), Ping(second.id, 50.41, 30.61, 200.0)])
+    other_flusher = PositionFlusher(other_store, uow_factory=test_uow.fork, interval=60)
+    assert await other_flusher.flush() == 2
+
+    positions = {
+        position.courier_id: to_shape(position.position)
+        for position in await test_uow.courier_position.get_all()
+    }
+    assert (positions[first.id].y, positions[first.id].x) == (50.45, 30.52)
+    assert (positions[second.id].y, positions[second.id].x) == (50.41, 30.61)
+
+
+@pytest.mark.anyio
+async def test_assign_orders_with_reported_positions(
+    test_client: AsyncClient, test_uow: UnitOfWork, position_store: PositionStore
+) -> None:
+    """Test that couriers without a position in the request are placed at reported ones."""
+    order = await OrderFactory.create_(uow=test_uow)
+    reported = await UserFactory.create_(uow=test_uow, role=UserRoles.COURIER)
+    flushed = await UserFactory.create_(uow=test_uow, role=UserRoles.COURIER)
+    unknown = await UserFactory.create_(uow=test_uow, role=UserRoles.COURIER)
+    position_store.update([Ping(reported.id, 50.45, 30.52, time.time())])
+    other_store = PositionStore()
+    other_store.update([Ping(flushed.id, 50.46, 30.53, time.time())])
+    await PositionFlusher(other_store, uow_factory=test_uow.fork, interval=60).flush()
+
+    response = await test_client.post(
+        url=Urls.Dispatch.ASSIGNMENTS,
+        json={"couriers": [{"id": reported.id}, {"id": flushed.id}]},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert [item["order_id"] for item in response.json()["assignments"]] == [order.id]
+
+    response = await test_client.post(
+        url=Urls.Dispatch.ASSIGNMENTS, json={"couriers": [{"id": unknown.id}]}
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
@@ -0,0 +1,165 @@
+import pytest
+from fastapi import FastAPI
+from geoalchemy2 import WKTElement
+from httpx import AsyncClient
+from starlette import status
+
+from app.api.authentication.utils import generate_access_token
+from app.dependencies.routing import get_osrm_client
+from app.domain import Order, UserRoles
+from app.routing.osrm import OsrmClient
+from app.uow.unit_of_work import UnitOfWork
+from tests.conftest import TestSettings
+from tests.constants import Urls
+from tests.factories import OrderFactory, UserFactory
+from tests.fake_osrm import FakeOsrmServer
+
+# Pickups and courier positions in Kyiv
+LEFT_BANK = {"lat": 50.4433, "lng": 30.6285}
+RIGHT_BANK = {"lat": 50.4501, "lng": 30.5234}
+
+
+def point_wkt(point: dict) -> WKTElement:
+    return WKTElement(f"POINT({point['lng']} {point['lat']})", srid=4326)
+
+
+async def create_orders(uow: UnitOfWork) -> tuple[int, int]:
+    left = await OrderFactory.create_(uow=uow, start_point=point_wkt(LEFT_BANK))
+    right = await OrderFactory.create_(uow=uow, start_point=point_wkt(RIGHT_BANK))
+    return left.id, right.id
+
+
+async def create_couriers(uow: UnitOfWork) -> tuple[int, int]:
+    left = await UserFactory.create_(uow=uow, role=UserRoles.COURIER)
+    right = await UserFactory.create_(uow=uow, role=UserRoles.COURIER)
+    return left.id, right.id
+
+
+@pytest.mark.anyio
+async def test_assign_orders_proposal(test_client: AsyncClient, test_uow: UnitOfWork) -> None:
+    """Test that every courier gets the nearest order and nothing is saved."""
+    left_order, right_order = await create_orders(test_uow)
+    left_courier, right_courier = await create_couriers(test_uow)
+
+    response = await test_client.post(
+        url=Urls.Dispatch.ASSIGNMENTS,
+        json={
+            "couriers": [
+                {"id": right_courier, "position": RIGHT_BANK},
+                {"id": left_courier, "position": LEFT_BANK},
+            ],
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+    response_json = response.json()
+    pairs = {(item["courier_id"], item["order_id"]) for item in response_json["assignments"]}
+    assert pairs == {(left_courier, left_order), (right_courier, right_order)}
+    assert response_json["total_cost"] == pytest.approx(0)
+    assert response_json["unassigned_courier_ids"] == []
+    assert response_json["unassigned_order_ids"] == []
+    assert response_json["applied"] is False
+
+    for order_id in (left_order, right_order):
+        order = await test_uow.session.get(Order, order_id)
+        assert order is not None
+        assert order.courier_id is None
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("solver", ["optimal", "greedy"])
+async def test_assign_orders_apply(
+    test_client: AsyncClient, test_uow: UnitOfWork, solver: str
+) -> None:
+    """Test that applied assignments are saved and assigned orders are not open anymore."""
+    left_order, right_order = await create_orders(test_uow)
+    left_courier, _ = await create_couriers(test_uow)
+    body = {
+        "couriers": [{"id": left_courier, "position": LEFT_BANK}],
+        "solver": solver,
+        "apply": True,
+    }
+
+    response = await test_client.post(url=Urls.Dispatch.ASSIGNMENTS, json=body)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    response_json = response.json()
+    assert [item["order_id"] for item in response_json["assignments"]] == [left_order]
+    assert response_json["unassigned_order_ids"] == [right_order]
+    assert response_json["applied"] is True
+
+    order = await test_uow.session.get(Order, left_order, populate_existing=True)
+    assert order is not None
+    assert order.courier_id == left_courier
+
+    # The left order is taken, so the courier gets the remaining one
+    response = await test_client.post(url=Urls.Dispatch.ASSIGNMENTS, json=body)
+    assert [item["order_id"] for item in response.json()["assignments"]] == [right_order]
+
+
+@pytest.mark.anyio
+async def test_assign_orders_by_duration(
+    test_app: FastAPI, test_client: AsyncClient, test_uow: UnitOfWork
+) -> None:
+    _, right_order = await create_orders(test_uow)
+    courier, _ = await create_couriers(test_uow)
+    osrm_server = FakeOsrmServer(speed_kmh=60)
+    http_client = AsyncClient(transport=osrm_server.transport(), base_url="http://osrm")
+    test_app.dependency_overrides[get_osrm_client] = lambda: OsrmClient(http_client)
+    try:
+        response = await test_client.post(
+            url=Urls.Dispatch.ASSIGNMENTS,
+            json={"couriers": [{"id": courier, "position": RIGHT_BANK}], "cost": "duration"},
+        )
+    finally:
+        del test_app.dependency_overrides[get_osrm_client]
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+    [assignment] = response.json()["assignments"]
+    assert assignment["order_id"] == right_order
+    assert assignment["duration_minutes"] == pytest.approx(0)
+    assert osrm_server.requests == 1
+
+
+@pytest.mark.anyio
+async def test_assign_orders_by_duration_without_osrm(
+    test_client: AsyncClient, test_uow: UnitOfWork
+) -> None:
+    courier, _ = await create_couriers(test_uow)
+
+    response = await test_client.post(
+        url=Urls.Dispatch.ASSIGNMENTS,
+        json={"couriers": [{"id": courier, "position": RIGHT_BANK}], "cost": "duration"},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
+
+
+@pytest.mark.anyio
+async def test_assign_orders_not_couriers(test_client: AsyncClient, test_uow: UnitOfWork) -> None:
+    client = await UserFactory.create_(uow=test_uow, role=UserRoles.CLIENT)
+
+    response = await test_client.post(
+        url=Urls.Dispatch.ASSIGNMENTS,
+        json={"couriers": [{"id": client.id, "position": RIGHT_BANK}]},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
+    assert str(client.id) in response.json()["detail"]
+
+
+@pytest.mark.anyio
+async def test_assign_orders_forbidden_for_couriers(
+    unauthenticated_client: AsyncClient,
+    test_uow: UnitOfWork,
+    test_settings: TestSettings,
+) -> None:
+    user = await UserFactory.create_(uow=test_uow, role=UserRoles.COURIER)
+    access_token = generate_access_token(
+        user,
+        exp_minutes=test_settings.ACCESS_TOKEN_EXP_MINUTES,
+        secret_key=test_settings.SECRET_KEY,
+        algorithm=test_settings.ALGORITHM,
+    )
+    headers = {"Authorization": f"Bearer {access_token}"}
+    response = await unauthenticated_client.post(
+        url=Urls.Dispatch.ASSIGNMENTS, json={"couriers": []}, headers=headers
+    )
+    assert response.status_code == status.HTTP_403_FORBIDDEN
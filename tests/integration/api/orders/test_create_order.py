@@ -1,10 +1,18 @@
 import pytest
+from fastapi import FastAPI
 from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.exc import InvalidRequestError
 from starlette import status
 
+from app.dependencies.caches import get_route_cache
+from app.dependencies.routing import get_osrm_client, get_route_provider
+from app.domain import CachedRoute
+from app.routing.osrm import OsrmClient
 from app.uow.unit_of_work import UnitOfWork
 from tests.constants import Urls
 from tests.factories import OrderFactory
+from tests.fake_osrm import FakeOsrmServer
 
 
 @pytest.mark.anyio
@@ -79,7 +87,7 @@ async def test_create_order_success(
     assert "id" in response_json
 
     # Verify that the order was created in the database
-    db_order = await test_uow.order.get_by_id(id_=response_json["id"])
+    db_order = await test_uow.order.get_by_id(id_=response_json["id"], with_geometry=True)
     assert db_order is not None, "Order should be created in the database"
     assert db_order.name == order_data["name"]
     assert db_order.description == order_data["description"]
@@ -117,6 +125,9 @@ async def test_create_order_minimal_data(
     assert db_order.description is None  # Should be nullable
     assert db_order.distance_km is None  # Should be nullable
     assert db_order.duration_minutes is None  # Should be nullable
+    # Geometries are deferred, they are loaded only on demand
+    with pytest.raises(InvalidRequestError):
+        _ = db_order.start_point
 
 
 @pytest.mark.anyio
@@ -181,3 +192,94 @@ async def test_create_order_various_coordinate_ranges(
 
     response_json = response.json()
     assert response_json.get("name") == order_data["name"]
+
+
+@pytest.mark.anyio
+async def test_create_order_calculates_route(
+    test_app: FastAPI,
+    test_client: AsyncClient,
+    test_uow: UnitOfWork,
+) -> None:
+    """Test that distance and duration are calculated by OSRM if it is configured."""
+    osrm_server = FakeOsrmServer(speed_kmh=60)
+    http_client = AsyncClient(transport=osrm_server.transport(), base_url="http://osrm")
+    test_app.dependency_overrides[get_route_provider] = lambda: OsrmClient(http_client)
+    order_data = {
+        "name": "Routed Order",
+        "start_point": {"lat": 50.4501, "lng": 30.5234},  # Kyiv
+        "end_point": {"lat": 49.8397, "lng": 24.0297},  # Lviv
+        "distance_km": 1.0,
+        "duration_minutes": 1.0,
+    }
+
+    try:
+        response = await test_client.post(url=Urls.Orders.CREATE, json=order_data)
+    finally:
+        del test_app.dependency_overrides[get_route_provider]
+    assert response.status_code == status.HTTP_201_CREATED
+    assert osrm_server.requests == 1
+
+    db_order = await test_uow.order.get_by_id(id_=response.json()["id"])
+    assert db_order is not None
+    assert db_order.distance_km == pytest.approx(468, abs=5)
+    assert db_order.duration_minutes == pytest.approx(db_order.distance_km, rel=1e-6)
+
+
+@pytest.mark.anyio
+async def test_create_order_routing_error_keeps_request_values(
+    test_app: FastAPI,
+    test_client: AsyncClient,
+    test_uow: UnitOfWork,
+) -> None:
+    """Test that values from the request are used if OSRM can't calculate the route."""
+    osrm_server = FakeOsrmServer()
+    osrm_server.no_route = True
+    http_client = AsyncClient(transport=osrm_server.transport(), base_url="http://osrm")
+    test_app.dependency_overrides[get_route_provider] = lambda: OsrmClient(http_client)
+    order_data = {
+        "name": "Island Order",
+        "start_point": {"lat": 40.7831, "lng": -73.9712},
+        "end_point": {"lat": 40.7829, "lng": -73.9581},
+        "distance_km": 2.5,
+        "duration_minutes": 8.0,
+    }
+
+    try:
+        response = await test_client.post(url=Urls.Orders.CREATE, json=order_data)
+    finally:
+        del test_app.dependency_overrides[get_route_provider]
+    assert response.status_code == status.HTTP_201_CREATED
+
+    db_order = await test_uow.order.get_by_id(id_=response.json()["id"])
+    assert db_order is not None
+    assert db_order.distance_km == order_data["distance_km"]
+    assert db_order.duration_minutes == order_data["duration_minutes"]
+
+
+@pytest.mark.anyio
+async def test_create_order_caches_route(
+    test_app: FastAPI,
+    test_client: AsyncClient,
+    test_uow: UnitOfWork,
+) -> None:
+    """Test that the same points are routed by OSRM once and the route is stored in Postgres."""
+    osrm_server = FakeOsrmServer()
+    http_client = AsyncClient(transport=osrm_server.transport(), base_url="http://osrm")
+    test_app.dependency_overrides[get_osrm_client] = lambda: OsrmClient(http_client)
+    get_route_cache().memory.clear()
+    order_data = {
+        "name": "Warehouse Order",
+        "start_point": {"lat": 50.4501, "lng": 30.5234},
+        "end_point": {"lat": 50.5111, "lng": 30.7906},
+    }
+
+    try:
+        for _ in range(3):
+            response = await test_client.post(url=Urls.Orders.CREATE, json=order_data)
+            assert response.status_code == status.HTTP_201_CREATED
+    finally:
+        del test_app.dependency_overrides[get_osrm_client]
+    assert osrm_server.requests == 1
+
+    result = await test_uow.execute(select(func.count()).select_from(CachedRoute))
+    assert result.scalar_one() == 1
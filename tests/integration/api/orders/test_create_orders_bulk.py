@@ -0,0 +1,100 @@
+import json
+
+import pytest
+from httpx import AsyncClient
+from starlette import status
+
+from app.uow.unit_of_work import UnitOfWork
+from tests.conftest import TestSettings
+from tests.constants import Urls
+
+
+def build_order(index: int) -> dict:
+    return {
+        "name": f"Bulk Order {index}",
+        "start_point": {"lat": 50.45, "lng": 30.52},
+        "end_point": {"lat": 50.51, "lng": 30.79},
+        "distance_km": 21.5,
+        "duration_minutes": 30.0,
+    }
+
+
+@pytest.mark.anyio
+async def test_create_orders_bulk_json_array(
+    test_client: AsyncClient,
+    test_uow: UnitOfWork,
+) -> None:
+    """Test bulk creation from a JSON array, invalid rows are reported by index."""
+    orders = [build_order(index) for index in range(5)]
+    orders[2]["start_point"] = {"lat": 100, "lng": 30.52}  # Invalid latitude
+
+    response = await test_client.post(url=Urls.Orders.BULK, json=orders)
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+    response_json = response.json()
+    assert response_json["received"] == 5
+    assert response_json["created"] == 4
+    assert response_json["failed"] == 1
+    assert response_json["errors"][0]["index"] == 2
+    assert response_json["errors"][0]["errors"][0]["loc"] == ["start_point", "lat"]
+
+    db_orders = await test_uow.order.get_all()
+    assert sorted(str(order.name) for order in db_orders) == [
+        "Bulk Order 0",
+        "Bulk Order 1",
+        "Bulk Order 3",
+        "Bulk Order 4",
+    ]
+
+
+@pytest.mark.anyio
+async def test_create_orders_bulk_ndjson_in_chunks(
+    test_client: AsyncClient,
+    test_uow: UnitOfWork,
+    test_settings: TestSettings,
+) -> None:
+    """Test bulk creation from NDJSON, committed by chunks."""
+    lines = [json.dumps(build_order(index)) for index in range(25)]
+    lines.insert(10, "{not a json")
+    chunk_size = test_settings.ORDERS_BULK_CHUNK_SIZE
+    test_settings.ORDERS_BULK_CHUNK_SIZE = 10
+
+    try:
+        response = await test_client.post(
+            url=Urls.Orders.BULK,
+            content="\n".join(lines).encode(),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+    finally:
+        test_settings.ORDERS_BULK_CHUNK_SIZE = chunk_size
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+    response_json = response.json()
+    assert response_json["received"] == 26
+    assert response_json["created"] == 25
+    assert response_json["errors"] == [
+        {"index": 10, "errors": [{"type": "json_invalid", "msg": "Invalid JSON."}]}
+    ]
+    assert len(await test_uow.order.get_all()) == 25
+
+
+@pytest.mark.anyio
+async def test_create_orders_bulk_invalid_body(test_client: AsyncClient) -> None:
+    """Test that body which is not a JSON array is rejected."""
+    response = await test_client.post(url=Urls.Orders.BULK, json=build_order(0))
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.anyio
+async def test_create_orders_bulk_too_large(
+    test_client: AsyncClient, test_settings: TestSettings
+) -> None:
+    """Test that uploads over the size limit are rejected."""
+    max_bytes = test_settings.ORDERS_BULK_MAX_BYTES
+    test_settings.ORDERS_BULK_MAX_BYTES = 100
+    try:
+        orders = [build_order(index) for index in range(5)]
+        response = await test_client.post(url=Urls.Orders.BULK, json=orders)
+    finally:
+        test_settings.ORDERS_BULK_MAX_BYTES = max_bytes
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, response.text
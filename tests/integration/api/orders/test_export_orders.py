@@ -0,0 +1,81 @@
+import csv
+import io
+import json
+
+import pyarrow as pa  # type: ignore[import-untyped]
+import pytest
+from httpx import AsyncClient
+from starlette import status
+
+from app.uow.unit_of_work import UnitOfWork
+from tests.conftest import TestSettings
+from tests.constants import Urls
+from tests.factories import OrderFactory
+
+
+@pytest.mark.anyio
+async def test_export_orders_ndjson(
+    test_client: AsyncClient,
+    test_uow: UnitOfWork,
+    test_settings: TestSettings,
+) -> None:
+    """Test NDJSON export, orders are streamed by several cursor batches."""
+    orders = [await OrderFactory.create_(uow=test_uow) for _ in range(5)]
+    batch_size = test_settings.ORDERS_EXPORT_BATCH_SIZE
+    test_settings.ORDERS_EXPORT_BATCH_SIZE = 2
+
+    try:
+        response = await test_client.get(url=Urls.Orders.EXPORT)
+    finally:
+        test_settings.ORDERS_EXPORT_BATCH_SIZE = batch_size
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["id"] for row in rows] == [order.id for order in orders]
+    assert rows[0]["name"] == orders[0].name  # type: ignore[attr-defined]
+    assert rows[0]["distance_km"] == orders[0].distance_km  # type: ignore[attr-defined]
+    assert {"start_lat", "start_lng", "end_lat", "end_lng", "created_at"} <= set(rows[0])
+
+
+@pytest.mark.anyio
+async def test_export_orders_csv_with_filters(
+    test_client: AsyncClient,
+    test_uow: UnitOfWork,
+) -> None:
+    """Test CSV export with distance filter."""
+    await OrderFactory.create_(uow=test_uow, distance_km=5.0)
+    long_order = await OrderFactory.create_(uow=test_uow, distance_km=50.0)
+
+    response = await test_client.get(
+        url=Urls.Orders.EXPORT, params={"format": "csv", "min_distance_km": 10}
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.headers["content-type"].startswith("text/csv")
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [int(row["id"]) for row in rows] == [long_order.id]
+
+
+@pytest.mark.anyio
+async def test_export_orders_arrow(
+    test_client: AsyncClient,
+    test_uow: UnitOfWork,
+) -> None:
+    """Test Arrow IPC stream export."""
+    orders = [await OrderFactory.create_(uow=test_uow) for _ in range(3)]
+
+    response = await test_client.get(url=Urls.Orders.EXPORT, params={"format": "arrow"})
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+    table = pa.ipc.open_stream(response.content).read_all()
+    assert table.column("id").to_pylist() == [order.id for order in orders]
+
+
+@pytest.mark.anyio
+async def test_export_orders_empty_csv(test_client: AsyncClient) -> None:
+    """Test that CSV export of no orders has the header only."""
+    response = await test_client.get(url=Urls.Orders.EXPORT, params={"format": "csv"})
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.text.splitlines()[0].startswith("id,name,description,start_lat")
+    assert len(response.text.splitlines()) == 1
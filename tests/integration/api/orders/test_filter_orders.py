@@ -0,0 +1,140 @@
+import pytest
+from geoalchemy2 import WKTElement
+from httpx import AsyncClient
+from sqlalchemy import text
+from starlette import status
+
+from app.domain import CountMode
+from app.uow.order.filters import OrderFilters
+from app.uow.unit_of_work import UnitOfWork
+from tests.constants import Urls
+from tests.factories import OrderFactory
+from tests.integration.explain import explain_queries
+
+KYIV = WKTElement("POINT(30.5234 50.4501)", srid=4326)
+
+
+async def create_orders(uow: UnitOfWork) -> dict[tuple[int, int], int]:
+    """Orders by (distance_km, duration_minutes)."""
+    ids = {}
+    for distance_km, duration_minutes in [(5, 10), (15, 20), (15, 45), (30, 40), (60, 90)]:
+        order = await OrderFactory.create_(
+            uow=uow, distance_km=distance_km, duration_minutes=duration_minutes
+        )
+        ids[distance_km, duration_minutes] = order.id
+    return ids
+
+
+async def create_many_orders(uow: UnitOfWork, count: int) -> None:
+    """Long orders, which don't match the filters of plan tests, to make them selective."""
+    await uow.order.bulk_create(
+        [
+            {
+                "start_point": KYIV,
+                "end_point": KYIV,
+                "distance_km": 100 + index % 400,
+                "duration_minutes": 200 + index % 600,
+            }
+            for index in range(count)
+        ]
+    )
+    await uow.commit()
+    await uow.execute(text("ANALYZE orders"))
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("params", "expected"),
+    [
+        ({"min_distance_km": 10, "max_distance_km": 30}, [(15, 20), (15, 45), (30, 40)]),
+        ({"max_duration_minutes": 40}, [(5, 10), (15, 20), (30, 40)]),
+        (
+            {"min_distance_km": 10, "max_distance_km": 30, "min_duration_minutes": 30},
+            [(15, 45), (30, 40)],
+        ),
+    ],
+)
+async def test_get_orders_filtered(
+    test_client: AsyncClient,
+    test_uow: UnitOfWork,
+    params: dict,
+    expected: list[tuple[int, int]],
+) -> None:
+    ids = await create_orders(test_uow)
+
+    response = await test_client.get(url=Urls.Orders.GET_ALL, params=params)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    response_json = response.json()
+    assert [item["id"] for item in response_json["items"]] == [ids[key] for key in expected]
+    assert response_json["total"] == len(expected)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("count", [CountMode.EXACT, CountMode.CACHED, CountMode.ESTIMATED])
+async def test_get_orders_filtered_pages(
+    test_client: AsyncClient, test_uow: UnitOfWork, count: CountMode
+) -> None:
+    """Test that filters are applied to every page and to the total in both pagination modes."""
+    ids = await create_orders(test_uow)
+    # Statistics of the whole table (5 orders) must not be returned as the filtered total
+    await test_uow.execute(text("ANALYZE orders"))
+    params: dict = {"max_distance_km": 30, "page_size": 2, "count": count}
+
+    response = await test_client.get(url=Urls.Orders.GET_ALL, params={**params, "page": 2})
+    assert response.status_code == status.HTTP_200_OK, response.text
+    response_json = response.json()
+    assert [item["id"] for item in response_json["items"]] == [ids[15, 45], ids[30, 40]]
+    assert response_json["total"] == 4
+
+    seen_ids: list[int] = []
+    while True:
+        response = await test_client.get(url=Urls.Orders.GET_ALL, params=params)
+        response_json = response.json()
+        seen_ids += [item["id"] for item in response_json["items"]]
+        if not response_json["next_cursor"]:
+            break
+        params["after"] = response_json["next_cursor"]
+    assert seen_ids == [ids[5, 10], ids[15, 20], ids[15, 45], ids[30, 40]]
+
+
+@pytest.mark.anyio
+async def test_get_orders_invalid_range(test_client: AsyncClient) -> None:
+    response = await test_client.get(
+        url=Urls.Orders.GET_ALL, params={"min_distance_km": 30, "max_distance_km": 10}
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("filters", "index"),
+    [
+        (OrderFilters(min_distance_km=10, max_distance_km=30), "idx_orders_distance_km"),
+        (OrderFilters(max_duration_minutes=40), "idx_orders_duration_minutes"),
+    ],
+)
+async def test_filtered_orders_use_index(
+    test_uow: UnitOfWork, filters: OrderFilters, index: str
+) -> None:
+    await create_orders(test_uow)
+    await create_many_orders(test_uow, count=5_000)
+
+    plans = await explain_queries(
+        test_uow, lambda: test_uow.order.get_paginated_all(page=1, page_size=20, filters=filters)
+    )
+
+    assert index in plans[0], plans[0]
+
+
+@pytest.mark.anyio
+async def test_combined_filters_use_indexes(test_uow: UnitOfWork) -> None:
+    await create_orders(test_uow)
+    await create_many_orders(test_uow, count=5_000)
+    filters = OrderFilters(max_distance_km=30, max_duration_minutes=40)
+
+    plans = await explain_queries(
+        test_uow, lambda: test_uow.order.get_paginated_all(page=1, page_size=20, filters=filters)
+    )
+
+    assert "idx_orders_distance_km" in plans[0] or "idx_orders_duration_minutes" in plans[0]
+    assert "Seq Scan" not in plans[0], plans[0]
@@ -0,0 +1,96 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from starlette import status
+
+from app.uow.unit_of_work import UnitOfWork
+from tests.constants import Urls
+from tests.factories import OrderFactory
+
+
+@pytest.mark.anyio
+async def test_get_orders_page_mode(test_client: AsyncClient, test_uow: UnitOfWork) -> None:
+    orders = [await OrderFactory.create_(uow=test_uow) for _ in range(5)]
+
+    response = await test_client.get(url=Urls.Orders.GET_ALL, params={"page": 2, "page_size": 2})
+    assert response.status_code == status.HTTP_200_OK, response.text
+    response_json = response.json()
+    assert response_json["total"] == 5
+    assert response_json["page"] == 2
+    assert [item["id"] for item in response_json["items"]] == [orders[2].id, orders[3].id]
+    assert response_json["next_cursor"]
+
+
+@pytest.mark.anyio
+async def test_get_orders_cursor_mode(test_client: AsyncClient, test_uow: UnitOfWork) -> None:
+    orders = [await OrderFactory.create_(uow=test_uow) for _ in range(5)]
+
+    seen_ids: list[int] = []
+    params: dict = {"page_size": 2}
+    while True:
+        response = await test_client.get(url=Urls.Orders.GET_ALL, params=params)
+        assert response.status_code == status.HTTP_200_OK, response.text
+        response_json = response.json()
+        seen_ids.extend(item["id"] for item in response_json["items"])
+        if not response_json["next_cursor"]:
+            break
+        assert response_json["page"] in (1, None)
+        params["after"] = response_json["next_cursor"]
+
+    assert seen_ids == [order.id for order in orders]
+
+
+@pytest.mark.anyio
+async def test_get_orders_invalid_cursor(test_client: AsyncClient) -> None:
+    response = await test_client.get(url=Urls.Orders.GET_ALL, params={"after": "invalid"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json().get("detail") == "Invalid cursor."
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("count", "expected_total"),
+    [
+        ("exact", 3),
+        ("cached", 3),
+        ("none", None),
+    ],
+)
+async def test_get_orders_count_modes(
+    test_client: AsyncClient,
+    test_uow: UnitOfWork,
+    count,
+    expected_total,
+) -> None:
+    for _ in range(3):
+        await OrderFactory.create_(uow=test_uow)
+
+    response = await test_client.get(url=Urls.Orders.GET_ALL, params={"count": count})
+    assert response.status_code == status.HTTP_200_OK, response.text
+    response_json = response.json()
+    assert response_json["count"] == count
+    assert response_json["total"] == expected_total
+    assert len(response_json["items"]) == 3
+
+
+@pytest.mark.anyio
+async def test_get_orders_estimated_count(test_client: AsyncClient, test_uow: UnitOfWork) -> None:
+    await OrderFactory.create_(uow=test_uow)
+    await test_uow.execute(text("ANALYZE orders"))
+    await test_uow.commit()
+
+    response = await test_client.get(url=Urls.Orders.GET_ALL, params={"count": "estimated"})
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json()["total"] == 1
+
+
+@pytest.mark.anyio
+async def test_get_orders_exact_count_out_of_range_page(
+    test_client: AsyncClient, test_uow: UnitOfWork
+) -> None:
+    await OrderFactory.create_(uow=test_uow)
+
+    response = await test_client.get(url=Urls.Orders.GET_ALL, params={"page": 10})
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json()["items"] == []
+    assert response.json()["total"] == 1
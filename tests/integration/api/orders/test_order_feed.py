@@ -0,0 +1,96 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+from fastapi import FastAPI
+from geoalchemy2 import WKTElement
+from httpx import AsyncClient
+from sqlalchemy import insert, update
+from starlette import status
+
+from app.dependencies.feed import get_order_feed
+from app.domain import Order, UserRoles
+from app.feed.hub import OrderFeedHub, connect_to
+from app.uow.unit_of_work import UnitOfWork
+from tests.conftest import TestSettings
+from tests.constants import Urls
+from tests.factories import OrderFactory, UserFactory
+
+
+@pytest.fixture
+async def order_feed(
+    test_app: FastAPI, test_uow: UnitOfWork, test_settings: TestSettings
+) -> AsyncIterator[OrderFeedHub]:
+    hub = OrderFeedHub(connect_to(test_settings.DATABASE_URI), queue_size=10)
+    test_app.dependency_overrides[get_order_feed] = lambda: hub
+    yield hub
+    del test_app.dependency_overrides[get_order_feed]
+    # The test database is dropped after the test, the connection must be closed before
+    await hub.close()
+
+
+@pytest.mark.anyio
+async def test_order_events_are_pushed(test_uow: UnitOfWork, order_feed: OrderFeedHub) -> None:
+    """Test that the orders trigger notifies the hub about created and updated orders."""
+    courier = await UserFactory.create_(uow=test_uow, role=UserRoles.COURIER)
+
+    async with order_feed.subscribe() as subscription:
+        async with asyncio.timeout(5):
+            await order_feed.listening.wait()
+        order = await OrderFactory.create_(uow=test_uow, name="Kyiv - Brovary")
+        await test_uow.execute(
+            update(Order).where(Order.id == order.id).values(courier_id=courier.id)
+        )
+        await test_uow.commit()
+
+        async with asyncio.timeout(5):
+            created = await subscription.get()
+            updated = await subscription.get()
+
+    assert created["type"] == "created"
+    assert created["order"]["id"] == order.id
+    assert created["order"]["name"] == "Kyiv - Brovary"
+    assert created["order"]["courier_id"] is None
+    assert "description" not in created["order"]
+    assert updated["type"] == "updated"
+    assert updated["order"]["courier_id"] == courier.id
+
+
+@pytest.mark.anyio
+async def test_bulk_statements_are_collapsed(
+    test_uow: UnitOfWork, order_feed: OrderFeedHub
+) -> None:
+    """Test that a statement of many orders is sent as one resync event, not an event per row."""
+    point = WKTElement("POINT(30.52 50.45)", srid=4326)
+    async with order_feed.subscribe() as subscription:
+        async with asyncio.timeout(5):
+            await order_feed.listening.wait()
+        await test_uow.execute(
+            insert(Order).values(
+                [
+                    {"name": f"Order {i}", "start_point": point, "end_point": point}
+                    for i in range(50)
+                ]
+            )
+        )
+        await test_uow.commit()
+
+        async with asyncio.timeout(5):
+            assert await subscription.get() == {"type": "resync"}
+        # Wait for a possible second event
+        await asyncio.sleep(0.5)
+        assert order_feed.metrics()["events"] == 1
+        assert order_feed.metrics()["connected"]
+
+    # The LISTEN connection is released without subscribers
+    await asyncio.sleep(0.1)
+    assert not order_feed.metrics()["connected"]
+
+
+@pytest.mark.anyio
+async def test_order_feed_only_for_dispatchers(
+    unauthenticated_client: AsyncClient, order_feed: OrderFeedHub
+) -> None:
+    response = await unauthenticated_client.get(url=Urls.Orders.FEED)
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert order_feed.metrics()["subscribers"] == 0
@@ -0,0 +1,165 @@
+import pytest
+from geoalchemy2 import WKTElement
+from httpx import AsyncClient
+from starlette import status
+
+from app.domain import CountMode
+from app.routing.types import Point
+from app.uow.unit_of_work import UnitOfWork
+from tests.constants import Urls
+from tests.factories import OrderFactory
+from tests.integration.explain import explain_queries
+
+KYIV = Point(lat=50.4501, lng=30.5234)
+
+
+def point_wkt(lat: float, lng: float) -> WKTElement:
+    return WKTElement(f"POINT({lng} {lat})", srid=4326)
+
+
+async def create_orders(uow: UnitOfWork) -> dict[str, int]:
+    """Orders with pickups at different distances from Kyiv center."""
+    pickups = {
+        "center": (50.4501, 30.5234),
+        "3 km north": (50.4771, 30.5234),
+        "10 km east": (50.4501, 30.6640),
+        "Lviv": (49.8397, 24.0297),
+    }
+    ids = {}
+    for name, (lat, lng) in pickups.items():
+        order = await OrderFactory.create_(uow=uow, name=name, start_point=point_wkt(lat, lng))
+        ids[name] = order.id
+    return ids
+
+
+@pytest.mark.anyio
+async def test_search_orders_within_radius(
+    test_client: AsyncClient,
+    test_uow: UnitOfWork,
+) -> None:
+    """Test that only orders with pickup within the radius are found."""
+    ids = await create_orders(test_uow)
+
+    response = await test_client.get(
+        url=Urls.Orders.SEARCH_RADIUS,
+        params={"lat": KYIV.lat, "lng": KYIV.lng, "radius_km": 5},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+    response_json = response.json()
+    assert [item["id"] for item in response_json["items"]] == [ids["center"], ids["3 km north"]]
+    assert response_json["total"] == 2
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("center", "pickup"),
+    [
+        # 49.76 km north at the equator, where a degree of latitude is the shortest
+        (Point(lat=0.0, lng=20.0), (0.45, 20.0)),
+        # 22 km across the antimeridian
+        (Point(lat=0.0, lng=179.9), (0.0, -179.9)),
+    ],
+)
+async def test_search_orders_within_radius_edges(
+    test_client: AsyncClient, test_uow: UnitOfWork, center: Point, pickup: tuple[float, float]
+) -> None:
+    """Test that the coarse check in degrees doesn't drop pickups within the radius."""
+    order = await OrderFactory.create_(uow=test_uow, start_point=point_wkt(*pickup))
+
+    response = await test_client.get(
+        url=Urls.Orders.SEARCH_RADIUS,
+        params={"lat": center.lat, "lng": center.lng, "radius_km": 50},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert [item["id"] for item in response.json()["items"]] == [order.id]
+
+
+@pytest.mark.anyio
+async def test_search_orders_within_box(
+    test_client: AsyncClient,
+    test_uow: UnitOfWork,
+) -> None:
+    """Test that only orders with pickup within the box are found."""
+    ids = await create_orders(test_uow)
+
+    response = await test_client.get(
+        url=Urls.Orders.SEARCH_BOX,
+        params={"min_lat": 50.4, "min_lng": 30.6, "max_lat": 50.5, "max_lng": 30.7},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert [item["id"] for item in response.json()["items"]] == [ids["10 km east"]]
+
+
+@pytest.mark.anyio
+async def test_search_orders_within_box_invalid(test_client: AsyncClient) -> None:
+    """Test that inverted box corners are rejected."""
+    response = await test_client.get(
+        url=Urls.Orders.SEARCH_BOX,
+        params={"min_lat": 51, "min_lng": 30.6, "max_lat": 50.5, "max_lng": 30.7},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.anyio
+async def test_search_nearest_orders(
+    test_client: AsyncClient,
+    test_uow: UnitOfWork,
+) -> None:
+    """Test that orders are ordered by pickup distance and paginated."""
+    ids = await create_orders(test_uow)
+    params = {"lat": KYIV.lat, "lng": KYIV.lng, "page_size": 3}
+
+    response = await test_client.get(url=Urls.Orders.SEARCH_NEAREST, params=params)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    response_json = response.json()
+    assert [item["id"] for item in response_json["items"]] == [
+        ids["center"],
+        ids["3 km north"],
+        ids["10 km east"],
+    ]
+    assert response_json["total"] is None
+
+    response = await test_client.get(url=Urls.Orders.SEARCH_NEAREST, params={**params, "page": 2})
+    assert [item["id"] for item in response.json()["items"]] == [ids["Lviv"]]
+
+
+@pytest.mark.anyio
+async def test_radius_search_uses_gist_index(test_uow: UnitOfWork) -> None:
+    await create_orders(test_uow)
+
+    plans = await explain_queries(
+        test_uow,
+        lambda: test_uow.order.get_paginated_within_radius(
+            KYIV, radius_km=5, page=1, page_size=20, count=CountMode.NONE
+        ),
+    )
+
+    assert "idx_orders_start_point" in plans[0], plans[0]
+
+
+@pytest.mark.anyio
+async def test_box_search_uses_gist_index(test_uow: UnitOfWork) -> None:
+    await create_orders(test_uow)
+
+    plans = await explain_queries(
+        test_uow,
+        lambda: test_uow.order.get_paginated_within_box(
+            Point(lat=50.4, lng=30.6), Point(lat=50.5, lng=30.7), page=1, page_size=20
+        ),
+    )
+
+    assert "idx_orders_start_point" in plans[0], plans[0]
+
+
+@pytest.mark.anyio
+async def test_nearest_search_uses_gist_index_ordering(test_uow: UnitOfWork) -> None:
+    await create_orders(test_uow)
+
+    plans = await explain_queries(
+        test_uow, lambda: test_uow.order.get_paginated_nearest(KYIV, page=1, page_size=3)
+    )
+
+    # KNN: rows come from the index already ordered by distance
+    assert "Index Scan using idx_orders_start_point" in plans[0], plans[0]
+    assert "Order By: (start_point <->" in plans[0], plans[0]
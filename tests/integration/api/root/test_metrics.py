@@ -0,0 +1,22 @@
+import pytest
+from httpx import AsyncClient
+from starlette import status
+
+from tests.constants import Urls
+
+
+@pytest.mark.anyio
+async def test_metrics(test_client: AsyncClient) -> None:
+    response = await test_client.get(url=Urls.Users.GET_ALL)
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+    response = await test_client.get(url=Urls.METRICS)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.headers["content-type"].startswith("text/plain")
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="/api/v1/users",status="200"}'
+    ) in response.text
+    assert (
+        'db_statement_duration_seconds_count{operation="UserRepository.get_paginated_dicts"}'
+        in (response.text)
+    )
@@ -21,3 +21,37 @@ async def test_get_users_success(
     assert isinstance(response_json, dict)
     items = response_json.get("items", [])
     assert len(items) == 3  # 2 users created by UserFactory + 1 admin user created for test_client
+
+
+@pytest.mark.anyio
+async def test_get_users_cursor_mode(
+    test_client: AsyncClient,
+    test_uow: UnitOfWork,
+) -> None:
+    for _ in range(3):
+        await UserFactory.create_(uow=test_uow)
+
+    response = await test_client.get(url=Urls.Users.GET_ALL, params={"page_size": 2})
+    assert response.status_code == status.HTTP_200_OK
+    first_page = response.json()
+    assert first_page["total"] == 4  # 3 users created by UserFactory + 1 admin user
+
+    params = {"page_size": 2, "after": first_page["next_cursor"]}
+    response = await test_client.get(url=Urls.Users.GET_ALL, params=params)
+    assert response.status_code == status.HTTP_200_OK
+    second_page = response.json()
+    assert second_page["page"] is None
+
+    ids = [item["id"] for item in first_page["items"] + second_page["items"]]
+    assert ids == sorted(ids)
+    assert len(set(ids)) == 4
+
+    # The last page is full, so it has a cursor, which leads to an empty page
+    params = {"page_size": 2, "after": second_page["next_cursor"]}
+    response = await test_client.get(url=Urls.Users.GET_ALL, params=params)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["items"] == []
+    assert response.json()["next_cursor"] is None
+
+    response = await test_client.get(url=Urls.Users.GET_ALL, params={"page_size": 2, "page": 3})
+    assert response.status_code == status.HTTP_404_NOT_FOUND
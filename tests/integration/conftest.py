@@ -17,7 +17,7 @@ from testcontainers.postgres import PostgresContainer  # type: ignore[import-unt
 
 from app.api.authentication.utils import generate_access_token
 from app.db.database import DatabaseSessionManager
-from app.dependencies.db import get_unit_of_work
+from app.dependencies.db import get_database, get_unit_of_work
 from app.dependencies.settings import get_settings
 from app.domain import MinimalBase
 from app.main import fastapi_app
@@ -122,7 +122,11 @@ async def test_app(_migrate_database, test_settings: TestSettings) -> FastAPI:
         async with UnitOfWork(db) as uow:
             yield uow
 
+    async def override_get_database() -> DatabaseSessionManager:
+        return fastapi_app.extra["db_session_manager"]
+
     fastapi_app.dependency_overrides[get_settings] = override_get_settings
+    fastapi_app.dependency_overrides[get_database] = override_get_database
     fastapi_app.dependency_overrides[get_unit_of_work] = override_get_unit_of_work
 
     return fastapi_app
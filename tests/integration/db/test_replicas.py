@@ -0,0 +1,90 @@
+from collections.abc import Iterator
+from urllib.parse import urlparse, urlunparse
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from testcontainers.postgres import PostgresContainer  # type: ignore[import-untyped]
+
+from app.db.database import DatabaseSessionManager
+from app.domain import MinimalBase
+from app.uow.unit_of_work import UnitOfWork
+from tests.conftest import TestSettings
+from tests.factories import UserFactory
+
+REPLICA_DB = "test_tupy_backend_replica"
+REPLICA_EMAIL = "replica@example.com"
+
+
+@pytest.fixture(scope="module")
+def replica_container(test_settings: TestSettings) -> Iterator[str]:
+    """Second PostgreSQL instance standing in for a read replica, return its URI."""
+    parsed = urlparse(test_settings.DATABASE_URI)
+    container = PostgresContainer(
+        image=test_settings.POSTGRES_DOCKER_IMAGE,
+        dbname=REPLICA_DB,
+        username=parsed.username,
+        password=parsed.password,
+    )
+    with container as instance:
+        hostname = instance.get_container_host_ip()
+        port = int(instance.get_exposed_port(5432))
+        netloc = f"{parsed.username}:{parsed.password}@{hostname}:{port}"
+        yield urlunparse((parsed.scheme, netloc, f"/{REPLICA_DB}", "", "", ""))
+
+
+@pytest.fixture
+async def replica_uri(replica_container: str) -> str:
+    """Replica with the schema and one user which is not on the primary."""
+    engine = create_async_engine(replica_container)
+    async with engine.begin() as connection:
+        await connection.execute(text("CREATE EXTENSION IF NOT EXISTS postgis"))
+        await connection.run_sync(MinimalBase.metadata.drop_all)
+        await connection.run_sync(MinimalBase.metadata.create_all)
+    await engine.dispose()
+
+    database = DatabaseSessionManager(replica_container)
+    async with UnitOfWork(database.get_db()) as uow:
+        await UserFactory.create_(uow=uow, email=REPLICA_EMAIL)
+    await database.dispose()
+    return replica_container
+
+
+@pytest.mark.anyio
+async def test_reads_are_routed_to_replica(
+    test_uow: UnitOfWork, test_settings: TestSettings, replica_uri: str
+) -> None:
+    primary_user = await UserFactory.create_(uow=test_uow)
+    database = DatabaseSessionManager(test_settings.DATABASE_URI, replica_urls=[replica_uri])
+    try:
+        async with UnitOfWork(database.get_db()) as uow:
+            assert await uow.user.get_by_email(REPLICA_EMAIL) is not None
+            assert await uow.user.get_by_email(primary_user.email) is None
+
+            # After a write the session reads its own writes from the primary
+            user = await UserFactory.create_(uow=uow)
+            assert await uow.user.get_by_email(user.email) is not None
+            assert await uow.user.get_by_email(primary_user.email) is not None
+            assert await uow.user.get_by_email(REPLICA_EMAIL) is None
+
+        # Stickiness is per unit of work
+        async with UnitOfWork(database.get_db()) as uow:
+            assert await uow.user.get_by_email(REPLICA_EMAIL) is not None
+
+        metrics = database.pool_metrics()
+        assert metrics["replicas"][0]["wait"]["count"] == 2
+    finally:
+        await database.dispose()
+
+
+@pytest.mark.anyio
+async def test_text_statements_go_to_primary(
+    test_uow: UnitOfWork, test_settings: TestSettings, replica_uri: str
+) -> None:
+    database = DatabaseSessionManager(test_settings.DATABASE_URI, replica_urls=[replica_uri])
+    try:
+        async with UnitOfWork(database.get_db()) as uow:
+            result = await uow.execute(text("SELECT current_database()"))
+            assert result.scalar_one() == test_settings.POSTGRES_DB
+    finally:
+        await database.dispose()
@@ -0,0 +1,42 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from app.domain import CachedRoute
+from app.uow.unit_of_work import UnitOfWork
+
+
+def cached_route(version: str, start_lat: float, expires_at: datetime) -> CachedRoute:
+    return CachedRoute(
+        dataset_version=version,
+        start_lat=start_lat,
+        start_lng=30.5,
+        end_lat=50.5,
+        end_lng=30.8,
+        distance_km=20.0,
+        duration_minutes=30.0,
+        expires_at=expires_at,
+    )
+
+
+@pytest.mark.anyio
+async def test_purge_route_cache(test_uow: UnitOfWork) -> None:
+    now = datetime.now()  # noqa: DTZ005 the column is a naive local time
+    test_uow.session.add_all(
+        [
+            cached_route("v2", 50.1, expires_at=now + timedelta(hours=1)),
+            cached_route("v2", 50.2, expires_at=now - timedelta(hours=1)),
+            cached_route("v1", 50.3, expires_at=now + timedelta(hours=1)),
+        ]
+    )
+    await test_uow.commit()
+
+    assert await test_uow.route_cache.purge() == 1
+    await test_uow.commit()
+
+    # Routes of other dataset versions are kept for workers of a rolling deploy until they expire
+    result = await test_uow.execute(
+        select(CachedRoute.dataset_version, CachedRoute.start_lat).order_by(CachedRoute.start_lat)
+    )
+    assert result.all() == [("v2", 50.1), ("v1", 50.3)]
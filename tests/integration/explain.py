@@ -0,0 +1,36 @@
+from collections.abc import Awaitable, Callable
+from typing import Any
+from unittest.mock import patch
+
+from sqlalchemy import ClauseElement, text
+from sqlalchemy.dialects import postgresql
+
+from app.uow.unit_of_work import UnitOfWork
+
+
+async def explain_queries(uow: UnitOfWork, call: Callable[[], Awaitable[object]]) -> list[str]:
+    """
+    Run `call` and return EXPLAIN plans of the queries it executed.
+
+    Sequential scans are disabled for the rest of the transaction: tables in tests are too small
+    for the planner to prefer indexes, but the plan shows whether an index can be used at all.
+    """
+    await uow.execute(text("SET LOCAL enable_seqscan = off"))
+    statements: list[ClauseElement] = []
+    execute = uow.session.execute
+
+    async def capture(statement: Any, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        statements.append(statement)
+        return await execute(statement, *args, **kwargs)
+
+    with patch.object(uow.session, "execute", capture):
+        await call()
+
+    plans = []
+    for statement in statements:
+        sql = statement.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+        result = await uow.execute(text(f"EXPLAIN {sql}"))
+        plans.append("\n".join(result.scalars()))
+    return plans
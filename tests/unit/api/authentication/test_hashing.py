@@ -0,0 +1,40 @@
+from collections.abc import Generator
+
+import pytest
+
+from app.api.authentication.hashing import PasswordHasher
+from app.api.exceptions import ServiceUnavailableError
+
+
+@pytest.fixture
+def hasher() -> Generator[PasswordHasher]:
+    hasher = PasswordHasher(max_workers=1, max_concurrency=1, queue_timeout=0.05)
+    yield hasher
+    hasher.shutdown()
+
+
+@pytest.mark.anyio
+async def test_hash_and_verify_in_pool(hasher: PasswordHasher):
+    hashed = await hasher.hash("supersecret")
+    assert hashed != "supersecret"
+    assert await hasher.verify("supersecret", hashed)
+    assert not await hasher.verify("wrongpassword", hashed)
+
+    metrics = hasher.metrics()
+    assert metrics["latency"]["count"] == 3
+    assert metrics["in_flight"] == 0
+    assert metrics["queue_depth"] == 0
+
+
+@pytest.mark.anyio
+async def test_queue_timeout_raises_service_unavailable(hasher: PasswordHasher):
+    # Occupy the only slot, so the next call has to wait in the queue
+    await hasher._semaphore.acquire()
+
+    with pytest.raises(ServiceUnavailableError):
+        await hasher.hash("supersecret")
+
+    metrics = hasher.metrics()
+    assert metrics["rejected"] == 1
+    assert metrics["queue_depth"] == 0
+    assert metrics["latency"]["count"] == 0
@@ -0,0 +1,86 @@
+import time
+
+import pytest
+
+from app.api.authentication.utils import get_request_user
+from app.dependencies.caches import get_principal_cache
+from app.domain import User, UserRoles
+from tests.conftest import TestSettings
+
+PAYLOAD: dict = {
+    "user_id": 1,
+    "email": "bob.feta@example.com",
+    "first_name": "Bob",
+    "last_name": "Feta",
+    "role": UserRoles.DISPATCHER.value,
+}
+
+
+class FakeUserRepository:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def get_by_id(self, user_id: int) -> User:
+        self.calls += 1
+        return User(
+            id=user_id,
+            email=PAYLOAD["email"],
+            first_name=PAYLOAD["first_name"],
+            last_name=PAYLOAD["last_name"],
+            role=UserRoles.DISPATCHER,
+            hashed_password="hash",
+        )
+
+
+class FakeUnitOfWork:
+    def __init__(self) -> None:
+        self.user = FakeUserRepository()
+        self.releases = 0
+
+    async def release(self) -> None:
+        self.releases += 1
+
+
+@pytest.mark.anyio
+async def test_get_request_user_uses_principal_cache(test_settings: TestSettings):
+    uow = FakeUnitOfWork()
+    cache = get_principal_cache()
+    cache.clear()
+
+    for _ in range(3):
+        user = await get_request_user(
+            payload=PAYLOAD,
+            settings=test_settings,
+            uow=uow,  # type: ignore[arg-type]
+        )
+        assert user.id == PAYLOAD["user_id"]
+        assert user.email == PAYLOAD["email"]
+        assert user.role == UserRoles.DISPATCHER
+
+    assert uow.user.calls == 1
+    # The connection is returned right after the lookup
+    assert uow.releases == 1
+    principal = cache.get(PAYLOAD["user_id"])
+    assert principal
+    assert "hashed_password" not in principal
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("issued_ago", "expected_db_calls"),
+    [
+        (0, 0),  # fresh token, claims are trusted
+        (3600, 1),  # stale token, user is loaded from DB
+    ],
+)
+async def test_get_request_user_stateless(issued_ago, expected_db_calls):
+    settings = TestSettings(AUTH_STATELESS=True, AUTH_STATELESS_FRESHNESS_SECONDS=60)
+    uow = FakeUnitOfWork()
+    get_principal_cache().clear()
+    payload = {**PAYLOAD, "iat": int(time.time()) - issued_ago}
+
+    user = await get_request_user(payload=payload, settings=settings, uow=uow)
+
+    assert user.id == PAYLOAD["user_id"]
+    assert user.role == UserRoles.DISPATCHER
+    assert uow.user.calls == expected_db_calls
@@ -1,8 +1,11 @@
+import time
+
 import jwt
 import pytest
 from fastapi.security import HTTPAuthorizationCredentials
 
 from app.api.authentication import utils
+from app.dependencies.caches import get_token_cache
 from tests.conftest import TestSettings
 
 
@@ -36,6 +39,49 @@ async def test_get_token_payload_valid(test_settings: TestSettings):
     token_str = jwt.encode(payload, test_settings.SECRET_KEY, algorithm=test_settings.ALGORITHM)
 
     token = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token_str)
-    result = utils.get_token_payload(token=token, settings=test_settings)
+    result = await utils.get_token_payload(token=token, settings=test_settings)
 
     assert result == payload
+
+
+@pytest.mark.anyio
+async def test_get_token_payload_cached_until_expiration(test_settings: TestSettings):
+    token_cache = get_token_cache()
+    token_cache.clear()
+    payload = {"user_id": 1, "exp": int(time.time()) + 60}
+    token_str = jwt.encode(payload, test_settings.SECRET_KEY, algorithm=test_settings.ALGORITHM)
+    token = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token_str)
+
+    hits, misses = token_cache.hits, token_cache.misses
+    for _ in range(3):
+        assert await utils.get_token_payload(token=token, settings=test_settings) == payload
+
+    assert token_cache.misses - misses == 1
+    assert token_cache.hits - hits == 2
+    assert len(token_cache) == 1
+
+
+@pytest.mark.anyio
+async def test_get_token_payload_invalid_token_is_not_cached(test_settings: TestSettings):
+    token_cache = get_token_cache()
+    token_cache.clear()
+    token_str = jwt.encode({"user_id": 1}, "another-secret", algorithm=test_settings.ALGORITHM)
+    token = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token_str)
+
+    assert await utils.get_token_payload(token=token, settings=test_settings) == {}
+    assert len(token_cache) == 0
+
+
+@pytest.mark.anyio
+async def test_get_token_payload_cache_keeps_no_secret(test_settings: TestSettings):
+    token_cache = get_token_cache()
+    token_cache.clear()
+    payload = {"user_id": 1, "exp": int(time.time()) + 60}
+    token_str = jwt.encode(payload, test_settings.SECRET_KEY, algorithm=test_settings.ALGORITHM)
+    token = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token_str)
+
+    await utils.get_token_payload(token=token, settings=test_settings)
+
+    [cache_key] = token_cache._data
+    assert test_settings.SECRET_KEY not in cache_key
+    assert token_str not in cache_key
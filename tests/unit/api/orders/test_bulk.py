@@ -0,0 +1,157 @@
+import json
+from collections.abc import AsyncIterator
+
+import pytest
+from sqlalchemy.exc import OperationalError
+from starlette.requests import Request
+
+from app.api.exceptions import PayloadTooLargeError
+from app.api.orders.bulk import RowError, import_orders, iter_ndjson, read_body
+
+ORDER = {"start_point": {"lat": 50.45, "lng": 30.52}, "end_point": {"lat": 50.51, "lng": 30.79}}
+
+
+async def stream(*chunks: bytes) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+async def rows(*items: object) -> AsyncIterator[object]:
+    for item in items:
+        yield item
+
+
+class FakeOrderRepository:
+    def __init__(self, fail_on_call: int | None = None) -> None:
+        self.calls: list[list[dict]] = []
+        self.fail_on_call = fail_on_call
+
+    async def bulk_create(self, values: list[dict]) -> None:
+        self.calls.append(values)
+        if len(self.calls) == self.fail_on_call:
+            statement = "INSERT INTO orders"
+            raise OperationalError(statement, {}, Exception("connection lost"))
+
+
+class FakeUnitOfWork:
+    def __init__(self, order: FakeOrderRepository) -> None:
+        self.order = order
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        self.rollbacks += 1
+
+
+@pytest.mark.anyio
+async def test_iter_ndjson_lines_split_between_chunks():
+    body = (json.dumps(ORDER) + "\n\n{broken\n" + json.dumps({"name": "last"})).encode()
+
+    items = [item async for item in iter_ndjson(stream(body[:10], body[10:37], body[37:]))]
+
+    assert items[0] == ORDER
+    assert isinstance(items[1], RowError)
+    assert items[2] == {"name": "last"}
+
+
+@pytest.mark.anyio
+async def test_import_orders_reports_invalid_rows():
+    uow = FakeUnitOfWork(FakeOrderRepository())
+    invalid_point = {**ORDER, "start_point": {"lat": 100, "lng": 30}}
+
+    result = await import_orders(
+        rows(ORDER, invalid_point, ORDER, RowError("Invalid JSON."), ORDER),
+        uow=uow,  # type: ignore[arg-type]
+        chunk_size=2,
+        max_rows=100,
+        max_errors=100,
+    )
+
+    assert result["received"] == 5
+    assert result["created"] == 3
+    assert result["failed"] == 2
+    assert [error["index"] for error in result["errors"]] == [1, 3]
+    assert result["errors"][0]["errors"][0]["loc"] == ("start_point", "lat")
+    assert result["errors"][1]["errors"][0]["type"] == "json_invalid"
+    # One transaction per chunk
+    assert [len(values) for values in uow.order.calls] == [1, 1, 1]
+    assert uow.commits == 3
+
+
+@pytest.mark.anyio
+async def test_import_orders_continues_after_failed_chunk():
+    uow = FakeUnitOfWork(FakeOrderRepository(fail_on_call=1))
+
+    result = await import_orders(
+        rows(ORDER, ORDER, ORDER),
+        uow=uow,  # type: ignore[arg-type]
+        chunk_size=2,
+        max_rows=100,
+        max_errors=100,
+    )
+
+    assert result["created"] == 1
+    assert [error["index"] for error in result["errors"]] == [0, 1]
+    assert result["errors"][0]["errors"][0]["type"] == "database_error"
+    assert uow.rollbacks == 1
+    assert uow.commits == 1
+
+
+@pytest.mark.anyio
+async def test_import_orders_returns_first_errors_only():
+    uow = FakeUnitOfWork(FakeOrderRepository())
+
+    result = await import_orders(
+        rows(*[RowError("Invalid JSON.")] * 5, ORDER),
+        uow=uow,  # type: ignore[arg-type]
+        chunk_size=2,
+        max_rows=100,
+        max_errors=3,
+    )
+
+    assert result["created"] == 1
+    assert result["failed"] == 5
+    assert [error["index"] for error in result["errors"]] == [0, 1, 2]
+
+
+@pytest.mark.anyio
+async def test_import_orders_rejects_too_many_rows():
+    uow = FakeUnitOfWork(FakeOrderRepository())
+
+    with pytest.raises(PayloadTooLargeError, match="2 orders of the first 2 rows were created"):
+        await import_orders(
+            rows(ORDER, ORDER, ORDER),
+            uow=uow,  # type: ignore[arg-type]
+            chunk_size=2,
+            max_rows=2,
+            max_errors=100,
+        )
+
+
+def build_request(*chunks: bytes, content_length: int | None = None) -> Request:
+    headers = [] if content_length is None else [(b"content-length", str(content_length).encode())]
+    messages = [{"type": "http.request", "body": chunk, "more_body": True} for chunk in chunks]
+    messages.append({"type": "http.request", "body": b"", "more_body": False})
+
+    async def receive() -> dict:
+        return messages.pop(0)
+
+    return Request({"type": "http", "method": "POST", "headers": headers}, receive)
+
+
+@pytest.mark.anyio
+async def test_read_body_limits_size():
+    body = [chunk async for chunk in read_body(build_request(b"12", b"34"), max_bytes=4)]
+    assert b"".join(body) == b"1234"
+
+    # Chunked upload is stopped once it is too large
+    with pytest.raises(PayloadTooLargeError):
+        _ = [chunk async for chunk in read_body(build_request(b"12", b"345"), max_bytes=4)]
+
+    # Declared size is rejected before the body is read
+    request = build_request(content_length=5)
+    with pytest.raises(PayloadTooLargeError):
+        await anext(read_body(request, max_bytes=4))
@@ -0,0 +1,78 @@
+import csv
+import io
+import json
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import NamedTuple
+
+import pyarrow as pa  # type: ignore[import-untyped]
+import pytest
+
+from app.api.orders.export import encode_arrow, encode_csv, encode_ndjson
+from app.uow.order.repository import EXPORT_FIELDS
+
+CREATED_AT = datetime.fromisoformat("2026-01-03T00:00:00")
+
+
+class ExportRow(NamedTuple):
+    id: int
+    name: str
+    description: str | None
+    start_lat: float
+    start_lng: float
+    end_lat: float
+    end_lng: float
+    distance_km: float | None
+    duration_minutes: float | None
+    created_at: datetime
+
+
+ROWS = [
+    ExportRow(1, "First", None, 50.45, 30.52, 50.51, 30.79, 21.5, 30.0, CREATED_AT),
+    ExportRow(2, "Second", "Fragile", 49.84, 24.03, 49.85, 24.05, None, None, CREATED_AT),
+    ExportRow(3, "Third", None, 46.48, 30.72, 46.49, 30.74, 1.5, 4.0, CREATED_AT),
+]
+
+
+def test_export_row_matches_export_columns():
+    assert list(ExportRow._fields) == EXPORT_FIELDS
+
+
+async def batches() -> AsyncIterator[list]:
+    yield ROWS[:2]
+    yield ROWS[2:]
+
+
+async def collect(chunks: AsyncIterator[bytes]) -> list[bytes]:
+    return [chunk async for chunk in chunks]
+
+
+@pytest.mark.anyio
+async def test_encode_ndjson():
+    chunks = await collect(encode_ndjson(batches()))
+
+    assert len(chunks) == 2
+    rows = [json.loads(line) for line in b"".join(chunks).splitlines()]
+    assert rows[1]["description"] == "Fragile"
+    assert rows[2]["created_at"] == "2026-01-03T00:00:00"
+
+
+@pytest.mark.anyio
+async def test_encode_csv():
+    chunks = await collect(encode_csv(batches()))
+
+    rows = list(csv.DictReader(io.StringIO(b"".join(chunks).decode())))
+    assert [row["id"] for row in rows] == ["1", "2", "3"]
+    assert rows[1]["distance_km"] == ""
+
+
+@pytest.mark.anyio
+async def test_encode_arrow():
+    chunks = await collect(encode_arrow(batches()))
+
+    reader = pa.ipc.open_stream(b"".join(chunks))
+    record_batches = list(reader)
+    assert [batch.num_rows for batch in record_batches] == [2, 1]
+    table = pa.Table.from_batches(record_batches)
+    assert table.column("name").to_pylist() == ["First", "Second", "Third"]
+    assert table.column("distance_km").to_pylist() == [21.5, None, 1.5]
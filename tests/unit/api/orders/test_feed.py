@@ -0,0 +1,28 @@
+import pytest
+
+from app.api.orders.feed import stream_events
+from app.feed.hub import OrderFeedHub
+from tests.unit.feed.test_hub import FakeServer
+
+
+@pytest.mark.anyio
+async def test_stream_events():
+    server = FakeServer()
+    hub = OrderFeedHub(server.connect, queue_size=1)
+    stream = stream_events(hub, heartbeat=0.01)
+
+    assert await anext(stream) == "retry: 3000\n\n"
+    assert await anext(stream) == ": heartbeat\n\n"
+
+    connection = await server.wait_connection()
+    connection.notify({"type": "created", "order": {"id": 1}})
+    assert await anext(stream) == 'event: created\ndata: {"id": 1}\n\n'
+
+    # The client doesn't read, the queue overflows
+    connection.notify({"type": "updated", "order": {"id": 1}})
+    connection.notify({"type": "updated", "order": {"id": 2}})
+    assert await anext(stream) == "event: dropped\ndata: null\n\n"
+    with pytest.raises(StopAsyncIteration):
+        await anext(stream)
+    assert hub.metrics()["subscribers"] == 0
+    await hub.close()
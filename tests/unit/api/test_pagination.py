@@ -0,0 +1,15 @@
+import pytest
+
+from app.api.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor("2025-08-10T19:28:42.964218", 42)
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == ["2025-08-10T19:28:42.964218", 42]
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor("x")[:-2], "e30"])
+def test_decode_invalid_cursor(cursor):
+    with pytest.raises(ValueError):  # noqa: PT011
+        decode_cursor(cursor)
@@ -0,0 +1,67 @@
+import json
+from datetime import UTC, datetime
+
+from app.api.orders.schemas import OrdersSchema, orders_page_adapter
+from app.api.serialization import json_response
+from app.api.users.schemas import UsersSchema, users_page_adapter
+from app.domain import CountMode, UserRoles
+
+
+def make_page(items: list[dict]) -> dict:
+    return {
+        "items": items,
+        "total": 100,
+        "count": CountMode.ESTIMATED,
+        "page": None,
+        "page_size": 2,
+        "next_cursor": "abc",
+    }
+
+
+def test_orders_page_matches_response_model():
+    created_at = datetime(2025, 1, 1, tzinfo=UTC)
+    items = [
+        {
+            "id": 1,
+            "name": "Заказ",
+            "description": None,
+            "distance_km": 1.5,
+            "duration_minutes": 3.25,
+            "courier_id": None,
+            "created_at": created_at,
+        },
+        {
+            "id": 2,
+            "name": None,
+            "description": "Fragile",
+            "distance_km": None,
+            "duration_minutes": None,
+            "courier_id": 7,
+            "created_at": created_at,
+        },
+    ]
+    response = json_response(orders_page_adapter, make_page(items))
+
+    assert response.media_type == "application/json"
+    # Columns selected only for the cursor are not in the response
+    fields = [{key: value for key, value in item.items() if key != "created_at"} for item in items]
+    expected = OrdersSchema.model_validate(make_page(fields))
+    assert json.loads(response.body) == json.loads(expected.model_dump_json())
+    assert "created_at" not in response.body.decode()
+
+
+def test_users_page_matches_response_model():
+    items = [
+        {
+            "id": 1,
+            "email": "admin@example.com",
+            "first_name": "John",
+            "last_name": "Doe",
+            "role": UserRoles.ADMIN,
+        },
+    ]
+    response = json_response(users_page_adapter, make_page(items))
+
+    expected = UsersSchema.model_validate(make_page(items))
+    assert json.loads(response.body) == json.loads(expected.model_dump_json())
+    assert json.loads(response.body)["items"][0]["role"] == "ADMIN"
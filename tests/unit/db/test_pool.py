@@ -0,0 +1,32 @@
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.util import greenlet_spawn
+
+from app.db.pool import InstrumentedPool
+
+
+@pytest.mark.anyio
+async def test_pool_metrics():
+    pool = InstrumentedPool(MagicMock, pool_size=1, max_overflow=1, timeout=0.01)
+
+    first = await greenlet_spawn(pool.connect)
+    second = await greenlet_spawn(pool.connect)
+    metrics = pool.metrics()
+    assert metrics["checked_out"] == 2
+    assert metrics["overflow"] == 1
+
+    # Both connections are in use, the third checkout waits and times out
+    with pytest.raises(exc.TimeoutError):
+        await greenlet_spawn(pool.connect)
+
+    second.close()
+    first.close()
+    metrics = pool.metrics()
+    assert metrics["checked_out"] == 0
+    assert metrics["idle"] == 1
+    assert metrics["overflow"] == 0
+    assert metrics["timeouts"] == 1
+    assert metrics["wait"]["count"] == 3
+    assert metrics["wait"]["sum"] >= 0.01
@@ -0,0 +1,47 @@
+import itertools
+from functools import partial
+
+from sqlalchemy import Engine, select, text, update
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db.routing import RoutingSession
+from app.domain import User
+
+
+def make_engine(host: str) -> Engine:
+    # Engines don't connect until used
+    return create_async_engine(f"postgresql+asyncpg://test:test@{host}/test_db").sync_engine
+
+
+PRIMARY = make_engine("primary")
+REPLICAS = [make_engine("replica-1"), make_engine("replica-2")]
+
+
+def make_session_factory():
+    replicas = itertools.cycle(REPLICAS)
+    return partial(RoutingSession, bind=PRIMARY, next_replica=partial(next, replicas))
+
+
+def test_reads_go_to_one_replica_per_session():
+    session_factory = make_session_factory()
+    session = session_factory()
+    assert session.get_bind(User, clause=select(User)) is REPLICAS[0]
+    assert session.get_bind(User, clause=select(User.id)) is REPLICAS[0]
+    # Replicas are picked round robin
+    assert session_factory().get_bind(User, clause=select(User)) is REPLICAS[1]
+
+
+def test_writes_go_to_primary():
+    session = make_session_factory()()
+    assert session.get_bind(User, clause=select(User).with_for_update()) is PRIMARY
+    assert session.get_bind(clause=text("SELECT 1")) is PRIMARY
+    assert session.get_bind(User, clause=update(User).values(first_name="John")) is PRIMARY
+
+
+def test_session_sticks_to_primary_after_write():
+    session = make_session_factory()()
+    assert session.get_bind(User, clause=select(User)) is REPLICAS[0]
+    session.get_bind(User, clause=update(User).values(first_name="John"))
+    assert session.sticky
+    # Own writes are visible, replicas may lag behind
+    assert session.get_bind(User, clause=select(User)) is PRIMARY
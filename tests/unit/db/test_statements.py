@@ -0,0 +1,49 @@
+from types import SimpleNamespace
+
+from sqlalchemy.engine import default
+
+from app.db.statements import StatementCacheMetrics
+
+
+def make_connection(prepared: dict | None) -> SimpleNamespace:
+    dbapi_connection = SimpleNamespace(_prepared_statement_cache=prepared)
+    return SimpleNamespace(connection=SimpleNamespace(dbapi_connection=dbapi_connection))
+
+
+def execute(metrics: StatementCacheMetrics, connection: SimpleNamespace, cache_hit: object) -> None:
+    context = SimpleNamespace(cache_hit=cache_hit)
+    metrics._before_cursor_execute(
+        connection,  # type: ignore[arg-type]
+        cursor=None,
+        statement="SELECT 1",
+        parameters=(),
+        context=context,
+        executemany=False,
+    )
+
+
+def test_statement_cache_metrics():
+    metrics = StatementCacheMetrics()
+    prepared: dict = {}
+    connection = make_connection(prepared)
+
+    execute(metrics, connection, default.CACHE_MISS)
+    prepared["SELECT 1"] = "statement"
+    execute(metrics, connection, default.CACHE_HIT)
+    execute(metrics, connection, default.CACHE_HIT)
+
+    assert metrics.metrics() == {
+        "compiled_hits": 2,
+        "compiled_misses": 1,
+        "compiled_hit_rate": 2 / 3,
+        "prepared_hits": 2,
+        "prepared_misses": 1,
+        "prepared_hit_rate": 2 / 3,
+    }
+
+
+def test_statement_cache_metrics_without_prepared_cache():
+    metrics = StatementCacheMetrics()
+    execute(metrics, make_connection(None), default.CACHE_HIT)
+    assert metrics.metrics()["prepared_hit_rate"] == 0.0
+    assert metrics.metrics()["compiled_hit_rate"] == 1.0
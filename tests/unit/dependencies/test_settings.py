@@ -0,0 +1,57 @@
+import pytest
+from pydantic import ValidationError
+
+from app.config import STARTUP_SETTINGS, Settings
+from app.dependencies import settings as settings_module
+
+
+@pytest.fixture(autouse=True)
+def _reset_settings(monkeypatch) -> None:
+    monkeypatch.setattr(settings_module, "_settings", None)
+
+
+def test_get_settings_returns_same_snapshot():
+    assert settings_module.get_settings() is settings_module.get_settings()
+
+
+def test_settings_snapshot_is_frozen():
+    settings = settings_module.get_settings()
+    with pytest.raises(ValidationError):
+        settings.TITLE = "Changed"
+
+
+def test_reload_settings_swaps_snapshot(monkeypatch):
+    old_settings = settings_module.get_settings()
+    monkeypatch.setenv("TITLE", "Reloaded Title")
+
+    new_settings = settings_module.reload_settings()
+
+    assert new_settings is not old_settings
+    assert new_settings.TITLE == "Reloaded Title"
+    assert settings_module.get_settings() is new_settings
+
+
+def test_reload_settings_keeps_previous_snapshot_on_error(monkeypatch):
+    old_settings = settings_module.get_settings()
+    monkeypatch.setenv("PORT", "not-a-port")
+
+    with pytest.raises(ValidationError):
+        settings_module.reload_settings()
+    settings_module._reload_on_signal()  # must only log the error
+
+    assert settings_module.get_settings() is old_settings
+
+
+def test_startup_settings_exist():
+    assert set(Settings.model_fields) >= STARTUP_SETTINGS
+
+
+def test_restart_required(monkeypatch):
+    previous = settings_module.get_settings()
+    monkeypatch.setenv("DB_POOL_SIZE", str(previous.DB_POOL_SIZE + 1))
+    monkeypatch.setenv("DISPATCH_MAX_SIZE", str(previous.DISPATCH_MAX_SIZE + 1))
+
+    current = settings_module.reload_settings()
+
+    # DISPATCH_MAX_SIZE is read per request, the pool is created on startup
+    assert settings_module.restart_required(previous, current) == ["DB_POOL_SIZE"]
@@ -0,0 +1,75 @@
+from itertools import permutations
+
+import numpy as np
+import pytest
+
+from app.dispatch.assignment import Solver, assign, haversine_matrix
+
+KYIV = (50.4501, 30.5234)
+LVIV = (49.8397, 24.0297)
+ODESA = (46.4825, 30.7233)
+
+
+def random_points(count: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.uniform((50.3, 30.3), (50.6, 30.8), size=(count, 2))
+
+
+def test_haversine_matrix():
+    distances = haversine_matrix(np.array([KYIV, LVIV]), np.array([KYIV, LVIV, ODESA]))
+
+    assert distances.shape == (2, 3)
+    assert distances[0, 0] == 0
+    assert distances[0, 1] == pytest.approx(468, abs=1)
+    assert distances[1, 0] == pytest.approx(distances[0, 1])
+    assert distances[0, 2] == pytest.approx(441, abs=1)
+
+
+@pytest.mark.parametrize("solver", list(Solver))
+def test_assign_square(solver: Solver):
+    cost = np.array([[4.0, 1.0, 3.0], [2.0, 0.0, 5.0], [3.0, 2.0, 2.0]])
+
+    assignments = assign(cost, solver)
+
+    assert [(item.courier, item.order) for item in assignments] == [(0, 1), (1, 0), (2, 2)]
+    assert sum(item.cost for item in assignments) == 5.0
+
+
+def test_assign_optimal_matches_brute_force():
+    cost = haversine_matrix(random_points(6, seed=1), random_points(6, seed=2))
+    best = min(
+        sum(cost[row, col] for row, col in enumerate(cols)) for cols in permutations(range(6))
+    )
+
+    assignments = assign(cost, Solver.OPTIMAL)
+
+    assert sum(item.cost for item in assignments) == pytest.approx(best)
+
+
+@pytest.mark.parametrize("solver", list(Solver))
+@pytest.mark.parametrize(("couriers", "orders"), [(50, 200), (200, 50)])
+def test_assign_rectangular(solver: Solver, couriers: int, orders: int):
+    cost = haversine_matrix(random_points(couriers, seed=1), random_points(orders, seed=2))
+    optimal = sum(item.cost for item in assign(cost, Solver.OPTIMAL))
+
+    assignments = assign(cost, solver)
+
+    assert len(assignments) == min(couriers, orders)
+    assert len({item.courier for item in assignments}) == len(assignments)
+    assert len({item.order for item in assignments}) == len(assignments)
+    assert sum(item.cost for item in assignments) <= optimal * 1.1
+
+
+@pytest.mark.parametrize("solver", list(Solver))
+def test_assign_skips_unreachable_pairs(solver: Solver):
+    cost = np.array([[1.0, np.nan, 3.0], [np.inf, np.inf, np.inf], [np.nan, 2.0, np.inf]])
+
+    assignments = assign(cost, solver)
+
+    assert [(item.courier, item.order) for item in assignments] == [(0, 0), (2, 1)]
+
+
+@pytest.mark.parametrize("solver", list(Solver))
+def test_assign_nothing_reachable(solver: Solver):
+    assert assign(np.full((2, 2), np.inf), solver) == []
+    assert assign(np.empty((0, 3)), solver) == []
@@ -0,0 +1,165 @@
+import asyncio
+import json
+from collections.abc import Callable
+
+import pytest
+
+from app.feed.hub import ORDER_EVENTS_CHANNEL, OrderFeedHub
+
+
+class FakeConnection:
+    def __init__(self, listening: asyncio.Event) -> None:
+        self.listening = listening
+        self.listeners: dict[str, Callable] = {}
+        self.termination_listeners: list[Callable] = []
+        self.closed = False
+        self.closed_event = asyncio.Event()
+
+    def add_termination_listener(self, callback: Callable) -> None:
+        self.termination_listeners.append(callback)
+
+    async def add_listener(self, channel: str, callback: Callable) -> None:
+        self.listeners[channel] = callback
+        self.listening.set()
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def close(self) -> None:
+        self.closed = True
+        self.closed_event.set()
+        # Like asyncpg, termination listeners are called for closed connections too
+        for callback in self.termination_listeners:
+            callback(self)
+
+    def notify(self, event: dict) -> None:
+        self.listeners[ORDER_EVENTS_CHANNEL](self, 1, ORDER_EVENTS_CHANNEL, json.dumps(event))
+
+    def notify_created(self, *order_ids: int) -> None:
+        """Notify as the trigger does for one statement."""
+        self.notify({"type": "created", "orders": [{"id": order_id} for order_id in order_ids]})
+
+    async def wait_closed(self) -> None:
+        async with asyncio.timeout(1):
+            await self.closed_event.wait()
+
+    def terminate(self) -> None:
+        self.closed = True
+        for callback in self.termination_listeners:
+            callback(self)
+
+
+class FakeServer:
+    def __init__(self) -> None:
+        self.connections: list[FakeConnection] = []
+        self.listening = asyncio.Event()
+
+    async def connect(self) -> FakeConnection:
+        self.connections.append(FakeConnection(self.listening))
+        return self.connections[-1]
+
+    async def wait_connection(self, count: int = 1) -> FakeConnection:
+        """Wait until `count` connections have been listening, return the last one."""
+        while len([connection for connection in self.connections if connection.listeners]) < count:
+            self.listening.clear()
+            await self.listening.wait()
+        return self.connections[-1]
+
+
+def created(order_id: int) -> dict:
+    return {"type": "created", "order": {"id": order_id}}
+
+
+@pytest.mark.anyio
+async def test_events_are_fanned_out():
+    server = FakeServer()
+    hub = OrderFeedHub(server.connect, queue_size=10)
+
+    async with hub.subscribe() as first, hub.subscribe() as second:
+        connection = await server.wait_connection()
+        connection.notify_created(1)
+        assert await first.get() == created(1)
+        assert await second.get() == created(1)
+        # Orders of one statement are published one by one
+        connection.notify_created(2, 3)
+        assert [await first.get(), await first.get()] == [created(2), created(3)]
+
+    metrics = hub.metrics()
+    assert (metrics["subscribers"], metrics["events"]) == (0, 3)
+    # One listening connection is shared by all subscribers
+    assert len(server.connections) == 1
+    await hub.close()
+    assert connection.closed
+
+
+@pytest.mark.anyio
+async def test_connection_is_closed_without_subscribers():
+    server = FakeServer()
+    hub = OrderFeedHub(server.connect, queue_size=10)
+
+    async with hub.subscribe():
+        connection = await server.wait_connection()
+    await connection.wait_closed()
+    assert not hub.metrics()["connected"]
+
+    # The next subscriber opens a new connection, nothing was missed while nobody listened
+    async with hub.subscribe() as subscription:
+        connection = await server.wait_connection(count=2)
+        connection.notify_created(1)
+        assert await subscription.get() == created(1)
+        assert hub.metrics()["reconnects"] == 0
+    await hub.close()
+    assert connection.closed
+
+
+@pytest.mark.anyio
+async def test_slow_subscriber_is_dropped():
+    server = FakeServer()
+    hub = OrderFeedHub(server.connect, queue_size=2)
+
+    async with hub.subscribe() as slow, hub.subscribe() as fast:
+        connection = await server.wait_connection()
+        for order_id in range(3):
+            connection.notify_created(order_id)
+            assert await fast.get() == created(order_id)
+
+        assert slow.dropped.is_set()
+        assert not fast.dropped.is_set()
+        assert hub.metrics()["dropped"] == 1
+        assert hub.metrics()["subscribers"] == 1
+    await hub.close()
+
+
+@pytest.mark.anyio
+async def test_reconnect_after_connection_loss():
+    server = FakeServer()
+    hub = OrderFeedHub(server.connect, queue_size=10, reconnect_delay=0)
+
+    async with hub.subscribe() as subscription:
+        connection = await server.wait_connection()
+        connection.terminate()
+        connection = await server.wait_connection(count=2)
+
+        assert await subscription.get() == {"type": "resync"}
+        connection.notify_created(1)
+        assert await subscription.get() == created(1)
+        assert hub.metrics()["reconnects"] == 1
+    await hub.close()
+
+
+@pytest.mark.anyio
+async def test_resubscribe_right_after_the_last_subscriber_left():
+    server = FakeServer()
+    hub = OrderFeedHub(server.connect, queue_size=10, reconnect_delay=0)
+
+    async with hub.subscribe():
+        first = await server.wait_connection()
+    async with hub.subscribe() as subscription:
+        # The previous listener closed its connection before the new one was opened
+        assert first.closed
+        second = await server.wait_connection(count=2)
+        second.notify_created(1)
+        assert await subscription.get() == created(1)
+        assert not second.closed
+        assert hub.metrics()["reconnects"] == 0
+    await hub.close()
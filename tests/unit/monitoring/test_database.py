@@ -0,0 +1,44 @@
+from collections.abc import AsyncIterator
+
+import pytest
+
+from app.monitoring.database import UNKNOWN_OPERATION, current_operation, track_operation
+from app.uow.repository import SqlAlchemyRepository
+
+
+@pytest.mark.anyio
+async def test_track_operation():
+    @track_operation("Repository.get")
+    async def get() -> str:
+        return current_operation.get()
+
+    assert await get() == "Repository.get"
+    assert current_operation.get() == UNKNOWN_OPERATION
+
+
+@pytest.mark.anyio
+async def test_track_operation_of_async_generator():
+    @track_operation("Repository.stream")
+    async def stream() -> AsyncIterator[str]:
+        for _ in range(2):
+            yield current_operation.get()
+
+    async for operation in stream():
+        assert operation == "Repository.stream"
+        # The caller handles items outside of the operation
+        assert current_operation.get() == UNKNOWN_OPERATION
+
+
+@pytest.mark.anyio
+async def test_repository_methods_are_tracked():
+    class ItemRepository(SqlAlchemyRepository):
+        async def get(self) -> str:
+            return current_operation.get()
+
+        async def _get(self) -> str:
+            return current_operation.get()
+
+    repository = ItemRepository(session=None)  # type: ignore[arg-type]
+    assert await repository.get() == "ItemRepository.get"
+    # Private methods are labeled by the public method that calls them
+    assert await repository._get() == UNKNOWN_OPERATION
@@ -0,0 +1,32 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+OBSERVE = """
+from app.monitoring.metrics import REQUEST_DURATION
+REQUEST_DURATION.labels("GET", "/api/v1/orders", "200").observe(0.02)
+"""
+RENDER = """
+from app.monitoring.metrics import render
+print(render()[0].decode())
+"""
+
+
+def run(code: str, multiproc_dir: Path) -> str:
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(multiproc_dir)}
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+    )
+    return result.stdout
+
+
+def test_metrics_are_aggregated_across_workers(tmp_path: Path):
+    # Two workers observe a request each, a third one serves /metrics
+    run(OBSERVE, tmp_path)
+    run(OBSERVE, tmp_path)
+    metrics = run(RENDER, tmp_path)
+
+    labels = 'method="GET",route="/api/v1/orders",status="200"'
+    assert f"http_request_duration_seconds_count{{{labels}}} 2.0" in metrics
+    assert f'http_request_duration_seconds_bucket{{le="0.025",{labels}}} 2.0' in metrics
@@ -0,0 +1,32 @@
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from prometheus_client import REGISTRY
+
+from app.monitoring.middleware import UNMATCHED_ROUTE, PrometheusMiddleware
+
+
+def request_count(route: str, status: str) -> float:
+    labels = {"method": "GET", "route": route, "status": status}
+    return REGISTRY.get_sample_value("http_request_duration_seconds_count", labels) or 0.0
+
+
+@pytest.mark.anyio
+async def test_requests_are_observed_by_route_template():
+    app = FastAPI()
+    app.add_middleware(PrometheusMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int) -> dict:
+        return {"id": item_id}
+
+    before = request_count("/items/{item_id}", "200")
+    before_unmatched = request_count(UNMATCHED_ROUTE, "404")
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        assert (await client.get("/items/1")).status_code == 200
+        assert (await client.get("/items/2")).status_code == 200
+        assert (await client.get("/unknown")).status_code == 404
+
+    assert request_count("/items/{item_id}", "200") == before + 2
+    # Paths of unmatched requests don't become labels
+    assert request_count(UNMATCHED_ROUTE, "404") == before_unmatched + 1
@@ -0,0 +1,127 @@
+import json
+import pstats
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.domain.enums import ProfileFormat
+from app.monitoring.middleware import ProfilingMiddleware
+from app.monitoring.profiling import PROFILE_HEADER, RequestProfiler
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def headers(token: str) -> list[tuple[bytes, bytes]]:
+    return [(b"host", b"test"), (PROFILE_HEADER.lower().encode(), token.encode())]
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def profiler(tmp_path: Path, clock: FakeClock) -> RequestProfiler:
+    return RequestProfiler(
+        directory=tmp_path,
+        secret="secret",
+        interval=0.001,
+        max_per_minute=2,
+        max_profiles=2,
+        clock=clock,
+    )
+
+
+def test_token(profiler: RequestProfiler, clock: FakeClock):
+    token, expires = profiler.issue_token(ttl=60)
+    assert expires == clock.now + 60
+    assert profiler.select(headers(token)) == "token"
+
+    assert profiler.select(headers(token.replace(".", ".0"))) is None
+    assert profiler.select(headers(f"{expires + 60}.{token.partition('.')[2]}")) is None
+    clock.now += 60
+    assert profiler.select(headers(token)) is None
+    assert profiler.invalid_tokens == 3
+
+
+def test_sampling(profiler: RequestProfiler, clock: FakeClock):
+    assert profiler.select([]) is None
+
+    profiler.enable_sampling(rate=1.0, duration=10)
+    assert profiler.sampling() == {"sample_rate": 1.0, "until": clock.now + 10}
+    assert profiler.select([]) == "sampling"
+
+    clock.now += 10
+    assert profiler.select([]) is None
+    assert profiler.sampling() == {"sample_rate": 0.0, "until": None}
+
+
+def test_rate_limit(profiler: RequestProfiler, clock: FakeClock):
+    token, _ = profiler.issue_token(ttl=600)
+    profiler.enable_sampling(rate=1.0, duration=600)
+    assert profiler.select(headers(token)) == "token"
+    assert profiler.select([]) == "sampling"
+    assert profiler.select([]) is None
+    assert profiler.rate_limited == 1
+
+    clock.now += 60
+    assert profiler.select([]) == "sampling"
+
+
+def busy() -> int:
+    return sum(i * i for i in range(200_000))
+
+
+@pytest.mark.anyio
+async def test_middleware(profiler: RequestProfiler, tmp_path: Path):
+    app = FastAPI()
+    app.add_middleware(ProfilingMiddleware, profiler=profiler)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int) -> dict:
+        return {"id": item_id, "total": busy()}
+
+    token, _ = profiler.issue_token(ttl=60)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        assert (await client.get("/items/1")).status_code == 200
+        assert profiler.list_profiles() == []
+
+        response = await client.get("/items/2", headers={PROFILE_HEADER: token})
+        assert response.status_code == 200
+
+    [profile] = profiler.list_profiles()
+    assert profile["path"] == "/items/2"
+    assert profile["route"] == "/items/{item_id}"
+    assert profile["status"] == 200
+    assert profile["reason"] == "token"
+    assert profile["samples"] > 0
+
+    speedscope = json.loads(profiler.render(profile["id"], ProfileFormat.SPEEDSCOPE) or b"")
+    frames = [frame["name"] for frame in speedscope["shared"]["frames"]]
+    assert "busy" in frames
+    pstats_file = tmp_path / "profile.pstats"
+    pstats_file.write_bytes(profiler.render(profile["id"], ProfileFormat.PSTATS) or b"")
+    stats = pstats.Stats(str(pstats_file)).stats  # type: ignore[attr-defined]
+    assert any(function == "busy" for _, _, function in stats)
+
+    assert profiler.render("0-00000000", ProfileFormat.SPEEDSCOPE) is None
+
+
+def test_old_profiles_are_deleted(profiler: RequestProfiler, clock: FakeClock, tmp_path: Path):
+    for _ in range(3):
+        session = profiler.start(description="GET /").stop()
+        session.start_time = clock.now
+        profiler.save(session, details={})
+        clock.now += 1
+
+    profiles = profiler.list_profiles()
+    assert [profile["started_at"] for profile in profiles] == [clock.now - 1, clock.now - 2]
+    assert len(list(tmp_path.iterdir())) == 4
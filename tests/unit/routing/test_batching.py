@@ -0,0 +1,118 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.routing.batching import RouteBatcher
+from app.routing.osrm import OsrmClient
+from app.routing.types import Point, RoutingError
+from tests.fake_osrm import FakeOsrmServer
+
+KYIV = Point(lat=50.4501, lng=30.5234)
+LVIV = Point(lat=49.8397, lng=24.0297)
+ODESA = Point(lat=46.4825, lng=30.7233)
+DNIPRO = Point(lat=48.4647, lng=35.0462)
+
+
+@pytest.fixture
+def osrm_server() -> FakeOsrmServer:
+    return FakeOsrmServer(latency=0.01)
+
+
+@pytest.fixture
+def osrm_client(osrm_server: FakeOsrmServer) -> OsrmClient:
+    http_client = httpx.AsyncClient(transport=osrm_server.transport(), base_url="http://osrm")
+    return OsrmClient(http_client, retries=0)
+
+
+@pytest.mark.anyio
+async def test_identical_lookups_share_one_request(
+    osrm_server: FakeOsrmServer, osrm_client: OsrmClient
+):
+    batcher = RouteBatcher(osrm_client, window=0.005, max_batch_size=50)
+
+    routes = await asyncio.gather(*(batcher.route(KYIV, LVIV) for _ in range(10)))
+
+    assert osrm_server.requests == 1
+    assert routes == [await osrm_client.route(KYIV, LVIV)] * 10
+    metrics = batcher.metrics()
+    assert metrics["lookups"] == 10
+    assert metrics["coalesced"] == 9
+    assert metrics["osrm_calls"] == 1
+    assert metrics["osrm_calls_saved"] == 9
+    assert metrics["time_saved_seconds"] > 0
+
+
+@pytest.mark.anyio
+async def test_lookups_sharing_a_point_are_sent_as_one_table(
+    osrm_server: FakeOsrmServer, osrm_client: OsrmClient
+):
+    batcher = RouteBatcher(osrm_client, window=0.005, max_batch_size=50)
+    pairs = [(KYIV, LVIV), (KYIV, ODESA), (LVIV, DNIPRO), (ODESA, DNIPRO)]
+
+    routes = await asyncio.gather(*(batcher.route(*pair) for pair in pairs))
+
+    # One table from Kyiv and one table to Dnipro, no routes nobody asked for
+    assert osrm_server.requests == 2
+    assert osrm_server.table_cells == len(pairs)
+    for pair, route in zip(pairs, routes, strict=True):
+        expected = await osrm_client.route(*pair)
+        assert route.distance_km == pytest.approx(expected.distance_km)
+        assert route.duration_minutes == pytest.approx(expected.duration_minutes)
+    assert batcher.metrics()["batch_size"]["buckets"]["5"] == 1
+    assert batcher.metrics()["osrm_calls"] == 2
+
+
+@pytest.mark.anyio
+async def test_unrelated_lookups_are_sent_as_routes(
+    osrm_server: FakeOsrmServer, osrm_client: OsrmClient
+):
+    batcher = RouteBatcher(osrm_client, window=0.005, max_batch_size=50)
+    pairs = [(KYIV, LVIV), (LVIV, ODESA), (ODESA, KYIV)]
+
+    await asyncio.gather(*(batcher.route(*pair) for pair in pairs))
+
+    assert osrm_server.requests == len(pairs)
+    assert osrm_server.table_cells == 0
+
+
+@pytest.mark.anyio
+async def test_full_batch_is_sent_without_waiting(
+    osrm_server: FakeOsrmServer, osrm_client: OsrmClient
+):
+    # The window is never reached: batches are sent once they have 2 pairs
+    batcher = RouteBatcher(osrm_client, window=60, max_batch_size=2)
+    pairs = [(KYIV, LVIV), (KYIV, ODESA), (LVIV, ODESA), (LVIV, KYIV)]
+
+    await asyncio.wait_for(asyncio.gather(*(batcher.route(*pair) for pair in pairs)), timeout=5)
+
+    assert osrm_server.requests == 2
+
+
+@pytest.mark.anyio
+async def test_error_is_fanned_out(osrm_server: FakeOsrmServer, osrm_client: OsrmClient):
+    osrm_server.fail_next = 1
+    batcher = RouteBatcher(osrm_client, window=0.005, max_batch_size=50)
+
+    results = await asyncio.gather(
+        batcher.route(KYIV, LVIV), batcher.route(KYIV, ODESA), return_exceptions=True
+    )
+
+    assert all(isinstance(result, RoutingError) for result in results)
+    # Failed lookups are not kept
+    assert await batcher.route(KYIV, LVIV)
+
+
+@pytest.mark.anyio
+async def test_cancelled_batch_releases_lookups(osrm_client: OsrmClient):
+    batcher = RouteBatcher(osrm_client, window=0, max_batch_size=1)
+    lookup = asyncio.create_task(batcher.route(KYIV, LVIV))
+    await asyncio.sleep(0.001)  # the batch is in flight
+    [send] = batcher._tasks
+    send.cancel()
+
+    with pytest.raises(RoutingError):
+        await asyncio.wait_for(lookup, timeout=5)
+    # The next identical lookup doesn't join the cancelled one
+    assert batcher._futures == {}
+    assert await asyncio.wait_for(batcher.route(KYIV, LVIV), timeout=5)
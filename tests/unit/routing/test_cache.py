@@ -0,0 +1,168 @@
+import time
+
+import pytest
+
+from app.routing.cache import CachedRouteProvider, RouteCache, RouteCachePurger, quantize
+from app.routing.types import Point, Route, RouteKey
+
+KYIV = Point(lat=50.450112, lng=30.523398)
+LVIV = Point(lat=49.839683, lng=24.029717)
+
+
+class CountingProvider:
+    def __init__(self) -> None:
+        self.calls: list[tuple[Point, Point]] = []
+
+    async def route(self, start: Point, end: Point) -> Route:
+        self.calls.append((start, end))
+        return Route(distance_km=540.0, duration_minutes=420.0)
+
+
+class InMemoryRepository:
+    """Stands in for the Postgres level."""
+
+    def __init__(self) -> None:
+        self.routes: dict[tuple[str, RouteKey], tuple[Route, float]] = {}
+        self.expires_at: dict[tuple[str, RouteKey], float] = {}
+
+    async def get(self, version: str, key: RouteKey) -> tuple[Route, float] | None:
+        return self.routes.get((version, key))
+
+    async def save(self, version: str, key: RouteKey, route: Route, ttl: float) -> None:
+        self.routes[version, key] = (route, ttl)
+        self.expires_at[version, key] = time.time() + ttl
+
+    async def purge(self) -> int:
+        expired = [key for key, expires_at in self.expires_at.items() if expires_at <= time.time()]
+        for key in expired:
+            del self.routes[key], self.expires_at[key]
+        return len(expired)
+
+
+class FakeUnitOfWork:
+    def __init__(self, route_cache: InMemoryRepository) -> None:
+        self.route_cache = route_cache
+        self.commits = 0
+
+    async def __aenter__(self) -> "FakeUnitOfWork":
+        """Repositories are ready right away."""
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        """Nothing to close."""
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+def build_provider(
+    provider: CountingProvider,
+    cache: RouteCache,
+    repository: InMemoryRepository,
+    version: str = "v1",
+    ttl: float = 60,
+) -> CachedRouteProvider:
+    return CachedRouteProvider(
+        provider,
+        cache=cache,
+        repository=repository,  # type: ignore[arg-type]
+        version=version,
+        precision=4,
+        ttl=ttl,
+    )
+
+
+def test_quantize():
+    assert quantize(KYIV, precision=4) == Point(lat=50.4501, lng=30.5234)
+    assert quantize(KYIV, precision=2) == Point(lat=50.45, lng=30.52)
+
+
+@pytest.mark.anyio
+async def test_memory_level():
+    provider, cache, repository = CountingProvider(), RouteCache(max_size=10), InMemoryRepository()
+    cached_provider = build_provider(provider, cache, repository)
+
+    first = await cached_provider.route(KYIV, LVIV)
+    # Nearby points share the quantized key
+    second = await cached_provider.route(Point(lat=50.45012, lng=30.52341), LVIV)
+
+    assert first == second == Route(distance_km=540.0, duration_minutes=420.0)
+    assert provider.calls == [(quantize(KYIV, 4), quantize(LVIV, 4))]
+    assert len(repository.routes) == 1
+    assert cache.metrics() == {
+        "memory": {"size": 1, "max_size": 10, "hits": 1, "misses": 1},
+        "db_hits": 0,
+        "db_misses": 1,
+        "db_purged": 0,
+        "hit_rate": 0.5,
+    }
+
+
+@pytest.mark.anyio
+async def test_db_level_is_shared_between_workers():
+    provider, repository = CountingProvider(), InMemoryRepository()
+    await build_provider(provider, RouteCache(max_size=10), repository).route(KYIV, LVIV)
+
+    # Another worker has its own memory level, but the same Postgres table
+    other_cache = RouteCache(max_size=10)
+    await build_provider(provider, other_cache, repository).route(KYIV, LVIV)
+    await build_provider(provider, other_cache, repository).route(KYIV, LVIV)
+
+    assert len(provider.calls) == 1
+    metrics = other_cache.metrics()
+    assert metrics["db_hits"] == 1
+    assert metrics["memory"]["hits"] == 1
+    assert metrics["hit_rate"] == 1.0
+
+
+@pytest.mark.anyio
+async def test_dataset_version_change_misses():
+    provider, cache, repository = CountingProvider(), RouteCache(max_size=10), InMemoryRepository()
+
+    await build_provider(provider, cache, repository, version="v1").route(KYIV, LVIV)
+    await build_provider(provider, cache, repository, version="v2").route(KYIV, LVIV)
+
+    assert len(provider.calls) == 2
+    assert len(repository.routes) == 2
+
+
+class FailingRepository(InMemoryRepository):
+    async def get(self, version: str, key: RouteKey) -> tuple[Route, float] | None:
+        error = "The disabled cache must not be queried"
+        raise AssertionError(error)
+
+
+@pytest.mark.anyio
+async def test_disabled_cache_is_not_queried():
+    provider, cache, repository = CountingProvider(), RouteCache(max_size=10), FailingRepository()
+    cached_provider = build_provider(provider, cache, repository, ttl=0)
+
+    await cached_provider.route(KYIV, LVIV)
+    await cached_provider.route(KYIV, LVIV)
+
+    # Points are routed as they are, there is no cache key to quantize them for
+    assert provider.calls == [(KYIV, LVIV), (KYIV, LVIV)]
+    assert repository.routes == {}
+    assert cache.metrics()["memory"]["misses"] == 0
+
+
+@pytest.mark.anyio
+async def test_purger_deletes_expired_routes():
+    cache, repository = RouteCache(max_size=10), InMemoryRepository()
+    key = RouteKey(quantize(KYIV, 4), quantize(LVIV, 4))
+    route = Route(distance_km=540.0, duration_minutes=420.0)
+    await repository.save("v1", key, route, ttl=-1)
+    # Routes of other dataset versions are used by workers of a rolling deploy
+    await repository.save("v2", key, route, ttl=60)
+    await repository.save("v3", key, route, ttl=60)
+    uow = FakeUnitOfWork(repository)
+    purger = RouteCachePurger(
+        cache,
+        uow_factory=lambda: uow,  # type: ignore[arg-type, return-value]
+        interval=60,
+    )
+
+    assert await purger.purge() == 1
+    assert list(repository.routes) == [("v2", key), ("v3", key)]
+    assert uow.commits == 1
+    assert cache.metrics()["db_purged"] == 1
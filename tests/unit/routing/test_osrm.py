@@ -0,0 +1,94 @@
+import httpx
+import pytest
+
+from app.routing.osrm import OsrmClient, format_coordinates
+from app.routing.types import Point, RoutingError
+from tests.fake_osrm import FakeOsrmServer
+
+KYIV = Point(lat=50.4501, lng=30.5234)
+LVIV = Point(lat=49.8397, lng=24.0297)
+
+
+@pytest.fixture
+def osrm_server() -> FakeOsrmServer:
+    return FakeOsrmServer(speed_kmh=60)
+
+
+@pytest.fixture
+def osrm_client(osrm_server: FakeOsrmServer) -> OsrmClient:
+    http_client = httpx.AsyncClient(transport=osrm_server.transport(), base_url="http://osrm")
+    return OsrmClient(http_client, retries=2, retry_backoff=0)
+
+
+def test_format_coordinates():
+    assert format_coordinates([KYIV, LVIV]) == "30.523400,50.450100;24.029700,49.839700"
+
+
+@pytest.mark.anyio
+async def test_route(osrm_client: OsrmClient):
+    route = await osrm_client.route(KYIV, LVIV)
+
+    # Straight line between Kyiv and Lviv is ~470 km, 60 km/h
+    assert route.distance_km == pytest.approx(468, abs=5)
+    assert route.duration_minutes == pytest.approx(route.distance_km, rel=1e-6)
+
+
+@pytest.mark.anyio
+async def test_route_retries_unavailable_server(
+    osrm_server: FakeOsrmServer, osrm_client: OsrmClient
+):
+    osrm_server.fail_next = 2
+
+    route = await osrm_client.route(KYIV, LVIV)
+
+    assert route.distance_km > 0
+    assert osrm_server.requests == 3
+
+
+@pytest.mark.anyio
+async def test_route_gives_up_after_retries(osrm_server: FakeOsrmServer, osrm_client: OsrmClient):
+    osrm_server.fail_next = 3
+
+    with pytest.raises(RoutingError, match="HTTP 503"):
+        await osrm_client.route(KYIV, LVIV)
+    assert osrm_server.requests == 3
+
+
+@pytest.mark.anyio
+async def test_route_error_is_not_retried(osrm_server: FakeOsrmServer, osrm_client: OsrmClient):
+    osrm_server.no_route = True
+
+    with pytest.raises(RoutingError, match="NoRoute"):
+        await osrm_client.route(KYIV, LVIV)
+    assert osrm_server.requests == 1
+
+
+@pytest.mark.anyio
+async def test_table_is_split_into_chunks():
+    osrm_server = FakeOsrmServer(speed_kmh=60, max_table_size=3)
+    http_client = httpx.AsyncClient(transport=osrm_server.transport(), base_url="http://osrm")
+    osrm_client = OsrmClient(http_client, max_table_size=3)
+    sources = [Point(lat=50.4 + index / 100, lng=30.5) for index in range(5)]
+    destinations = [Point(lat=50.4, lng=30.5 + index / 100) for index in range(4)]
+
+    matrix = await osrm_client.table(sources, destinations)
+
+    # 5x4 matrix with chunks of 3: sources [3, 2] x destinations [3, 1]
+    assert osrm_server.requests == 4
+    assert matrix.distance_km.shape == matrix.duration_minutes.shape == (5, 4)
+    for row, source in enumerate(sources):
+        for col, destination in enumerate(destinations):
+            route = await osrm_client.route(source, destination)
+            assert matrix.distance_km[row, col] == pytest.approx(route.distance_km)
+            assert matrix.duration_minutes[row, col] == pytest.approx(route.duration_minutes)
+
+
+@pytest.mark.anyio
+async def test_table_too_big_chunk_is_not_retried(osrm_server: FakeOsrmServer):
+    osrm_server.max_table_size = 1
+    http_client = httpx.AsyncClient(transport=osrm_server.transport(), base_url="http://osrm")
+    osrm_client = OsrmClient(http_client, max_table_size=2)
+
+    with pytest.raises(RoutingError, match="TooBig"):
+        await osrm_client.table([KYIV, LVIV], [LVIV, KYIV])
+    assert osrm_server.requests == 1
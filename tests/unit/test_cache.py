@@ -0,0 +1,41 @@
+from app.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_expires_entries():
+    clock = FakeClock()
+    cache: TTLCache[str, int] = TTLCache(max_size=10, ttl=5, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=20)
+
+    assert cache.get("a") == 1
+    clock.now = 10
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.metrics() == {"size": 1, "max_size": 10, "hits": 2, "misses": 1}
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" is the least recently used now
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_disabled():
+    cache: TTLCache[str, int] = TTLCache(max_size=10, ttl=0)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+    assert len(cache) == 0
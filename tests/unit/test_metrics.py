@@ -0,0 +1,28 @@
+import prometheus_client
+from prometheus_client import CollectorRegistry
+
+from app.metrics import Histogram
+
+
+def test_histogram_cumulative_buckets():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 5.0):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["buckets"] == {"0.1": 2, "1.0": 3, "inf": 4}
+    assert snapshot["count"] == 4
+    assert snapshot["sum"] == 5.65
+
+
+def test_histogram_is_exported():
+    registry = CollectorRegistry()
+    exported = prometheus_client.Histogram(
+        "test_duration_seconds", "Test.", buckets=(0.1, 1.0), registry=registry
+    )
+    histogram = Histogram(buckets=(0.1, 1.0), exported=exported)
+    for value in (0.05, 0.5):
+        histogram.observe(value)
+
+    assert registry.get_sample_value("test_duration_seconds_count") == 2
+    assert registry.get_sample_value("test_duration_seconds_bucket", {"le": "0.1"}) == 1
@@ -0,0 +1,211 @@
+import asyncio
+import time
+from datetime import UTC, datetime
+
+import pytest
+
+from app.tracking.positions import Ping, PositionFlusher, PositionStore, merge_latest
+
+
+class FakeCourierPositionRepository:
+    def __init__(self) -> None:
+        self.saved: list[list[Ping]] = []
+        self.recent: list[Ping] = []
+        self.fail = False
+        self.blocked: asyncio.Event | None = None  # saves wait until the event is set
+        self.saving = asyncio.Event()
+
+    async def save_latest(self, pings: list[Ping]) -> None:
+        self.saving.set()
+        if self.blocked is not None:
+            await self.blocked.wait()
+        if self.fail:
+            error = "Connection refused"
+            raise ConnectionError(error)
+        self.saved.append(pings)
+
+    async def get_recent(self, recorded_after: datetime) -> list[Ping]:
+        timestamp = recorded_after.replace(tzinfo=UTC).timestamp()
+        return [ping for ping in self.recent if ping.recorded_at > timestamp]
+
+
+class FakeUnitOfWork:
+    def __init__(self, courier_position: FakeCourierPositionRepository) -> None:
+        self.courier_position = courier_position
+        self.commits = 0
+
+    async def __aenter__(self) -> "FakeUnitOfWork":
+        """Repositories are ready right away."""
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        """Nothing to close."""
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+def test_store_keeps_latest_position():
+    store = PositionStore()
+
+    accepted = store.update(
+        [Ping(1, 50.0, 30.0, 100.0), Ping(1, 50.1, 30.1, 110.0), Ping(1, 49.0, 29.0, 105.0)]
+    )
+
+    assert accepted == 2
+    assert store.get(1) == Ping(1, 50.1, 30.1, 110.0)
+    assert store.get(2) is None
+    assert store.metrics() == {"couriers": 1, "dirty": 1, "shared": 0, "pings": 3, "stale": 1}
+
+
+def test_store_grows():
+    store = PositionStore(capacity=2)
+
+    store.update(Ping(courier_id, 50.0, 30.0, float(courier_id)) for courier_id in range(100))
+
+    assert store.metrics()["couriers"] == 100
+    assert store.get(0) == Ping(0, 50.0, 30.0, 0.0)
+    assert store.get(99) == Ping(99, 50.0, 30.0, 99.0)
+
+
+def test_store_positions_by_age():
+    store = PositionStore()
+    store.update([Ping(1, 50.0, 30.0, 100.0), Ping(2, 51.0, 31.0, 200.0)])
+
+    assert store.positions(max_age=60, now=230.0) == [Ping(2, 51.0, 31.0, 200.0)]
+    assert len(store.positions(max_age=300, now=230.0)) == 2
+
+
+def test_store_take_dirty():
+    store = PositionStore()
+    store.update([Ping(1, 50.0, 30.0, 100.0), Ping(2, 51.0, 31.0, 100.0)])
+
+    assert {ping.courier_id for ping in store.take_dirty()} == {1, 2}
+    assert store.take_dirty() == []
+
+    store.update([Ping(2, 51.5, 31.5, 110.0)])
+    assert store.take_dirty() == [Ping(2, 51.5, 31.5, 110.0)]
+
+    store.mark_dirty([1])
+    assert store.take_dirty() == [Ping(1, 50.0, 30.0, 100.0)]
+
+
+@pytest.mark.anyio
+async def test_flusher_writes_changed_positions():
+    store = PositionStore()
+    repository = FakeCourierPositionRepository()
+    uow = FakeUnitOfWork(repository)
+    flusher = PositionFlusher(store, uow_factory=lambda: uow, interval=60)  # type: ignore[arg-type, return-value]
+    store.update([Ping(1, 50.0, 30.0, 100.0), Ping(2, 51.0, 31.0, 100.0)])
+
+    assert await flusher.flush() == 2
+    assert await flusher.flush() == 0
+    assert len(repository.saved) == 1
+    assert uow.commits == 1
+    assert flusher.metrics()["flushed"] == 2
+
+
+@pytest.mark.anyio
+async def test_flusher_keeps_positions_of_failed_flush():
+    store = PositionStore()
+    repository = FakeCourierPositionRepository()
+    flusher = PositionFlusher(
+        store,
+        uow_factory=lambda: FakeUnitOfWork(repository),  # type: ignore[arg-type, return-value]
+        interval=60,
+    )
+    store.update([Ping(1, 50.0, 30.0, 100.0)])
+    repository.fail = True
+
+    with pytest.raises(ConnectionError):
+        await flusher.flush()
+
+    # A newer ping arrives meanwhile, the next flush writes only it
+    store.update([Ping(1, 50.5, 30.5, 110.0)])
+    repository.fail = False
+    assert await flusher.flush() == 1
+    assert repository.saved == [[Ping(1, 50.5, 30.5, 110.0)]]
+    assert flusher.metrics()["failures"] == 1
+
+
+@pytest.mark.anyio
+async def test_flusher_runs_periodically_and_flushes_on_stop():
+    store = PositionStore()
+    repository = FakeCourierPositionRepository()
+    flusher = PositionFlusher(
+        store,
+        uow_factory=lambda: FakeUnitOfWork(repository),  # type: ignore[arg-type, return-value]
+        interval=0.01,
+    )
+    flusher.start()
+    store.update([Ping(1, 50.0, 30.0, 100.0)])
+    await asyncio.sleep(0.05)
+    assert len(repository.saved) == 1
+
+    store.update([Ping(1, 50.5, 30.5, 110.0)])
+    await flusher.stop()
+    assert repository.saved[-1] == [Ping(1, 50.5, 30.5, 110.0)]
+
+
+@pytest.mark.anyio
+async def test_flusher_stopped_during_flush_keeps_positions():
+    store = PositionStore()
+    repository = FakeCourierPositionRepository()
+    repository.blocked = asyncio.Event()
+    flusher = PositionFlusher(
+        store,
+        uow_factory=lambda: FakeUnitOfWork(repository),  # type: ignore[arg-type, return-value]
+        interval=0,
+    )
+    store.update([Ping(1, 50.0, 30.0, 100.0)])
+    flusher.start()
+    await repository.saving.wait()
+
+    # The periodic flush is cancelled, the final one writes its positions
+    repository.blocked = None
+    await flusher.stop()
+    assert repository.saved == [[Ping(1, 50.0, 30.0, 100.0)]]
+
+
+def test_store_all_positions():
+    store = PositionStore()
+    store.update([Ping(1, 50.5, 30.5, 110.0), Ping(3, 52.0, 32.0, 100.0)])
+    store.share([Ping(1, 50.0, 30.0, 100.0), Ping(2, 51.0, 31.0, 200.0), Ping(4, 53.0, 33.0, 10.0)])
+
+    assert store.all_positions(max_age=150, now=210.0) == [
+        Ping(1, 50.5, 30.5, 110.0),
+        Ping(2, 51.0, 31.0, 200.0),
+        Ping(3, 52.0, 32.0, 100.0),
+    ]
+
+
+@pytest.mark.anyio
+async def test_flusher_shares_positions_of_all_workers():
+    store = PositionStore()
+    repository = FakeCourierPositionRepository()
+    now = time.time()
+    repository.recent = [Ping(2, 51.0, 31.0, now - 10), Ping(3, 52.0, 32.0, now - 120)]
+    flusher = PositionFlusher(
+        store,
+        uow_factory=lambda: FakeUnitOfWork(repository),  # type: ignore[arg-type, return-value]
+        interval=0.01,
+        max_age=60,
+    )
+    store.update([Ping(1, 50.0, 30.0, now)])
+    flusher.start()
+    await asyncio.sleep(0.05)
+    await flusher.stop()
+
+    assert [ping.courier_id for ping in store.all_positions(max_age=60)] == [1, 2]
+    assert store.metrics()["shared"] == 1
+
+
+def test_merge_latest():
+    flushed = [Ping(1, 50.0, 30.0, 100.0), Ping(2, 51.0, 31.0, 200.0)]
+    in_memory = [Ping(2, 51.5, 31.5, 150.0), Ping(3, 52.0, 32.0, 100.0), Ping(1, 50.5, 30.5, 110.0)]
+
+    assert merge_latest(flushed, in_memory) == [
+        Ping(1, 50.5, 30.5, 110.0),
+        Ping(2, 51.0, 31.0, 200.0),
+        Ping(3, 52.0, 32.0, 100.0),
+    ]
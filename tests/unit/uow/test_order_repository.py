@@ -0,0 +1,37 @@
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.domain import Order
+from app.routing.types import Point
+from app.uow.order.repository import UNDEFER_GEOMETRY, radius_in_degrees, within_degrees
+
+
+def compile_sql(query) -> str:
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+def test_geometry_is_deferred():
+    sql = compile_sql(select(Order))
+    assert "orders.description" in sql
+    assert "start_point" not in sql
+    assert "end_point" not in sql
+
+
+def test_undefer_geometry():
+    sql = compile_sql(select(Order).options(*UNDEFER_GEOMETRY))
+    assert "orders.start_point" in sql
+    assert "orders.end_point" in sql
+
+
+def test_radius_in_degrees_at_equator():
+    # A degree of latitude is 110.574 km at the equator
+    assert radius_in_degrees(Point(lat=0.0, lng=0.0), radius_km=50) >= 50 / 110.574
+    assert radius_in_degrees(Point(lat=89.5, lng=0.0), radius_km=100) == 360.0
+
+
+def test_within_degrees_across_antimeridian():
+    sql = compile_sql(select(Order).filter(within_degrees(Point(lat=0.0, lng=179.9), 0.5)))
+    assert "ST_DWithin" in sql
+    assert " OR " in sql
+    sql = compile_sql(select(Order).filter(within_degrees(Point(lat=0.0, lng=30.0), 0.5)))
+    assert " OR " not in sql
@@ -0,0 +1,37 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import TextClause, select
+
+from app.dependencies.caches import get_count_cache
+from app.domain import CountMode, Order
+from app.uow.repository import BaseModelRepository
+
+
+def make_repository(total: int) -> tuple[BaseModelRepository, AsyncMock]:
+    session = AsyncMock()
+    session.execute.return_value = MagicMock(scalar_one=MagicMock(return_value=total))
+    return BaseModelRepository(session, Order), session
+
+
+@pytest.mark.anyio
+async def test_estimated_total_of_table():
+    repository, session = make_repository(total=1_000)
+    assert await repository._get_total(select(Order), count=CountMode.ESTIMATED) == 1_000
+    assert isinstance(session.execute.await_args.args[0], TextClause)
+
+
+@pytest.mark.anyio
+async def test_estimated_total_with_filters_is_counted():
+    """Statistics of the whole table are not the total of filtered rows."""
+    get_count_cache().clear()
+    repository, session = make_repository(total=4)
+    query = select(Order).filter(Order.distance_km <= 30)
+
+    assert await repository._get_total(query, count=CountMode.ESTIMATED) == 4
+    assert await repository._get_total(query, count=CountMode.ESTIMATED) == 4
+    statement = session.execute.await_args.args[0]
+    assert not isinstance(statement, TextClause)
+    assert "count" in str(statement)
+    # The count is cached like with CountMode.CACHED
+    session.execute.assert_awaited_once()
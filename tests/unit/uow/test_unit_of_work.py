@@ -0,0 +1,38 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.db.database import AsyncSQLAlchemy
+from app.uow.unit_of_work import UnitOfWork
+from app.uow.user.repository import UserRepository
+
+
+def make_uow() -> tuple[UnitOfWork, MagicMock]:
+    session_factory = MagicMock(return_value=AsyncMock())
+    db = AsyncSQLAlchemy(session_factory=session_factory, engine=MagicMock())
+    return UnitOfWork(db), session_factory
+
+
+@pytest.mark.anyio
+async def test_session_is_not_created_without_use():
+    uow, session_factory = make_uow()
+    async with uow:
+        await uow.commit()
+        await uow.rollback()
+    session_factory.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_session_is_created_on_first_use():
+    uow, session_factory = make_uow()
+    async with uow:
+        assert uow.order is uow.order
+        assert isinstance(uow.user, UserRepository)
+        session_factory.assert_called_once()
+
+        await uow.release()
+        # Released unit of work keeps working with the same session
+        await uow.execute(MagicMock())
+    session = session_factory.return_value
+    assert session.close.await_count == 2
+    session.execute.assert_awaited_once()